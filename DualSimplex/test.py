@@ -1,193 +1,281 @@
 #!/usr/bin/env python3
 """
 Реализация решения задачи линейного программирования двойственным симплекс-методом.
-Код написан в одном файле и содержит подробные комментарии.
+Код содержит подробные комментарии. Класс Fraction общий для всех решателей
+и находится в пакете acom в корне репозитория.
 """
 
-import math
+import argparse
+import json
+import os
 import sys
+import time
+from dataclasses import dataclass
+from typing import Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
-# =========================
-# Класс Fraction для работы с простыми дробями
-# (взято из файла my_fraction.py с незначительными изменениями)
-# =========================
+from acom.cache import ResultCache, matrix_key, shape_key
+from acom.dense import pivot_in_place
+from acom.factor import BasisFactorization
+from acom.fraction import Fraction
+from acom.lpfile import read_model, to_standard_form
+from acom.matrix_io import parse_matrix, read_matrix, read_sparse_rows
+from acom.output import ChunkedWriter
+from acom.presolve import presolve_tableau
+from acom.sparse import SparseMatrix
+from acom.stats import SolveStats, timed, track_fractions
 
-class Fraction:
-    def __init__(self, numerator=0, denominator=1):
-        if denominator == 0:
-            raise ValueError("Denominator cannot be zero.")
-        self.numerator = int(numerator)
-        self.denominator = int(denominator)
-        self.normalize()
-
-    def normalize(self):
-        """Приводит дробь к нормализованному виду."""
-        if self.numerator == 0:
-            self.denominator = 1
-            return
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для вещественного варианта метода
+    np = None
 
-        common_divisor = math.gcd(abs(self.numerator), abs(self.denominator))
-        self.numerator //= common_divisor
-        self.denominator //= common_divisor
-        # Знаменатель всегда положительный
-        if self.denominator < 0:
-            self.numerator *= -1
-            self.denominator *= -1
-
-    def __add__(self, other):
-        if isinstance(other, Fraction):
-            new_numerator = self.numerator * other.denominator + other.numerator * self.denominator
-            new_denominator = self.denominator * other.denominator
-            return Fraction(new_numerator, new_denominator)
-        elif isinstance(other, int):
-            return self + Fraction(other, 1)
-        else:
-            raise TypeError("Unsupported operand type for +")
-
-    def __sub__(self, other):
-        if isinstance(other, Fraction):
-            new_numerator = self.numerator * other.denominator - other.numerator * self.denominator
-            new_denominator = self.denominator * other.denominator
-            return Fraction(new_numerator, new_denominator)
-        elif isinstance(other, int):
-            return self - Fraction(other, 1)
-        else:
-            raise TypeError("Unsupported operand type for -")
-
-    def __mul__(self, other):
-        if isinstance(other, Fraction):
-            new_numerator = self.numerator * other.numerator
-            new_denominator = self.denominator * other.denominator
-            return Fraction(new_numerator, new_denominator)
-        elif isinstance(other, int):
-            return self * Fraction(other, 1)
-        else:
-            raise TypeError("Unsupported operand type for *")
-
-    def __truediv__(self, other):
-        if isinstance(other, Fraction):
-            if other.numerator == 0:
-                raise ZeroDivisionError("Cannot divide by zero.")
-            new_numerator = self.numerator * other.denominator
-            new_denominator = self.denominator * other.numerator
-            return Fraction(new_numerator, new_denominator)
-        elif isinstance(other, int):
-            if other == 0:
-                raise ZeroDivisionError("Cannot divide by zero.")
-            return self / Fraction(other, 1)
-        else:
-            raise TypeError("Unsupported operand type for /")
-
-    def __eq__(self, other):
-        if isinstance(other, Fraction):
-            return self.numerator == other.numerator and self.denominator == other.denominator
-        elif isinstance(other, int):
-            return self.numerator == other and self.denominator == 1
-        else:
-            return False
-
-    def __lt__(self, other):
-        if isinstance(other, Fraction):
-            return self.numerator * other.denominator < other.numerator * self.denominator
-        elif isinstance(other, int):
-            return self.numerator < other * self.denominator
-        else:
-            raise TypeError("Unsupported operand type for <")
 
-    def __gt__(self, other):
-        if isinstance(other, Fraction):
-            return self.numerator * other.denominator > other.numerator * self.denominator
-        elif isinstance(other, int):
-            return self.numerator > other * self.denominator
-        else:
-            raise TypeError("Unsupported operand type for >")
+class InfeasibleError(Exception):
+    """Задача не имеет допустимых решений (в опорной строке нет отрицательных элементов)."""
 
-    def __le__(self, other):
-        return self < other or self == other
 
-    def __ge__(self, other):
-        return self > other or self == other
+class IterationLimitError(Exception):
+    """Исчерпан предел числа итераций; таблица остаётся в последнем базисе."""
 
-    def __abs__(self):
-        return Fraction(abs(self.numerator), abs(self.denominator))
 
-    def __str__(self):
-        if self.denominator == 1:
-            return f"{self.numerator}"
-        return f"{self.numerator}/{self.denominator}"
+class TimeLimitError(Exception):
+    """Исчерпан предел времени решения; таблица остаётся в последнем базисе."""
 
-    def __repr__(self):
-        return self.__str__()
 
-    def __float__(self):
-        return self.numerator / self.denominator
+class UnboundedError(Exception):
+    """Целевая функция модели не ограничена (активно искусственное ограничение)."""
 
 
 # =========================
 # Функции для работы с симплекс-таблицей
 # =========================
 
+def parse_tableau(lines):
+    """
+    Разбирает строки таблицы: числа разделены пробелами, пустые строки пропускаются.
+    Числа – целые, десятичные или простые дроби p/q; каждое преобразуется в Fraction
+    (acom.matrix_io.parse_matrix).
+    """
+    return parse_matrix(lines)
+
+
 def read_tableau(filename):
     """
     Читает матрицу из файла.
-    Файл должен содержать строки, где числа разделены пробелами.
+    Текстовый файл должен содержать строки, где числа разделены пробелами.
     Первая строка – целевая функция, остальные – ограничения.
+    Файлы .npy и .tri (разреженные тройки) читаются без разбора текста.
     Каждое число преобразуется в Fraction.
     """
-    tableau = []
     try:
-        with open(filename, "r") as f:
-            for line in f:
-                # Игнорируем пустые строки
-                if line.strip() == "":
-                    continue
-                # Разбиваем строку по пробелам и преобразуем в Fraction
-                numbers = line.split()
-                row = [Fraction(int(num)) for num in numbers]
-                tableau.append(row)
+        tableau = read_matrix(filename)
     except Exception as e:
         print("Ошибка чтения файла:", e)
         sys.exit(1)
     return tableau
 
 
+def read_sparse_tableau(filename):
+    """
+    Читает таблицу того же формата, что и read_tableau, сразу в разреженном виде
+    (acom.sparse.SparseMatrix): нулевые элементы не хранятся, а файл .tri
+    читается без создания плотной таблицы.
+    """
+    try:
+        rows, ncols = read_sparse_rows(filename)
+    except Exception as e:
+        print("Ошибка чтения файла:", e)
+        sys.exit(1)
+    return SparseMatrix(rows, ncols)
+
+
+def format_tableau(tableau):
+    """Симплекс-таблица в виде текста: элементы строки через табуляцию."""
+    return "\n".join("\t".join([str(x) for x in row]) for row in tableau)
+
+
 def print_tableau(tableau):
     """
     Выводит симплекс-таблицу в удобном для чтения виде.
     """
-    for row in tableau:
-        print("\t".join(str(x) for x in row))
+    print(format_tableau(tableau))
     print()
 
 
-def pivot(tableau, basic_indices, pivot_row, pivot_col):
+def pivot(tableau, basic_indices, pivot_row, pivot_col, stats=None):
     """
     Выполняет операцию поворота (pivot) в симплекс-таблице.
 
     1. Делим опорную строку на опорный элемент, чтобы он стал равен 1.
     2. Для всех остальных строк вычитаем нужную кратную опорной строке, чтобы в столбце pivot_col получился 0.
     3. Обновляем список базисных переменных: для строки pivot_row базис становится переменная с индексом pivot_col.
-    """
-    m = len(tableau)  # число строк
-    n = len(tableau[0])  # число столбцов
-    pivot_element = tableau[pivot_row][pivot_col]
-    # Делим всю опорную строку на pivot_element
-    tableau[pivot_row] = [elem / pivot_element for elem in tableau[pivot_row]]
 
-    # Для всех других строк обнуляем элемент в столбце pivot_col
-    for i in range(m):
-        if i == pivot_row:
-            continue
-        factor = tableau[i][pivot_col]
-        tableau[i] = [tableau[i][j] - factor * tableau[pivot_row][j] for j in range(n)]
+    Строки изменяются на месте (acom.dense.pivot_in_place): строки с нулём в столбце pivot_col
+    не пересчитываются, вычитание идёт только по ненулевым элементам опорной строки.
+
+    stats (acom.stats.SolveStats) – отметить итерацию и длину числителей и знаменателей.
+    """
+    pivot_in_place(tableau, pivot_row, pivot_col)
     # Обновляем базис: в строке pivot_row теперь базисная переменная имеет индекс pivot_col
     basic_indices[pivot_row - 1] = pivot_col  # строки ограничений начинаются с 1
+    if stats is not None:
+        stats.record(tableau)
     # Возвращаем обновлённую таблицу и список базисных переменных
     return tableau, basic_indices
 
 
-def dual_simplex(tableau, basic_indices):
+# =========================
+# Правила выбора опорной строки (pricing)
+# =========================
+
+class DantzigPricing:
+    """
+    Правило Данцига: строка с наибольшей невязкой (самым отрицательным b),
+    при равенстве – строка с меньшим номером.
+
+    Интерфейс правил выбора:
+      start(tableau, basic_indices) – вызывается перед первой итерацией;
+      choose_row(candidates)        – candidates: список пар (строка, невязка > 0)
+                                      по возрастанию номера строки; возвращает строку;
+      update(tableau, r, q)         – вызывается перед поворотом в (r, q).
+    """
+
+    def start(self, tableau, basic_indices):
+        pass
+
+    def choose_row(self, candidates):
+        best_row, best = candidates[0]
+        for row, infeasibility in candidates[1:]:
+            if infeasibility > best:
+                best_row, best = row, infeasibility
+        return best_row
+
+    def update(self, tableau, r, q):
+        pass
+
+
+class SteepestEdgePricing(DantzigPricing):
+    """
+    Двойственное правило наискорейшего ребра: строка с наибольшим отношением
+    невязка² / w_i, где w_i = ||e_i·B^(-1)||² – квадрат нормы строки обратной матрицы.
+
+    Строки B^(-1) берутся из столбцов identity_columns (столбцы исходного единичного
+    базиса; по умолчанию – базис на момент start). Веса хранятся в float и после
+    каждого поворота обновляются по формуле Форреста-Голдфарба только для строк
+    с ненулевым элементом в опорном столбце.
+    """
+
+    def __init__(self, identity_columns=None):
+        self.identity_columns = identity_columns
+        self.weights = None
+
+    def start(self, tableau, basic_indices):
+        if self.identity_columns is None:
+            self.identity_columns = list(basic_indices)
+        m = len(tableau) - 1
+        self.weights = [1.0] * (m + 1)
+        for i in range(1, m + 1):
+            row = tableau[i]
+            self.weights[i] = max(sum(float(row[c]) ** 2 for c in self.identity_columns), 1e-12)
+
+    def choose_row(self, candidates):
+        best_row = -1
+        best = 0.0
+        for row, infeasibility in candidates:
+            value = float(infeasibility) ** 2 / self.weights[row]
+            if best_row == -1 or value > best:
+                best_row, best = row, value
+        return best_row
+
+    def update(self, tableau, r, q):
+        columns = self.identity_columns
+        pivot_row = tableau[r]
+        rho_r = [float(pivot_row[c]) for c in columns]
+        alpha_r = float(pivot_row[q])
+        w_r = self.weights[r]
+        for i in range(1, len(tableau)):
+            if i == r or not tableau[i][q]:
+                continue
+            ratio = float(tableau[i][q]) / alpha_r
+            tau = sum(float(tableau[i][c]) * x for c, x in zip(columns, rho_r) if x)
+            self.weights[i] = max(self.weights[i] - 2.0 * ratio * tau + ratio * ratio * w_r, 1e-12)
+        self.weights[r] = max(w_r / (alpha_r * alpha_r), 1e-12)
+
+
+class PartialPricing(DantzigPricing):
+    """
+    Частичный выбор: строки просматриваются кусками по segment_size (по умолчанию
+    около четверти строк), начиная с места, где остановился предыдущий выбор.
+    Берётся строка с наибольшей невязкой в первом куске, где есть невязки.
+    """
+
+    def __init__(self, segment_size=None):
+        self.segment_size = segment_size
+        self.position = 1
+        self.rows = 0
+
+    def start(self, tableau, basic_indices):
+        self.rows = len(tableau) - 1
+        if self.segment_size is None:
+            self.segment_size = max(1, self.rows // 4)
+        self.position = 1
+
+    def choose_row(self, candidates):
+        size = self.segment_size
+        segments = -(-self.rows // size)
+        for step in range(segments):
+            start = (self.position - 1 + step * size) % self.rows + 1
+            in_segment = [(row, value) for row, value in candidates
+                          if 0 <= (row - start) % self.rows < size]
+            if in_segment:
+                self.position = (start - 1 + size) % self.rows + 1
+                return DantzigPricing.choose_row(self, in_segment)
+        return DantzigPricing.choose_row(self, candidates)
+
+
+class BlandPricing(DantzigPricing):
+    """
+    Правило Бленда для двойственного метода: из строк с невязкой берётся строка,
+    базисная переменная которой имеет наименьший номер. Вместе с выбором столбца
+    с наименьшим номером среди равных отношений исключает зацикливание.
+    """
+
+    def start(self, tableau, basic_indices):
+        self.basic_indices = basic_indices
+
+    def choose_row(self, candidates):
+        return min(candidates, key=lambda item: self.basic_indices[item[0] - 1])[0]
+
+
+PRICING_RULES = {
+    "bland": BlandPricing,
+    "dantzig": DantzigPricing,
+    "steepest": SteepestEdgePricing,
+    "partial": PartialPricing,
+}
+
+
+def _ratio_less(d1, a1, d2, a2):
+    """
+    Сравнивает d1/|a1| < d2/|a2| для дробей через целые числители и знаменатели,
+    не создавая новых объектов Fraction.
+    """
+    return (d1.numerator * a1.denominator * d2.denominator * abs(a2.numerator)
+            < d2.numerator * a2.denominator * d1.denominator * abs(a1.numerator))
+
+
+def _check_limits(iteration, started, max_iterations, time_limit):
+    """Бросает IterationLimitError или TimeLimitError, если предел поворотов или времени исчерпан."""
+    if max_iterations is not None and iteration >= max_iterations:
+        raise IterationLimitError(f"Достигнут предел числа итераций ({max_iterations}).")
+    if time_limit is not None and time.monotonic() - started > time_limit:
+        raise TimeLimitError(f"Достигнут предел времени ({time_limit} с).")
+
+
+def dual_simplex(tableau, basic_indices, pricing=None, max_iterations=None, time_limit=None,
+                 stall_limit=50, on_pivot=None, stats=None):
     """
     Реализация двойственного симплекс-метода.
 
@@ -198,59 +286,561 @@ def dual_simplex(tableau, basic_indices):
 
     Алгоритм:
       Пока существует строка ограничения (i > 0) с отрицательным правым членом:
-        1. Выбираем строку r с самым отрицательным правым членом.
+        1. Выбираем строку r по правилу pricing (по умолчанию DantzigPricing –
+           строка с самым отрицательным правым членом).
         2. Для каждого столбца j, такого что a[r][j] < 0, вычисляем ratio = c[j] / (-a[r][j]),
            где c[j] – коэффициент из строки целевой функции.
         3. Если ни для одного j найти подходящий не удалось, задача не имеет допустимых решений.
         4. Иначе, выбираем столбец с минимальным ratio и выполняем операцию pivot.
       По завершении алгоритма – оптимальное решение.
+
+    Ограничения и вырожденность:
+      max_iterations – предел числа поворотов (IterationLimitError);
+      time_limit     – предел времени в секундах (TimeLimitError);
+      stall_limit    – если значение целевой функции не меняется столько поворотов подряд
+                       (вырожденные шаги), выбор строки переключается на правило Бленда
+                       (BlandPricing) до конца решения, что исключает зацикливание.
+                       None отключает переключение.
+
+    on_pivot(iteration, r, entering, leaving, tableau) вызывается после каждого поворота
+    (журнал итераций, трассировка); по умолчанию ничего не выводится.
+
+    stats (acom.stats.SolveStats) – собрать статистику: повороты, рост дробей по итерациям,
+    число созданных дробей и время этапа "solve". Без stats лишней работы нет.
     """
+    with timed(stats, "solve"), track_fractions(stats):
+        return _dual_simplex(tableau, basic_indices, pricing, max_iterations, time_limit,
+                             stall_limit, on_pivot, stats)
+
+
+def _dual_simplex(tableau, basic_indices, pricing, max_iterations, time_limit, stall_limit, on_pivot,
+                  stats):
     m = len(tableau) - 1  # число ограничений
     n = len(tableau[0]) - 1  # число переменных
     iteration = 0
+    if pricing is None:
+        pricing = DantzigPricing()
+    pricing.start(tableau, basic_indices)
+    started = time.monotonic()
+    stalled = 0
+    last_objective = tableau[0][-1]
+
+    while True:
+        # Ищем строки с b < 0 среди ограничений (строки с индексами 1..m)
+        candidates = [(i, -tableau[i][-1]) for i in range(1, m + 1) if tableau[i][-1] < 0]
+        # Если нет строки с отрицательным правым членом — решение прямодопустимо
+        if not candidates:
+            break
+        _check_limits(iteration, started, max_iterations, time_limit)
+        iteration += 1
+        r = pricing.choose_row(candidates)
+
+        # Выбираем входящий столбец
+        pivot_col = -1
+        objective = tableau[0]
+        row = tableau[r]
+        # Перебираем все столбцы (0..n-1)
+        for j in range(n):
+            # Рассматриваем только те j, для которых коэффициент в строке r отрицателен;
+            # отношения c[j] / (-a[r][j]) сравниваются без создания новых дробей
+            if row[j] < 0:
+                if pivot_col == -1 or _ratio_less(objective[j], row[j], objective[pivot_col], row[pivot_col]):
+                    pivot_col = j
+
+        # Если ни для одного столбца не найдено a[r][j] < 0, то задача не имеет допустимых решений
+        if pivot_col == -1:
+            raise InfeasibleError("Задача не имеет допустимых решений (двойственная неразрешимость).")
+
+        pricing.update(tableau, r, pivot_col)
+        leaving = basic_indices[r - 1]
+        pivot(tableau, basic_indices, r, pivot_col, stats)
+        if on_pivot is not None:
+            on_pivot(iteration, r, pivot_col, leaving, tableau)
+
+        # Вырожденные повороты подряд: переключаемся на правило Бленда
+        if stall_limit is not None:
+            if tableau[0][-1] == last_objective:
+                stalled += 1
+                if stalled >= stall_limit and not isinstance(pricing, BlandPricing):
+                    pricing = BlandPricing()
+                    pricing.start(tableau, basic_indices)
+            else:
+                stalled = 0
+                last_objective = tableau[0][-1]
+
+    return tableau, basic_indices
+
+
+# =========================
+# Переменные с верхними границами и длинный шаг (bound flipping)
+# =========================
+
+def _flip(tableau, col, delta):
+    """Переводит небазисную переменную col на delta (±верхняя граница): b -= delta·a_col."""
+    for row in tableau:
+        if row[col]:
+            row[-1] = row[-1] - delta * row[col]
+
+
+def dual_simplex_bounded(tableau, basic_indices, upper_bounds, pricing=None, bound_flipping=True,
+                         max_iterations=None, time_limit=None, stall_limit=50):
+    """
+    Двойственный симплекс-метод для переменных с границами 0 <= x_j <= upper_bounds[j]
+    (переменные без записи в upper_bounds не ограничены сверху).
+
+    Небазисная переменная находится либо на нижней границе (0), либо на верхней;
+    множество последних at_upper. Столбец свободных членов всегда содержит
+    текущие значения базисных переменных с учётом переменных на верхних границах.
+    Двойственная допустимость: c[j] >= 0 на нижней границе и c[j] <= 0 на верхней;
+    поэтому переменные с c[j] < 0 и конечной границей в начале ставятся на верхнюю.
+
+    Строка выбирается правилом pricing среди строк, где базисная переменная
+    меньше 0 или больше своей верхней границы.
+
+    При bound_flipping=True используется тест отношений с длинным шагом: точки излома
+    перебираются по возрастанию отношения, и пока наклон двойственной целевой функции
+    остаётся положительным, переменные с конечной границей просто переводятся на другую
+    границу (без поворота). Входит в базис переменная, на которой наклон становится
+    неположительным. Так за одну итерацию проходится несколько вырожденных изломов,
+    на которые обычный тест отношений потратил бы отдельные повороты.
+
+    max_iterations, time_limit и stall_limit – как в dual_simplex; после stall_limit
+    вырожденных поворотов подряд строка выбирается правилом Бленда, а длинный шаг
+    отключается (входит первая точка излома, при равных – с меньшим номером).
+
+    Возвращает (tableau, basic_indices, at_upper).
+    """
+    m = len(tableau) - 1
+    n = len(tableau[0]) - 1
+    at_upper = set()
+    # Небазисные переменные с отрицательной оценкой и конечной границей сразу ставим
+    # на верхнюю границу – тогда начальный базис двойственно допустим
+    basic = set(basic_indices)
+    for j in range(n):
+        if j not in basic and tableau[0][j] < 0 and j in upper_bounds:
+            _flip(tableau, j, upper_bounds[j])
+            at_upper.add(j)
+    if pricing is None:
+        pricing = DantzigPricing()
+    pricing.start(tableau, basic_indices)
+    iteration = 0
+    started = time.monotonic()
+    stalled = 0
+    last_objective = tableau[0][-1]
 
     while True:
+        candidates = []
+        for i in range(1, m + 1):
+            value = tableau[i][-1]
+            upper = upper_bounds.get(basic_indices[i - 1])
+            if value < 0:
+                candidates.append((i, -value))
+            elif upper is not None and value > upper:
+                candidates.append((i, value - upper))
+        if not candidates:
+            break
+        _check_limits(iteration, started, max_iterations, time_limit)
         iteration += 1
-        # Ищем строку с b < 0 среди ограничений (строки с индексами 1..m)
+        r = pricing.choose_row(candidates)
+        row = tableau[r]
+        leaving = basic_indices[r - 1]
+        to_upper = row[-1] >= 0  # базисная переменная выше верхней границы
+        slope = row[-1] - upper_bounds[leaving] if to_upper else -row[-1]
+
+        # Точки излома: (отношение |c_j| / |a_rj|, j)
+        objective = tableau[0]
+        basic = set(basic_indices)
+        breakpoints = []
+        for j in range(n):
+            a = row[j]
+            if not a or j in basic:
+                continue
+            direction = -a if to_upper else a
+            if (j in at_upper and direction > 0) or (j not in at_upper and direction < 0):
+                breakpoints.append((abs(objective[j]) / abs(a), j))
+        if not breakpoints:
+            raise InfeasibleError("Задача не имеет допустимых решений (двойственная неразрешимость).")
+        breakpoints.sort()
+
+        flips = []
+        pivot_col = breakpoints[0][1]
+        if bound_flipping:
+            for k, (_, j) in enumerate(breakpoints):
+                pivot_col = j
+                upper = upper_bounds.get(j)
+                if upper is None or k == len(breakpoints) - 1:
+                    break
+                remaining = slope - upper * abs(row[j])
+                if remaining <= 0:
+                    break
+                slope = remaining
+                flips.append(j)
+
+        # Переводим пройденные переменные на противоположную границу
+        for j in flips:
+            if j in at_upper:
+                at_upper.discard(j)
+                _flip(tableau, j, -upper_bounds[j])
+            else:
+                at_upper.add(j)
+                _flip(tableau, j, upper_bounds[j])
+
+        pricing.update(tableau, r, pivot_col)
+        entering_at_upper = pivot_col in at_upper
+        pivot(tableau, basic_indices, r, pivot_col)
+        if entering_at_upper:
+            # Входящая переменная была на верхней границе: её значение в строке r – сдвиг от u
+            at_upper.discard(pivot_col)
+            _flip(tableau, pivot_col, -upper_bounds[pivot_col])
+        if to_upper:
+            # Выходящая переменная остаётся на верхней границе
+            at_upper.add(leaving)
+            _flip(tableau, leaving, upper_bounds[leaving])
+
+        # Вырожденные итерации подряд: правило Бленда и обычный тест отношений
+        if stall_limit is not None:
+            if tableau[0][-1] == last_objective:
+                stalled += 1
+                if stalled >= stall_limit and not isinstance(pricing, BlandPricing):
+                    pricing = BlandPricing()
+                    pricing.start(tableau, basic_indices)
+                    bound_flipping = False
+            else:
+                stalled = 0
+                last_objective = tableau[0][-1]
+
+    return tableau, basic_indices, at_upper
+
+
+def extract_bounded_solution(tableau, basic_indices, at_upper, upper_bounds, total_vars):
+    """То же, что extract_solution, но небазисные переменные из at_upper равны своим верхним границам."""
+    solution, optimum = extract_solution(tableau, basic_indices, total_vars)
+    for j in at_upper:
+        solution[j] = _as_fraction(upper_bounds[j])
+    return solution, optimum
+
+
+# =========================
+# Вещественный (NumPy) вариант с точной проверкой
+# =========================
+
+FLOAT_ITERATION_FACTOR = 10     # предел поворотов вещественного этапа: FLOAT_ITERATION_FACTOR·(m+n)
+
+
+def dual_simplex_float(tableau, basic_indices, tol=1e-9, max_iterations=None, time_limit=None,
+                       stall_limit=50, float_iterations=None):
+    """
+    Двойственный симплекс-метод на массиве float64 с последующей точной проверкой.
+
+    Таблица копируется в массив NumPy, и каждый поворот выполняется одним
+    обновлением ранга 1 (A -= outer(col, row)) вместо построения новых списков дробей.
+    Тест отношений учитывает погрешность tol (двухпроходное правило Харриса):
+    среди столбцов с почти минимальным отношением выбирается столбец с наибольшим |a[r][j]|.
+
+    Найденный базис затем один раз воспроизводится на исходной таблице в дробях
+    (функция rebuild_basis), и из него запускается точный dual_simplex. Если
+    вещественный расчёт был верен, точный метод не делает ни одного поворота;
+    иначе он доводит решение до точного оптимума. Если базис воспроизвести не удалось,
+    задача решается точно с начала.
+
+    Вещественный этап делает не больше float_iterations поворотов (по умолчанию
+    FLOAT_ITERATION_FACTOR·(m+n), но не больше max_iterations): с допуском tol он может
+    зациклиться на вырожденной задаче, и тогда точный этап начинается с достигнутого базиса.
+    max_iterations и stall_limit передаются точному dual_simplex; time_limit действует
+    на оба этапа вместе (TimeLimitError).
+
+    Возвращает (tableau, basic_indices) так же, как dual_simplex.
+    """
+    if np is None:
+        raise RuntimeError("Для вещественного варианта требуется NumPy.")
+
+    m = len(tableau) - 1
+    n = len(tableau[0]) - 1
+    a = np.array([[float(x) for x in row] for row in tableau], dtype=np.float64)
+    basis = list(basic_indices)
+    if float_iterations is None:
+        float_iterations = FLOAT_ITERATION_FACTOR * (m + n)
+        if max_iterations is not None:
+            float_iterations = min(float_iterations, max_iterations)
+    started = time.monotonic()
+
+    for _ in range(float_iterations):
+        if time_limit is not None and time.monotonic() - started > time_limit:
+            raise TimeLimitError(f"Достигнут предел времени ({time_limit} с).")
+        rhs = a[1:, n]
+        r = int(np.argmin(rhs))
+        if rhs[r] >= -tol:
+            break
+        r += 1
+
+        row = a[r, :n]
+        candidates = row < -tol
+        if not candidates.any():
+            # Недопустимость подтверждается точным методом ниже
+            break
+        cost = np.maximum(a[0, :n], 0.0)
+        denom = -row[candidates]
+        # Проход 1: граница отношения с допуском tol
+        bound = np.min((cost[candidates] + tol) / denom)
+        # Проход 2: среди отношений не больше границы берём наибольший |a[r][j]|
+        ratios = np.full(n, np.inf)
+        ratios[candidates] = cost[candidates] / denom
+        eligible = ratios <= bound
+        pivot_col = int(np.argmax(np.where(eligible, -row, -np.inf)))
+
+        # Поворот одним обновлением ранга 1
+        a[r] /= a[r, pivot_col]
+        col = a[:, pivot_col].copy()
+        col[r] = 0.0
+        a -= np.outer(col, a[r])
+        a[:, pivot_col] = 0.0
+        a[r, pivot_col] = 1.0
+        basis[r - 1] = pivot_col
+
+    exact = rebuild_basis(tableau, basic_indices, basis)
+    if exact is None or any(x < 0 for x in exact[0][0][:n]):
+        exact = [row[:] for row in tableau], list(basic_indices)
+    if time_limit is not None:
+        time_limit = max(time_limit - (time.monotonic() - started), 0.0)
+    return dual_simplex(*exact, max_iterations=max_iterations, time_limit=time_limit,
+                        stall_limit=stall_limit)
+
+
+def rebuild_basis(tableau, basic_indices, target_basis):
+    """
+    Точно (в дробях) переводит таблицу из базиса basic_indices в базис target_basis.
+
+    Поворот выполняется только по столбцам, которых ещё нет в базисе; опорная строка –
+    та, которую target_basis отводит этой переменной, а если там ноль – любая строка,
+    чья базисная переменная из target_basis уходит. В конце строки ограничений
+    переставляются в порядке target_basis. Исходная таблица не изменяется.
+    Возвращает (tableau, basic_indices) или None, если базис target_basis вырожден.
+    """
+    work = [row[:] for row in tableau]
+    basis = list(basic_indices)
+    target = set(target_basis)
+    pending = [i for i, j in enumerate(target_basis) if j not in basis]
+
+    while pending:
+        deferred = []
+        for i in pending:
+            j = target_basis[i]
+            if basis[i] not in target and work[i + 1][j] != 0:
+                row = i
+            else:
+                row = next((k for k in range(len(basis))
+                            if basis[k] not in target and work[k + 1][j] != 0), -1)
+            if row == -1:
+                deferred.append(i)
+            else:
+                pivot(work, basis, row + 1, j)
+        if len(deferred) == len(pending):
+            return None
+        pending = deferred
+
+    position = {j: i for i, j in enumerate(basis)}
+    work[1:] = [work[position[j] + 1] for j in target_basis]
+    return work, list(target_basis)
+
+
+# =========================
+# Модифицированный (revised) двойственный симплекс-метод
+# =========================
+
+def revised_dual_simplex(tableau, basic_indices, refactor_every=50, max_iterations=None,
+                         time_limit=None, stall_limit=50):
+    """
+    Двойственный симплекс-метод без пересчёта всей таблицы.
+
+    Вместо обновления всех m·n элементов хранится факторизованная обратная базисная
+    матрица (acom.factor.BasisFactorization: LU-разложение плюс файл эта-матриц).
+    На каждой итерации вычисляются только нужные величины:
+      – правые части x_B и строка оценок d (обновляются поэлементно);
+      – опорная строка alpha_r = (e_r·B^(-1))·A (btran и скалярные произведения
+        с ненулевыми элементами столбцов);
+      – столбец входящей переменной alpha_q = B^(-1)·a_q (ftran).
+    Правила выбора строки и столбца те же, что в dual_simplex, поэтому базис
+    и решение совпадают с табличным методом.
+
+    Через refactor_every поворотов базис раскладывается заново – если начальный
+    базис единичный (каноническая таблица). Иначе используется только файл эта-матриц.
+
+    В конце таблица один раз восстанавливается по итоговому базису (rebuild_basis),
+    и функция возвращает (tableau, basic_indices), как dual_simplex.
+
+    max_iterations, time_limit и stall_limit – как в dual_simplex (после stall_limit
+    вырожденных поворотов подряд строка выбирается по правилу Бленда).
+    При остановке по пределу tableau и basic_indices не изменяются.
+    """
+    m = len(tableau) - 1
+    n = len(tableau[0]) - 1
+    basis = list(basic_indices)
+    iteration = 0
+    started = time.monotonic()
+    stalled = 0
+    bland = False
+
+    # Столбцы матрицы ограничений: только ненулевые элементы
+    columns = [{} for _ in range(n)]
+    for i in range(m):
+        row = tableau[i + 1]
+        for j in range(n):
+            if row[j]:
+                columns[j][i] = row[j]
+    x_b = [tableau[i + 1][n] for i in range(m)]
+    d = tableau[0][:n]
+
+    canonical = all(columns[k] == {i: 1} for i, k in enumerate(basis))
+    factor = BasisFactorization(m, refactor_every=refactor_every if canonical else 0)
+
+    while True:
+        # Выбор строки: самый отрицательный правый член (по правилу Бленда – наименьший номер
+        # базисной переменной)
         r = -1
         min_b = Fraction(0)
-        for i in range(1, m + 1):
-            b_i = tableau[i][-1]
-            if b_i < 0 and (r == -1 or b_i < min_b):
+        for i in range(m):
+            if x_b[i] < 0 and (r == -1 or (basis[i] < basis[r] if bland else x_b[i] < min_b)):
                 r = i
-                min_b = b_i
-        # Если нет строки с отрицательным правым членом — решение прямодопустимо
+                min_b = x_b[i]
         if r == -1:
             break
+        _check_limits(iteration, started, max_iterations, time_limit)
+        iteration += 1
+
+        # Опорная строка: rho = e_r·B^(-1), alpha_rj = rho·a_j
+        e_r = [Fraction(0) for _ in range(m)]
+        e_r[r] = Fraction(1)
+        rho = factor.btran(e_r)
+        rho_nonzero = {i: value for i, value in enumerate(rho) if value}
 
-        # Выбираем входящий столбец
         pivot_col = -1
         min_ratio = None
-        # Перебираем все столбцы (0..n-1)
+        alpha_r = {}
         for j in range(n):
-            # Рассматриваем только те j, для которых коэффициент в строке r отрицателен
-            if tableau[r][j] < 0:
-                # Относительное изменение в целевой функции:
-                # ratio = c[j] / (-a[r][j])
-                ratio = tableau[0][j] / (Fraction(0) - tableau[r][j])
+            column = columns[j]
+            acc = Fraction(0)
+            if len(column) < len(rho_nonzero):
+                for i, value in column.items():
+                    if i in rho_nonzero:
+                        acc = acc + rho_nonzero[i] * value
+            else:
+                for i, value in rho_nonzero.items():
+                    if i in column:
+                        acc = acc + value * column[i]
+            if not acc:
+                continue
+            alpha_r[j] = acc
+            if acc < 0:
+                ratio = d[j] / -acc
                 if pivot_col == -1 or ratio < min_ratio:
                     min_ratio = ratio
                     pivot_col = j
 
-        # Если ни для одного столбца не найдено a[r][j] < 0, то задача не имеет допустимых решений
         if pivot_col == -1:
-            print("Задача не имеет допустимых решений (двойственная неразрешимость).")
-            sys.exit(0)
+            raise InfeasibleError("Задача не имеет допустимых решений (двойственная неразрешимость).")
 
-        # Вывод отладочной информации по итерации
-        # print(f"Iteration {iteration}: pivot on row {r}, column {pivot_col}")
-        pivot(tableau, basic_indices, r, pivot_col)
-        # Можно выводить таблицу после каждого поворота для отладки:
-        # print_tableau(tableau)
+        # Столбец входящей переменной в текущем базисе
+        a_q = [Fraction(0) for _ in range(m)]
+        for i, value in columns[pivot_col].items():
+            a_q[i] = value
+        alpha_q = factor.ftran(a_q)
+        alpha_rq = alpha_r[pivot_col]
+
+        # Обновление правых частей и строки оценок
+        theta_p = x_b[r] / alpha_rq
+        for i in range(m):
+            if i != r and alpha_q[i]:
+                x_b[i] = x_b[i] - theta_p * alpha_q[i]
+        x_b[r] = theta_p
+        theta_d = d[pivot_col] / alpha_rq
+        if theta_d:
+            for j, value in alpha_r.items():
+                d[j] = d[j] - theta_d * value
+            stalled = 0
+        elif stall_limit is not None:
+            # Нулевой двойственный шаг – значение целевой функции не изменилось
+            stalled += 1
+            bland = bland or stalled >= stall_limit
+        d[pivot_col] = Fraction(0)
+
+        basis[r] = pivot_col
+        factor.update(r, alpha_q)
+        if factor.needs_refactor():
+            factor.refactor([columns[k] for k in basis])
 
+    rebuilt = rebuild_basis(tableau, basic_indices, basis)
+    if rebuilt is None:
+        raise RuntimeError("Не удалось восстановить таблицу по итоговому базису.")
+    tableau[:] = rebuilt[0]
+    basic_indices[:] = rebuilt[1]
     return tableau, basic_indices
 
 
+# =========================
+# Разреженный вариант
+# =========================
+
+def sparse_dual_simplex(matrix, basic_indices, max_iterations=None, time_limit=None, stall_limit=50):
+    """
+    Двойственный симплекс-метод на разреженной таблице (acom.sparse.SparseMatrix).
+
+    Правила выбора строки и столбца те же, что в dual_simplex (при равных отношениях
+    берётся столбец с меньшим номером), но тест отношений перебирает только ненулевые
+    элементы строки r, а поворот затрагивает только строки с ненулевым элементом
+    в опорном столбце. Число появившихся ненулей хранится в matrix.fill_in.
+
+    max_iterations, time_limit и stall_limit – как в dual_simplex (после stall_limit
+    вырожденных поворотов подряд строка выбирается по правилу Бленда).
+
+    Возвращает (matrix, basic_indices).
+    """
+    m = matrix.nrows - 1
+    n = matrix.ncols - 1
+    objective = matrix.rows[0]
+    iteration = 0
+    started = time.monotonic()
+    stalled = 0
+    bland = False
+
+    while True:
+        r = -1
+        min_b = Fraction(0)
+        for i in range(1, m + 1):
+            b_i = matrix.get(i, n)
+            if b_i < 0 and (r == -1 or (basic_indices[i - 1] < basic_indices[r - 1] if bland
+                                        else b_i < min_b)):
+                r = i
+                min_b = b_i
+        if r == -1:
+            break
+        _check_limits(iteration, started, max_iterations, time_limit)
+        iteration += 1
+
+        pivot_col = -1
+        min_ratio = None
+        for j, a_rj in matrix.rows[r].items():
+            if j < n and a_rj < 0:
+                ratio = objective.get(j, Fraction(0)) / -a_rj
+                if pivot_col == -1 or ratio < min_ratio or (ratio == min_ratio and j < pivot_col):
+                    min_ratio = ratio
+                    pivot_col = j
+
+        if pivot_col == -1:
+            raise InfeasibleError("Задача не имеет допустимых решений (двойственная неразрешимость).")
+
+        last_objective = objective.get(n, Fraction(0))
+        matrix.pivot(r, pivot_col)
+        basic_indices[r - 1] = pivot_col
+        if stall_limit is not None:
+            if matrix.get(0, n) == last_objective:
+                stalled += 1
+                bland = bland or stalled >= stall_limit
+            else:
+                stalled = 0
+
+    return matrix, basic_indices
+
+
 def extract_solution(tableau, basic_indices, total_vars):
     """
     Из симплекс-таблицы извлекается оптимальное решение.
@@ -271,6 +861,88 @@ def extract_solution(tableau, basic_indices, total_vars):
     return solution, optimum
 
 
+def iter_optimal_solutions(tableau, basic_indices, total_vars, max_solutions=None):
+    """
+    Обходит все оптимальные вершины (грань оптимальных решений) оптимальной таблицы.
+
+    Переменные с положительной оценкой в оптимуме равны нулю, поэтому переходы идут только
+    по небазисным столбцам с нулевой оценкой (строка целевой функции при этом не меняется):
+    столбец вводится в базис по правилу минимального отношения b_i / a_ij (a_ij > 0),
+    каждая строка с минимальным отношением даёт соседний базис. Обход в глубину:
+    посещённые базисы хранятся в множестве (frozenset номеров базисных переменных),
+    а при возврате поворот отменяется обратным поворотом – таблица не копируется.
+
+    Выдаёт пары (решение, базис) для каждой различной вершины, первой – текущую.
+    Во время выдачи таблица находится в соответствующем базисе; после окончания
+    (или прерывания) обхода таблица и basic_indices возвращаются в исходное состояние.
+    Вершины, к которым ведёт неограниченное ребро (нет a_ij > 0), не существуют и пропускаются.
+    """
+    m = len(tableau) - 1
+    zero_columns = [j for j in range(total_vars) if tableau[0][j] == 0]
+    basic = set(basic_indices)
+    visited = {frozenset(basic)}
+    seen = set()
+
+    def moves():
+        result = []
+        for j in zero_columns:
+            if j in basic:
+                continue
+            best = None
+            rows = []
+            for i in range(1, m + 1):
+                a = tableau[i][j]
+                if a > 0:
+                    ratio = tableau[i][-1] / a
+                    if best is None or ratio < best:
+                        best, rows = ratio, [i]
+                    elif ratio == best:
+                        rows.append(i)
+            result.extend((i, j) for i in rows)
+        return result
+
+    def swap(r, col):
+        leaving = basic_indices[r - 1]
+        pivot(tableau, basic_indices, r, col)
+        basic.discard(leaving)
+        basic.add(col)
+        return leaving
+
+    # Стек: (оставшиеся переходы вершины, поворот для возврата к родителю)
+    stack = [(iter(moves()), None)]
+    found = 0
+    try:
+        solution, _ = extract_solution(tableau, basic_indices, total_vars)
+        seen.add(tuple(solution))
+        found += 1
+        yield solution, list(basic_indices)
+        while stack and (max_solutions is None or found < max_solutions):
+            remaining, undo = stack[-1]
+            for r, col in remaining:
+                key = frozenset(basic - {basic_indices[r - 1]} | {col})
+                if key in visited:
+                    continue
+                visited.add(key)
+                leaving = swap(r, col)
+                stack.append((iter(moves()), (r, leaving)))
+                solution, _ = extract_solution(tableau, basic_indices, total_vars)
+                if tuple(solution) not in seen:
+                    seen.add(tuple(solution))
+                    found += 1
+                    yield solution, list(basic_indices)
+                break
+            else:
+                stack.pop()
+                if undo is not None:
+                    swap(*undo)
+    finally:
+        # Возврат к исходному базису (в том числе при досрочном прерывании обхода)
+        while stack:
+            _, undo = stack.pop()
+            if undo is not None:
+                swap(*undo)
+
+
 def find_alternative_solution(tableau, basic_indices, total_vars):
     """
     Пытаемся найти альтернативное оптимальное решение.
@@ -278,57 +950,548 @@ def find_alternative_solution(tableau, basic_indices, total_vars):
     Если в оптимальном решении существует не-базисный столбец с нулевым коэффициентом в строке целевой функции,
     то можно получить другое оптимальное решение, изменив базис.
 
-    В этой реализации, если найден такой столбец, производится попытка сделать поворот,
-    а затем извлекается новое решение.
-    Если поворот сделать невозможно, возвращается None.
+    Ищется первая вершина iter_optimal_solutions, отличная от текущей; возвращаются копия
+    таблицы в её базисе и базис. Исходная таблица не изменяется. Если такой вершины нет,
+    возвращается None.
     """
-    m = len(tableau) - 1
-    n = total_vars
-    # Ищем не-базисный столбец j (то есть j не входит в basic_indices)
-    # для которого коэффициент в строке целевой функции равен 0.
-    for j in range(n):
-        if j in basic_indices:
-            continue
-        if tableau[0][j] == Fraction(0):
-            # Найдем строку, в которой можно осуществить поворот,
-            # чтобы j стал базисной, при условии что коэффициент положительный (чтобы не нарушить оптимальность).
-            candidate_row = -1
-            for i in range(1, m + 1):
-                # Для альтернативного решения часто ищут положительный коэффициент,
-                # т.к. изменение базиса при коэффициенте 0 может сохранить оптимальность.
-                if tableau[i][j] != Fraction(0):
-                    candidate_row = i
-                    break
-            if candidate_row != -1:
-                # Делаем поворот
-                tableau_copy = [row[:] for row in tableau]  # делаем копию таблицы
-                basic_copy = basic_indices.copy()
-                try:
-                    pivot(tableau_copy, basic_copy, candidate_row, j)
-                    # После поворота проверим, сохранена ли оптимальность.
-                    # Если правые части всех ограничений >= 0, решение допустимо.
-                    feasible = all(tableau_copy[i][-1] >= Fraction(0) for i in range(1, m + 1))
-                    if feasible:
-                        return tableau_copy, basic_copy
-                except Exception:
-                    continue
+    walk = iter_optimal_solutions(tableau, basic_indices, total_vars, max_solutions=2)
+    try:
+        next(walk)
+        for _, basis in walk:
+            return [row[:] for row in tableau], basis
+    finally:
+        walk.close()
     return None
 
 
+# =========================
+# Предварительная обработка
+# =========================
+
+def presolved_dual_simplex(tableau, basic_indices, pricing=None, max_iterations=None,
+                           time_limit=None, stall_limit=50):
+    """
+    Решает задачу после предварительной обработки (acom.presolve.presolve_tableau):
+    сокращённая задача решается табличным методом (если появились верхние границы –
+    dual_simplex_bounded), затем решение переводится в переменные исходной задачи.
+    Исходная таблица не изменяется.
+
+    Возвращает (solution, optimum, presolved); presolved.tableau и presolved.basic_indices –
+    оптимальная сокращённая таблица и её базис.
+    max_iterations, time_limit и stall_limit действуют на решение сокращённой задачи
+    любым из двух методов.
+    """
+    presolved = presolve_tableau(tableau, basic_indices)
+    if presolved.infeasible:
+        raise InfeasibleError("Задача не имеет допустимых решений (обнаружено при предварительной обработке).")
+
+    reduced_vars = len(presolved.columns)
+    if presolved.upper_bounds:
+        _, _, at_upper = dual_simplex_bounded(presolved.tableau, presolved.basic_indices,
+                                              presolved.upper_bounds, pricing=pricing,
+                                              max_iterations=max_iterations, time_limit=time_limit,
+                                              stall_limit=stall_limit)
+        solution, optimum = extract_bounded_solution(presolved.tableau, presolved.basic_indices,
+                                                     at_upper, presolved.upper_bounds, reduced_vars)
+    else:
+        dual_simplex(presolved.tableau, presolved.basic_indices, pricing=pricing,
+                     max_iterations=max_iterations, time_limit=time_limit, stall_limit=stall_limit)
+        solution, optimum = extract_solution(presolved.tableau, presolved.basic_indices, reduced_vars)
+    solution = presolved.postsolve(solution)
+    return solution, optimum, presolved
+
+
+# =========================
+# Модели в форматах MPS и CPLEX LP
+# =========================
+
+def solve_model(form, pricing=None, max_iterations=None, time_limit=None, sparse=False, stall_limit=50):
+    """
+    Решает модель, приведённую acom.lpfile.to_standard_form. Начальный базис – дополнительные
+    переменные (после поворота в искусственной строке, если он понадобился).
+    При верхних границах используется dual_simplex_bounded, иначе dual_simplex
+    или (sparse=True) sparse_dual_simplex без перехода к плотной таблице.
+    max_iterations, time_limit и stall_limit передаются любому из трёх методов.
+
+    Возвращает ({переменная: значение}, значение целевой функции модели).
+    """
+    total_vars = form.matrix.ncols - 1
+    basic_indices = list(form.basic_indices)
+    if form.upper_bounds:
+        tableau = form.matrix.to_dense()
+        _, _, at_upper = dual_simplex_bounded(tableau, basic_indices, form.upper_bounds, pricing=pricing,
+                                              max_iterations=max_iterations, time_limit=time_limit,
+                                              stall_limit=stall_limit)
+        solution, optimum = extract_bounded_solution(tableau, basic_indices, at_upper,
+                                                     form.upper_bounds, total_vars)
+        objective = tableau[0]
+    elif sparse:
+        matrix, basic_indices = sparse_dual_simplex(form.matrix, basic_indices, max_iterations=max_iterations,
+                                                    time_limit=time_limit, stall_limit=stall_limit)
+        solution = [Fraction(0) for _ in range(total_vars)]
+        for i, basic_var in enumerate(basic_indices):
+            solution[basic_var] = matrix.get(i + 1, total_vars)
+        optimum = matrix.get(0, total_vars)
+        objective = matrix.rows[0]
+    else:
+        tableau = form.matrix.to_dense()
+        dual_simplex(tableau, basic_indices, pricing=pricing, max_iterations=max_iterations,
+                     time_limit=time_limit, stall_limit=stall_limit)
+        solution, optimum = extract_solution(tableau, basic_indices, total_vars)
+        objective = tableau[0]
+    if form.unbounded(objective):
+        raise UnboundedError("Целевая функция не ограничена на множестве допустимых решений.")
+    return form.variable_values(solution), form.objective_value(optimum)
+
+
+# =========================
+# Повторная оптимизация (добавление ограничений, изменение b и границ)
+# =========================
+
+class LPState:
+    """
+    Симплекс-таблица вместе с базисом, которую можно менять и решать заново
+    двойственным симплекс-методом с текущего базиса, а не с нуля.
+
+    Объект создаётся по исходной таблице: запоминаются правые части ограничений
+    и столбцы identity_columns, образующие в исходной таблице единичную матрицу
+    (по умолчанию последние m столбцов, как в main). Строка целевой функции
+    в этих столбцах должна быть нулевой. Тогда текущий столбец identity_columns[k]
+    равен столбцу B^(-1) для k-го ограничения, и изменение b пересчитывается
+    без повторного решения.
+    """
+
+    def __init__(self, tableau, basic_indices=None, identity_columns=None):
+        m = len(tableau) - 1
+        n = len(tableau[0]) - 1
+        self.tableau = tableau
+        if identity_columns is None:
+            identity_columns = range(n - m, n)
+        self.identity_columns = list(identity_columns)
+        self.basic_indices = list(basic_indices) if basic_indices is not None else list(self.identity_columns)
+        self.rhs = [tableau[i + 1][-1] for i in range(m)]
+        # (переменная, "upper"/"lower") -> номер ограничения-границы
+        self.bound_rows = {}
+
+    def solve(self):
+        """Продолжает двойственный симплекс-метод с текущего базиса. Возвращает (solution, optimum)."""
+        dual_simplex(self.tableau, self.basic_indices)
+        return extract_solution(self.tableau, self.basic_indices, len(self.tableau[0]) - 1)
+
+    def shift_rhs(self, constraint, delta):
+        """Прибавляет delta к правой части ограничения constraint: b_new = b + delta·B^(-1)·e_k."""
+        delta = _as_fraction(delta)
+        if not delta:
+            return
+        col = self.identity_columns[constraint]
+        for row in self.tableau:
+            if row[col]:
+                row[-1] = row[-1] + delta * row[col]
+        self.rhs[constraint] = self.rhs[constraint] + delta
+
+    def change_rhs(self, constraint, value):
+        """Задаёт новую правую часть ограничения constraint (в исходной постановке)."""
+        self.shift_rhs(constraint, _as_fraction(value) - self.rhs[constraint])
+
+    def add_constraint(self, coefficients, rhs):
+        """
+        Добавляет ограничение sum(coefficients[j]·x_j) <= rhs (отсечение) со своей
+        дополнительной переменной. Новая строка выражается через текущий базис, так что
+        таблица остаётся двойственно допустимой, а отрицательная правая часть
+        устраняется следующим вызовом solve. Возвращает номер нового ограничения.
+        """
+        n = len(self.tableau[0]) - 1
+        # Столбец новой дополнительной переменной вставляется перед столбцом свободных членов
+        for row in self.tableau:
+            row.insert(n, Fraction(0))
+
+        new_row = [Fraction(0)] * (n + 2)
+        for j, value in enumerate(coefficients):
+            new_row[j] = _as_fraction(value)
+        new_row[n] = Fraction(1)
+        new_row[n + 1] = _as_fraction(rhs)
+
+        for i, basic in enumerate(self.basic_indices):
+            coef = new_row[basic]
+            if coef:
+                source = self.tableau[i + 1]
+                new_row = [x - coef * y for x, y in zip(new_row, source)]
+
+        self.tableau.append(new_row)
+        self.basic_indices.append(n)
+        self.identity_columns.append(n)
+        self.rhs.append(_as_fraction(rhs))
+        return len(self.rhs) - 1
+
+    def tighten_bound(self, variable, upper=None, lower=None):
+        """
+        Ужесточает границу переменной: x_variable <= upper и/или x_variable >= lower.
+        Первая граница добавляется как ограничение, а следующие для той же переменной
+        только меняют его правую часть (если новая граница строже).
+        """
+        n = len(self.tableau[0]) - 1
+        for kind, value, sign in (("upper", upper, 1), ("lower", lower, -1)):
+            if value is None:
+                continue
+            bound = _as_fraction(value) * sign
+            key = (variable, kind)
+            if key in self.bound_rows:
+                constraint = self.bound_rows[key]
+                if bound < self.rhs[constraint]:
+                    self.change_rhs(constraint, bound)
+            else:
+                coefficients = [0] * n
+                coefficients[variable] = sign
+                self.bound_rows[key] = self.add_constraint(coefficients, bound)
+
+
+def _as_fraction(value):
+    return value if isinstance(value, Fraction) else Fraction(value)
+
+
+# =========================
+# Результат решения и пакетное решение
+# =========================
+
+@dataclass
+class LPResult:
+    """Результат решения одной задачи."""
+    name: str
+    status: str                         # "optimal", "infeasible", "iteration_limit" или "time_limit"
+    solution: Optional[list] = None     # значения переменных (Fraction)
+    optimum: Optional[Fraction] = None  # значение целевой функции
+    basic_indices: Optional[list] = None
+    warm_start: bool = False            # решение начато с базиса предыдущей задачи
+    iterations: int = 0                 # число поворотов
+    log: Optional[list] = None          # журнал поворотов (solve_lp(..., trace=True))
+
+    def to_dict(self):
+        """Словарь для JSON: дроби записываются строками вида "p/q"."""
+        return {
+            "name": self.name,
+            "status": self.status,
+            "solution": None if self.solution is None else [str(x) for x in self.solution],
+            "optimum": None if self.optimum is None else str(self.optimum),
+            "basic_indices": self.basic_indices,
+            "warm_start": self.warm_start,
+            "iterations": self.iterations,
+            "log": self.log,
+        }
+
+    def render(self):
+        """Текст результата в том же виде, что и в main (без таблиц)."""
+        messages = {
+            "infeasible": "Задача не имеет допустимых решений.",
+            "iteration_limit": "Достигнут предел числа итераций.",
+            "time_limit": "Достигнут предел времени.",
+        }
+        lines = [f"Задача {self.name}:"] if self.name else []
+        if self.status != "optimal":
+            lines.append(messages.get(self.status, self.status))
+            return "\n".join(lines)
+        lines.append("Оптимальное решение:")
+        lines.extend(f"x{i + 1} = {val}" for i, val in enumerate(self.solution))
+        lines.append(f"Оптимальное значение целевой функции: {self.optimum}")
+        lines.append(f"Итераций: {self.iterations}")
+        return "\n".join(lines)
+
+
+def solve_lp(tableau, basic_indices=None, name="", pricing=None, max_iterations=None,
+             time_limit=None, stall_limit=50, trace=False, on_pivot=None, cache=None, stats=None):
+    """
+    Решает задачу табличным методом и возвращает LPResult со статусом вместо исключения
+    или завершения процесса. При статусах "iteration_limit" и "time_limit" в результат
+    записывается последний достигнутый базис (tableau изменяется на месте).
+    По умолчанию начальный базис – последние m столбцов, как в main.
+    trace=True записывает в LPResult.log журнал поворотов: строка, входящая и выходящая
+    переменные и значение целевой функции после поворота.
+    on_pivot – обратный вызов после каждого поворота (как в dual_simplex).
+    cache (acom.cache.ResultCache) – решать через cached_dual_simplex; LPResult.warm_start
+    отмечает, что решение начато с базиса из кэша. stats – как в dual_simplex.
+    """
+    m = len(tableau) - 1
+    n = len(tableau[0]) - 1
+    if basic_indices is None:
+        basic_indices = list(range(n - m, n))
+    log = [] if trace else None
+    count = [0]
+
+    callback = on_pivot
+    source = None
+
+    def on_pivot(iteration, r, entering, leaving, current):
+        count[0] = iteration
+        if log is not None:
+            log.append({"iteration": iteration, "row": r, "entering": entering,
+                        "leaving": leaving, "objective": str(current[0][-1])})
+        if callback is not None:
+            callback(iteration, r, entering, leaving, current)
+
+    try:
+        if cache is None:
+            dual_simplex(tableau, basic_indices, pricing=pricing, max_iterations=max_iterations,
+                         time_limit=time_limit, stall_limit=stall_limit, on_pivot=on_pivot, stats=stats)
+        else:
+            _, _, source = cached_dual_simplex(tableau, basic_indices, cache, pricing=pricing,
+                                               max_iterations=max_iterations, time_limit=time_limit,
+                                               stall_limit=stall_limit, on_pivot=on_pivot, stats=stats)
+    except InfeasibleError:
+        return LPResult(name, "infeasible", iterations=count[0], log=log)
+    except IterationLimitError:
+        return LPResult(name, "iteration_limit", basic_indices=list(basic_indices),
+                        iterations=count[0], log=log)
+    except TimeLimitError:
+        return LPResult(name, "time_limit", basic_indices=list(basic_indices),
+                        iterations=count[0], log=log)
+    solution, optimum = extract_solution(tableau, basic_indices, n)
+    return LPResult(name, "optimal", solution, optimum, list(basic_indices),
+                    warm_start=source is not None, iterations=count[0], log=log)
+
+
+def read_problems(path):
+    """
+    Перебирает задачи пакета как пары (имя, таблица).
+
+    path – каталог (берутся все файлы *.txt по алфавиту), файл с несколькими таблицами,
+    разделёнными строками "---", или "-" для чтения такого потока из stdin.
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".txt"):
+                with open(os.path.join(path, name), "r") as f:
+                    yield name, parse_tableau(f)
+        return
+
+    stream = sys.stdin if path == "-" else open(path, "r")
+    try:
+        lines = []
+        index = 0
+        for line in stream:
+            if line.strip() == "---":
+                if any(l.strip() for l in lines):
+                    index += 1
+                    yield f"{path}#{index}", parse_tableau(lines)
+                lines = []
+            else:
+                lines.append(line)
+        if any(l.strip() for l in lines):
+            index += 1
+            yield f"{path}#{index}", parse_tableau(lines)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def solve_batch(problems, warm_start=True, max_iterations=None, time_limit=None):
+    """
+    Решает задачи одну за другой в одном процессе и выдаёт LPResult для каждой.
+
+    Недопустимая задача не завершает процесс, а даёт результат со статусом "infeasible";
+    max_iterations и time_limit действуют на каждую задачу отдельно (см. solve_lp).
+    При warm_start=True задача того же размера начинается с оптимального базиса
+    предыдущей решённой задачи (rebuild_basis), если в нём строка оценок остаётся
+    неотрицательной, т.е. базис двойственно допустим. Иначе – с последних m столбцов.
+    """
+    previous = None
+    for name, tableau in problems:
+        m = len(tableau) - 1
+        n = len(tableau[0]) - 1
+        basic_indices = list(range(n - m, n))
+
+        warm = False
+        if warm_start and previous is not None and previous[0] == (m, n) and previous[1] != basic_indices:
+            rebuilt = rebuild_basis(tableau, basic_indices, previous[1])
+            if rebuilt is not None and all(x >= 0 for x in rebuilt[0][0][:n]):
+                tableau, basic_indices = rebuilt
+                warm = True
+
+        result = solve_lp(tableau, basic_indices, name=name, max_iterations=max_iterations,
+                          time_limit=time_limit)
+        result.warm_start = warm
+        if result.status == "optimal":
+            previous = ((m, n), list(result.basic_indices))
+        yield result
+
+
+def cached_dual_simplex(tableau, basic_indices, cache, pricing=None, max_iterations=None,
+                        time_limit=None, stall_limit=50, on_pivot=None, stats=None):
+    """
+    dual_simplex с кэшем результатов (acom.cache.ResultCache).
+
+    Ключ – канонический хэш исходной таблицы. Для уже решённой задачи в кэше лежит
+    оптимальный базис: таблица переводится в него (rebuild_basis, не больше m поворотов),
+    и dual_simplex заканчивается без итераций; для недопустимой задачи сразу бросается
+    InfeasibleError. Задача того же размера, которой нет в кэше, начинается с последнего
+    сохранённого оптимального базиса этого размера, если строка оценок в нём
+    неотрицательна (как в solve_batch). Остановка по пределу итераций или времени
+    в кэш не записывается.
+    tableau и basic_indices изменяются на месте.
+    Возвращает (tableau, basic_indices, source), source – "hit" (базис этой задачи),
+    "warm" (базис похожей задачи) или None.
+    """
+    m = len(tableau) - 1
+    n = len(tableau[0]) - 1
+    key = matrix_key(tableau, "dual_simplex")
+    similar = shape_key(m + 1, n + 1, "dual_simplex")
+    entry = cache.get(key)
+    if entry is not None and entry["status"] == "infeasible":
+        raise InfeasibleError("Задача не имеет допустимых решений (результат из кэша).")
+
+    source = None
+    if entry is not None:
+        start = "hit", entry["basis"]
+    else:
+        nearby = cache.get(similar)
+        start = ("warm", nearby["basis"]) if nearby is not None else None
+    if start is not None:
+        kind, basis = start
+        rebuilt = rebuild_basis(tableau, basic_indices, basis)
+        if rebuilt is not None and all(x >= 0 for x in rebuilt[0][0][:n]):
+            # Таблица и базис заменяются на месте, как и при повороте в dual_simplex
+            tableau[:], basic_indices[:] = rebuilt
+            source = kind
+
+    try:
+        tableau, basic_indices = dual_simplex(tableau, basic_indices, pricing=pricing,
+                                              max_iterations=max_iterations, time_limit=time_limit,
+                                              stall_limit=stall_limit, on_pivot=on_pivot, stats=stats)
+    except InfeasibleError:
+        cache.put(key, {"status": "infeasible"})
+        raise
+    cache.put(key, {"status": "optimal", "basis": list(basic_indices)})
+    cache.put(similar, {"basis": list(basic_indices)})
+    return tableau, basic_indices, source
+
+
+def print_stats(stats):
+    """Отчёт о статистике решения (--stats)."""
+    print("\nСтатистика:")
+    print(f"Поворотов: {stats.iterations}")
+    for name, seconds in stats.phases.items():
+        print(f"Этап {name}: {seconds * 1000:.3f} мс")
+    print(f"Создано дробей: {stats.fractions}")
+    print(f"Наибольшая длина числителя: {stats.max_numerator_bits} бит, "
+          f"знаменателя: {stats.max_denominator_bits} бит")
+    for iteration, (numerator_bits, denominator_bits) in enumerate(stats.growth, 1):
+        print(f"Итерация {iteration}: числитель {numerator_bits} бит, знаменатель {denominator_bits} бит")
+
+
 def main():
-    # Проверяем аргументы командной строки
-    if len(sys.argv) < 2:
-        print("Использование: python dual_simplex.py input.txt")
-        sys.exit(1)
+    # Аргументы командной строки (без них argparse выводит справку об использовании)
+    parser = argparse.ArgumentParser(description="Двойственный симплекс-метод.")
+    parser.add_argument("filename", help="файл с симплекс-таблицей или моделью .mps/.lp "
+                                         "(для --batch – каталог, поток или -)")
+    parser.add_argument("--batch", action="store_true",
+                        help="решить пакет задач; результаты выводятся строками JSON")
+    parser.add_argument("--no-warm-start", action="store_true",
+                        help="в пакетном режиме решать каждую задачу с начального базиса")
+    parser.add_argument("--pricing", choices=sorted(PRICING_RULES), default="dantzig",
+                        help="правило выбора опорной строки для табличного метода")
+    parser.add_argument("--max-iterations", type=int, default=None,
+                        help="предел числа поворотов (для всех методов)")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="предел времени решения в секундах (для всех методов)")
+    parser.add_argument("--presolve", action="store_true",
+                        help="предварительно сократить задачу (только табличный метод)")
+    parser.add_argument("--verbosity", type=int, choices=(0, 1, 2), default=1,
+                        help="0 – только результат, 1 – исходная и итоговая таблицы (по умолчанию), "
+                             "2 – ещё и таблица после каждого поворота табличного метода")
+    parser.add_argument("--stats", action="store_true",
+                        help="вывести статистику табличного метода: повороты, время этапов, "
+                             "число дробей и рост числителей и знаменателей")
+    parser.add_argument("--max-solutions", type=int, default=100,
+                        help="вывести не больше N альтернативных оптимальных решений (по умолчанию 100, "
+                             "0 – все)")
+    parser.add_argument("--relax", action="store_true",
+                        help="для модели .mps/.lp с целочисленными переменными решить непрерывную релаксацию")
+    parser.add_argument("--cache", metavar="DIR", default=None,
+                        help="кэш оптимальных базисов в каталоге DIR (табличный метод): повторная задача "
+                             "решается по сохранённому базису, задача того же размера начинается с него")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="с --cache – не больше N записей на диске (вытесняются давно не использованные)")
+    method = parser.add_mutually_exclusive_group()
+    method.add_argument("--float", action="store_true",
+                        help="поиск базиса в float64 (NumPy) с точной проверкой")
+    method.add_argument("--revised", action="store_true",
+                        help="модифицированный метод (LU-разложение базиса и эта-матрицы)")
+    method.add_argument("--sparse", action="store_true",
+                        help="разреженное хранение таблицы")
+    args = parser.parse_args()
+    if args.max_solutions < 0:
+        parser.error("--max-solutions не может быть отрицательным")
+    if args.presolve and (args.float or args.revised or args.sparse or args.batch):
+        parser.error("--presolve используется только с табличным методом")
+    if args.verbosity == 0 and (args.float or args.revised or args.sparse or args.presolve):
+        parser.error("--verbosity 0 используется только с табличным методом (без --presolve)")
+    if args.stats and (args.float or args.revised or args.sparse or args.presolve or args.batch):
+        parser.error("--stats используется только с табличным методом (без --presolve)")
+    if args.cache and (args.float or args.revised or args.sparse or args.presolve or args.batch):
+        parser.error("--cache используется только с табличным методом (без --presolve)")
+
+    if args.batch:
+        results = solve_batch(read_problems(args.filename), warm_start=not args.no_warm_start,
+                              max_iterations=args.max_iterations, time_limit=args.time_limit)
+        for result in results:
+            print(json.dumps(result.to_dict(), ensure_ascii=False))
+        return
+
+    filename = args.filename
+    if filename.lower().endswith((".mps", ".lp")):
+        # Модель читается построчно, таблица строится сразу в разреженном виде
+        if args.float or args.revised or args.presolve:
+            parser.error("для файлов .mps и .lp доступны только табличный метод и --sparse")
+        try:
+            form = to_standard_form(read_model(filename), relax=args.relax)
+        except (OSError, ValueError) as e:
+            print("Ошибка чтения файла:", e)
+            sys.exit(1)
+        model = form.model
+        print(f"Модель {model.name or filename}: переменных {len(model.variables)}, "
+              f"ограничений {len(model.constraints)}, столбцов таблицы {form.matrix.ncols - 1}")
+        try:
+            values, objective = solve_model(form, pricing=PRICING_RULES[args.pricing](),
+                                            max_iterations=args.max_iterations,
+                                            time_limit=args.time_limit, sparse=args.sparse)
+        except (InfeasibleError, IterationLimitError, TimeLimitError, UnboundedError) as e:
+            print(e)
+            sys.exit(0)
+        if model.integers:
+            print("Оптимальное решение непрерывной релаксации (целочисленность не учитывается):")
+        else:
+            print("Оптимальное решение:")
+        for name in model.variables:
+            print(f"{name} = {values[name]}")
+        print("Оптимальное значение целевой функции:", objective)
+        return
+
+    stats = SolveStats() if args.stats else None
+    cache = None
+    if args.cache:
+        cache = ResultCache(directory=args.cache, max_disk_entries=args.cache_size)
+    if args.sparse:
+        # Плотная таблица строится только после решения (для вывода и поиска альтернатив)
+        matrix = read_sparse_tableau(filename)
+        tableau = None
+    else:
+        with timed(stats, "parse"), track_fractions(stats):
+            tableau = read_tableau(filename)
+
+    if args.verbosity == 0:
+        # Только результат: таблицы не форматируются вовсе
+        result = solve_lp(tableau, pricing=PRICING_RULES[args.pricing](),
+                          max_iterations=args.max_iterations, time_limit=args.time_limit,
+                          cache=cache, stats=stats)
+        print(result.render())
+        if stats is not None:
+            print_stats(stats)
+        return
 
-    filename = sys.argv[1]
-    tableau = read_tableau(filename)
     print("Исходная симплекс-таблица:")
-    print_tableau(tableau)
+    print_tableau(matrix.iter_dense_rows() if args.sparse else tableau)
 
     # Определяем размеры таблицы
-    total_rows = len(tableau)
-    total_cols = len(tableau[0])
+    total_rows = matrix.nrows if args.sparse else len(tableau)
+    total_cols = matrix.ncols if args.sparse else len(tableau[0])
     total_vars = total_cols - 1  # число переменных (без свободного члена)
     m = total_rows - 1  # число ограничений
 
@@ -337,30 +1500,106 @@ def main():
     basic_indices = list(range(total_vars - m, total_vars))
     print("Начальный базис (индексы переменных):", basic_indices)
 
+    if args.presolve:
+        # Сокращённая задача решается отдельно, ответ выводится в исходных переменных
+        try:
+            solution, optimum, presolved = presolved_dual_simplex(
+                tableau, basic_indices, pricing=PRICING_RULES[args.pricing](),
+                max_iterations=args.max_iterations, time_limit=args.time_limit)
+        except (InfeasibleError, IterationLimitError, TimeLimitError) as e:
+            print(e)
+            sys.exit(0)
+        print(f"После предварительной обработки: ограничений {len(presolved.rows)} из {m}, "
+              f"переменных {len(presolved.columns)} из {total_vars}")
+        print("Оптимизированная сокращённая симплекс-таблица:")
+        print_tableau(presolved.tableau)
+        print("Оптимальное решение:")
+        for i, val in enumerate(solution):
+            print(f"x{i + 1} = {val}")
+        print("Оптимальное значение целевой функции:", optimum)
+        return
+
+    # С --verbosity 2 таблица после каждого поворота копится в буфере и выводится крупными кусками
+    trace = ChunkedWriter()
+
+    def trace_pivot(iteration, r, entering, leaving, current):
+        trace.write(f"Итерация {iteration}: строка {r}, в базис x{entering + 1}, из базиса x{leaving + 1}\n")
+        trace.write(format_tableau(current))
+        trace.write("\n\n")
+
     # Применяем двойственный симплекс-метод.
     # Он итеративно улучшает решение, пока все правые части ограничений не будут неотрицательными.
-    tableau, basic_indices = dual_simplex(tableau, basic_indices)
-    print("Оптимизированная симплекс-таблица:")
-    print_tableau(tableau)
+    # С флагом --float поиск базиса идёт в float64 (NumPy), а ответ проверяется точно в дробях.
+    # С флагом --revised таблица целиком не пересчитывается (LU-разложение базиса и эта-матрицы).
+    # С флагом --sparse хранятся и обрабатываются только ненулевые элементы.
+    try:
+        if args.float:
+            tableau, basic_indices = dual_simplex_float(tableau, basic_indices,
+                                                        max_iterations=args.max_iterations,
+                                                        time_limit=args.time_limit)
+        elif args.revised:
+            tableau, basic_indices = revised_dual_simplex(tableau, basic_indices,
+                                                          max_iterations=args.max_iterations,
+                                                          time_limit=args.time_limit)
+        elif args.sparse:
+            matrix, basic_indices = sparse_dual_simplex(matrix, basic_indices,
+                                                        max_iterations=args.max_iterations,
+                                                        time_limit=args.time_limit)
+            tableau = matrix.to_dense()
+        elif cache is not None:
+            tableau, basic_indices, source = cached_dual_simplex(
+                tableau, basic_indices, cache, pricing=PRICING_RULES[args.pricing](),
+                max_iterations=args.max_iterations, time_limit=args.time_limit,
+                on_pivot=trace_pivot if args.verbosity >= 2 else None, stats=stats)
+            if source == "hit":
+                print("Оптимальный базис взят из кэша:", basic_indices)
+            elif source == "warm":
+                print("Решение начато с базиса похожей задачи из кэша.")
+        else:
+            tableau, basic_indices = dual_simplex(tableau, basic_indices,
+                                                  pricing=PRICING_RULES[args.pricing](),
+                                                  max_iterations=args.max_iterations,
+                                                  time_limit=args.time_limit,
+                                                  on_pivot=trace_pivot if args.verbosity >= 2 else None,
+                                                  stats=stats)
+    except (InfeasibleError, IterationLimitError, TimeLimitError) as e:
+        trace.flush()
+        print(e)
+        sys.exit(0)
+    with timed(stats, "output"):
+        trace.flush()
+        print("Оптимизированная симплекс-таблица:")
+        print_tableau(tableau)
 
-    # Извлекаем оптимальное решение
-    solution, optimum = extract_solution(tableau, basic_indices, total_vars)
-    print("Оптимальное решение:")
-    for i, val in enumerate(solution):
-        print(f"x{i + 1} = {val}")
-    print("Оптимальное значение целевой функции:", optimum)
-
-    # Проверяем наличие альтернативных (оптимальных) решений.
-    alt = find_alternative_solution(tableau, basic_indices, total_vars)
-    if alt is not None:
-        tableau2, basic_indices2 = alt
-        solution2, _ = extract_solution(tableau2, basic_indices2, total_vars)
-        print("\nНайдено альтернативное оптимальное решение:")
-        for i, val in enumerate(solution2):
+        # Извлекаем оптимальное решение
+        solution, optimum = extract_solution(tableau, basic_indices, total_vars)
+        print("Оптимальное решение:")
+        for i, val in enumerate(solution):
             print(f"x{i + 1} = {val}")
+        print("Оптимальное значение целевой функции:", optimum)
+
+    # Проверяем наличие альтернативных (оптимальных) решений: выводятся оптимальные вершины,
+    # не больше --max-solutions (их число может расти экспоненциально); ещё одна вершина
+    # запрашивается, только чтобы узнать, что список обрезан.
+    limit = args.max_solutions or None
+    optima = iter_optimal_solutions(tableau, basic_indices, total_vars,
+                                    max_solutions=None if limit is None else limit + 2)
+    alternatives = [solution2 for solution2, _ in optima][1:]
+    truncated = limit is not None and len(alternatives) > limit
+    if alternatives:
+        for solution2 in alternatives[:limit]:
+            print("\nНайдено альтернативное оптимальное решение:")
+            for i, val in enumerate(solution2):
+                print(f"x{i + 1} = {val}")
+        if truncated:
+            print(f"\nПоказано альтернативных решений: {limit}; остальные не перечислялись "
+                  f"(--max-solutions).")
     else:
         print("\nАльтернативных оптимальных решений не найдено или их невозможно извлечь в данном варианте.")
 
+    if stats is not None:
+        print_stats(stats)
+
 
 if __name__ == "__main__":
     main()
@@ -3,14 +3,56 @@
 #include <fstream>
 #include <algorithm>
 #include <cmath>
+#include <cstdint>
 #include <sstream>
+#include <stdexcept>
+
+// Сборка как разделяемой библиотеки (без main) для вызова из Python через ctypes:
+//   g++ -O2 -shared -fPIC -DGAUSS_JORDAN_LIBRARY GaussJordan.cpp -o libgaussjordan.so
+// (или python -m acom.native). Функция gj_reduce описана в конце файла.
+
+// Числитель и знаменатель – 64-битные; при переполнении бросается std::overflow_error
+static int64_t checked_mul(int64_t a, int64_t b)
+{
+    int64_t result;
+    if (__builtin_mul_overflow(a, b, &result))
+    {
+        throw std::overflow_error("integer overflow in Fraction");
+    }
+    return result;
+}
+
+static int64_t checked_add(int64_t a, int64_t b)
+{
+    int64_t result;
+    if (__builtin_add_overflow(a, b, &result))
+    {
+        throw std::overflow_error("integer overflow in Fraction");
+    }
+    return result;
+}
+
+static int64_t checked_sub(int64_t a, int64_t b)
+{
+    int64_t result;
+    if (__builtin_sub_overflow(a, b, &result))
+    {
+        throw std::overflow_error("integer overflow in Fraction");
+    }
+    return result;
+}
+
+static int64_t checked_neg(int64_t a)
+{
+    return checked_sub(0, a);
+}
 
 // Функция дял вычисления НОД
-int calculate_gcd(int a, int b)
+int64_t calculate_gcd(int64_t a, int64_t b)
 {
     while (b != 0)
     {
-        int temp = b;
+        int64_t temp = b;
         b = a % b;
         a = temp;
     }
@@ -21,53 +63,79 @@ int calculate_gcd(int a, int b)
 class Fraction
 {
 public:
-    int numerator;   // Числитель
-    int denominator; // Знаменатель
+    int64_t numerator;   // Числитель
+    int64_t denominator; // Знаменатель
 
     // Метод для упрощения дроби (сокращение на НОД)
     void simplify()
     {
-        int gcdValue = calculate_gcd(abs(numerator), abs(denominator));
+        if (denominator == 0)
+        {
+            throw std::invalid_argument("zero denominator");
+        }
+        if (numerator == 0)
+        {
+            denominator = 1;
+            return;
+        }
+        int64_t gcdValue = calculate_gcd(numerator, denominator);
+        if (gcdValue < 0)
+        {
+            gcdValue = checked_neg(gcdValue);
+        }
         numerator /= gcdValue;
         denominator /= gcdValue;
         if (denominator < 0)
         {
             // Если знаменатель отрицательный, делаем его положительным
-            numerator *= -1;
-            denominator *= -1;
+            numerator = checked_neg(numerator);
+            denominator = checked_neg(denominator);
         }
     }
 
 public:
     // Конструктор для создания дроби
-    Fraction(int num = 0, int denom = 1) : numerator(num), denominator(denom)
+    Fraction(int64_t num = 0, int64_t denom = 1) : numerator(num), denominator(denom)
     {
         // Упрощаем дробь при создании
         simplify();
     }
 
-    // Перегрузка оператора сложения
+    // Перегрузка оператора сложения (знаменатели сначала сокращаются на общий НОД,
+    // чтобы промежуточные произведения реже выходили за 64 бита)
     Fraction operator+(const Fraction &other) const
     {
-        return Fraction(numerator * other.denominator + other.numerator * denominator, denominator * other.denominator);
+        int64_t g = calculate_gcd(denominator, other.denominator);
+        int64_t left = checked_mul(numerator, other.denominator / g);
+        int64_t right = checked_mul(other.numerator, denominator / g);
+        return Fraction(checked_add(left, right), checked_mul(denominator, other.denominator / g));
     }
 
     // Перегрузка оператора вычитания
     Fraction operator-(const Fraction &other) const
     {
-        return Fraction(numerator * other.denominator - other.numerator * denominator, denominator * other.denominator);
+        return *this + (-other);
     }
 
-    // Перегрузка оператора умножения
+    // Перегрузка оператора умножения (перекрёстное сокращение до умножения)
     Fraction operator*(const Fraction &other) const
     {
-        return Fraction(numerator * other.numerator, denominator * other.denominator);
+        if (numerator == 0 || other.numerator == 0)
+        {
+            return Fraction(0);
+        }
+        int64_t g1 = calculate_gcd(numerator, other.denominator);
+        int64_t g2 = calculate_gcd(other.numerator, denominator);
+        g1 = g1 < 0 ? -g1 : g1;
+        g2 = g2 < 0 ? -g2 : g2;
+        return Fraction(checked_mul(numerator / g1, other.numerator / g2),
+                        checked_mul(denominator / g2, other.denominator / g1));
     }
 
     // Перегрузка оператора деления
     Fraction operator/(const Fraction &other) const
     {
-        return Fraction(numerator * other.denominator, denominator * other.numerator);
+        return *this * Fraction(other.denominator, other.numerator);
     }
 
     // Перегрузка оператора сравнения (равенство)
@@ -85,7 +153,7 @@ public:
     // Перегрузка унарного минуса
     Fraction operator-() const
     {
-        return Fraction(-numerator, denominator);
+        return Fraction(checked_neg(numerator), denominator);
     }
 
     // Перегрузка оператора вывода для печати дроби
@@ -114,14 +182,14 @@ public:
         if (slashPos == std::string::npos)
         {
             // Если '/' нет, значит это целое число
-            f.numerator = std::stoi(input); // Преобразуем строку в целое число
+            f.numerator = std::stoll(input); // Преобразуем строку в целое число
             f.denominator = 1;              // Знаменатель равен 1
         }
         else
         {
             // Если '/' есть, значит это дробь
-            f.numerator = std::stoi(input.substr(0, slashPos));    // Числитель
-            f.denominator = std::stoi(input.substr(slashPos + 1)); // Знаменатель
+            f.numerator = std::stoll(input.substr(0, slashPos));    // Числитель
+            f.denominator = std::stoll(input.substr(slashPos + 1)); // Знаменатель
         }
 
         f.simplify(); // Упрощаем дробь
@@ -143,19 +211,22 @@ void printMatrix(const std::vector<std::vector<Fraction>> &matrix)
     std::cout << std::endl;
 }
 
-// Функция для выполнения метода Жордана-Гаусса
-void gaussJordan(std::vector<std::vector<Fraction>> &matrix)
+// Функция для выполнения метода Жордана-Гаусса.
+// reduceRhs – ведущий элемент ищется и в столбце свободных членов (как в GaussJordanBasic:
+// у несовместной системы получается строка 0 ... 0 | 1); verbose – выводить матрицу после шага.
+void gaussJordan(std::vector<std::vector<Fraction>> &matrix, bool reduceRhs = false, bool verbose = true)
 {
     int m = matrix.size();        // Количество строк
     int n = matrix[0].size() - 1; // Количество переменных (столбцов без учета столбца свободных членов)
+    int lastCol = reduceRhs ? n + 1 : n;
 
-    for (int col = 0, row = 0; col < n && row < m; ++col)
+    for (int col = 0, row = 0; col < lastCol && row < m; ++col)
     {
         // Поиск строки с максимальным элементом в текущем столбце (выбор главного элемента)
         int pivot = row;
         for (int i = row + 1; i < m; ++i)
         {
-            if (abs(matrix[i][col].numerator) > abs(matrix[pivot][col].numerator))
+            if (std::llabs(matrix[i][col].numerator) > std::llabs(matrix[pivot][col].numerator))
             {
                 pivot = i;
             }
@@ -191,7 +262,10 @@ void gaussJordan(std::vector<std::vector<Fraction>> &matrix)
         }
 
         // Выводим промежуточную матрицу после каждого шага
-        printMatrix(matrix);
+        if (verbose)
+        {
+            printMatrix(matrix);
+        }
         ++row; // Переходим к следующей строке
     }
 }
@@ -266,6 +340,47 @@ void solveSystem(const std::vector<std::vector<Fraction>> &matrix)
     }
 }
 
+// Интерфейс для Python (ctypes): матрица rows x cols построчно в массивах числителей
+// и знаменателей, результат записывается на место исходной.
+// Возвращает 0 – успех, 1 – переполнение 64-битных целых, 2 – нулевой знаменатель.
+extern "C" int gj_reduce(int64_t *numerators, int64_t *denominators, int rows, int cols)
+{
+    if (rows <= 0 || cols <= 0)
+    {
+        return 0;
+    }
+    try
+    {
+        std::vector<std::vector<Fraction>> matrix(rows, std::vector<Fraction>(cols));
+        for (int i = 0; i < rows; ++i)
+        {
+            for (int j = 0; j < cols; ++j)
+            {
+                matrix[i][j] = Fraction(numerators[i * cols + j], denominators[i * cols + j]);
+            }
+        }
+        gaussJordan(matrix, true, false);
+        for (int i = 0; i < rows; ++i)
+        {
+            for (int j = 0; j < cols; ++j)
+            {
+                numerators[i * cols + j] = matrix[i][j].numerator;
+                denominators[i * cols + j] = matrix[i][j].denominator;
+            }
+        }
+    }
+    catch (const std::overflow_error &)
+    {
+        return 1;
+    }
+    catch (const std::invalid_argument &)
+    {
+        return 2;
+    }
+    return 0;
+}
+
+#ifndef GAUSS_JORDAN_LIBRARY
 // Основная функция программы
 int main()
 {
@@ -297,3 +412,4 @@ int main()
 
     return 0;
 }
+#endif
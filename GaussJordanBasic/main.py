@@ -1,87 +1,444 @@
+import argparse
+import concurrent.futures
+import contextlib
 import copy
 import itertools
 import math
+import os
 import sys
-from my_fraction import Fraction
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from acom.bareiss import fraction_free_reduce, to_fraction_rows, to_integer_rows
+from acom.cache import ResultCache, matrix_key
+from acom.combinatorics import lex_combinations, revolving_door
+from acom.dense import pivot_in_place
+from acom.fraction import Fraction
+from acom.linear import LinearSystem, free_columns, nullspace_basis, particular_solution
+from acom.matrix_io import parse_fraction, read_matrix
+from acom.modular import modular_reduce
+from acom.native import load_library, reduce_native
+from acom.output import ChunkedWriter
+from acom.presolve import presolve_system
+from acom.sparse import SparseMatrix
+from acom.stats import SolveStats, timed, track_fractions
+
+
+@dataclass(frozen=True)
+class BasicSolution:
+    """Базисное решение для одного сочетания переменных."""
+    basis: tuple                # номера базисных переменных (с нуля)
+    solution: Optional[list]    # значения всех переменных; None, если столбцы линейно зависимы
+    feasible: bool              # решение существует и все значения неотрицательны
+
+
+@dataclass
+class SystemResult:
+    """Результат EquationSolver.analyze: данные без вывода на экран; текст – по запросу (render)."""
+    status: str                             # "consistent" или "inconsistent"
+    rank: int
+    pivot_columns: tuple                    # ведущие столбцы приведённой матрицы (с нуля)
+    matrix: list                            # ненулевые строки приведённой матрицы
+    basic_solutions: Optional[list] = None  # BasicSolution по сочетаниям (если запрошены)
+    log: Optional[list] = None              # повороты исключения: (строка, столбец, ведущий элемент)
+    free_columns: tuple = ()                # свободные переменные (с нуля)
+    particular: Optional[list] = None       # частное решение (свободные переменные – нули)
+    nullspace: Optional[list] = None        # базис ядра: x = particular + Σ t_k·nullspace[k]
+
+    def to_dict(self):
+        """Словарь для JSON: дроби записываются строками вида "p/q"."""
+        return {
+            "status": self.status,
+            "rank": self.rank,
+            "pivot_columns": list(self.pivot_columns),
+            "matrix": [[str(x) for x in row] for row in self.matrix],
+            "basic_solutions": None if self.basic_solutions is None else [
+                {
+                    "basis": list(result.basis),
+                    "solution": None if result.solution is None else [str(x) for x in result.solution],
+                    "feasible": result.feasible,
+                }
+                for result in self.basic_solutions
+            ],
+            "log": None if self.log is None else [[row, col, str(pivot)] for row, col, pivot in self.log],
+            "free_columns": list(self.free_columns),
+            "particular": None if self.particular is None else [str(x) for x in self.particular],
+            "nullspace": None if self.nullspace is None else [
+                [str(x) for x in vector] for vector in self.nullspace
+            ],
+        }
+
+    def render(self):
+        """Текст в том же виде, что и у EquationSolver.solve (без промежуточных матриц)."""
+        if self.status == "inconsistent":
+            return "No solution exists."
+        lines = ["Solution:"]
+        lines.extend(format_equation(row) for row in self.matrix)
+        lines.append(f"Rank: {self.rank}; pivot columns: "
+                     + ", ".join(f"x{col + 1}" for col in self.pivot_columns))
+        for result in self.basic_solutions or ():
+            lines.append("")
+            lines.append("".join(f"x{x + 1}" for x in result.basis))
+            if result.solution is None:
+                lines.append("Solution: ∅ (Linearly dependent)")
+            else:
+                lines.append(f"Solution: ({';'.join(str(x) for x in result.solution)})")
+        return "\n".join(lines)
 
-class EquationSolver:
-    def __init__(self, filename=""):
-        if not filename:
-            print("Error: Please provide a filename.")
-            sys.exit(-1)
 
-        try:
-            with open(filename, "r") as file:
-                lines = file.readlines()
-        except FileNotFoundError:
-            print(f"Error: File '{filename}' not found.")
-            sys.exit(-1)
+def format_matrix(matrix):
+    """Строки матрицы, выровненные по самому длинному элементу (как в display_matrix)."""
+    cells = [[str(x) for x in row] for row in matrix]
+    width = max((len(cell) for row in cells for cell in row), default=0) + 2
+    return "\n".join("".join(cell.rjust(width) for cell in row) for row in cells)
+
+
+def format_equation(row):
+    """Уравнение строки приведённой матрицы: "x1 + -4/5x3 = 1/5"."""
+    terms = []
+    for col in range(len(row) - 1):
+        value = row[col]
+        if value.numerator:
+            unit = abs(value.numerator) == 1 and value.denominator == 1
+            terms.append(f"{value.neg_sign() if unit else value}x{col + 1}")
+    return f"{' + '.join(terms)} = {row[-1]}"
 
-        self.matrix = [
-            [Fraction(int(x), 1) for x in line.split()]
-            for line in lines
-        ]
 
-    def solve(self):
-        self.display_matrix()
+def find_pivot_columns(matrix):
+    """Ведущие столбцы приведённой матрицы (первый ненулевой элемент каждой ненулевой строки)."""
+    pivot_columns = []
+    for row in matrix:
+        col = next((j for j, x in enumerate(row) if x), None)
+        if col is not None:
+            pivot_columns.append(col)
+    return pivot_columns
 
+
+class EquationSolver:
+    def __init__(self, filename="", sparse=False, bareiss=False, incremental=False, order="lex",
+                 verbose=True, matrix=None, presolve=False, stats=None, modular=False,
+                 native=False, cache=None, on_pivot=None):
+        # Кэш результатов (acom.cache.ResultCache): приведённая матрица, ранг и ведущие
+        # столбцы по хэшу исходной матрицы; None – не используется
+        self.cache = cache
+        # Статистика (acom.stats.SolveStats): повороты, рост дробей, время этапов parse,
+        # reduce, enumerate и output, число созданных дробей; None – не собирается
+        self.stats = stats
+        if matrix is not None:
+            # Готовая расширенная матрица вместо файла (для вызова из кода)
+            self.matrix = [
+                [x if isinstance(x, Fraction) else Fraction(x) for x in row]
+                for row in matrix
+            ]
+        else:
+            if not filename:
+                print("Error: Please provide a filename.")
+                sys.exit(-1)
+
+            # Текст (целые, десятичные, p/q), .npy или .tri – см. acom.matrix_io
+            try:
+                with timed(stats, "parse"), track_fractions(stats):
+                    self.matrix = read_matrix(filename)
+            except FileNotFoundError:
+                print(f"Error: File '{filename}' not found.")
+                sys.exit(-1)
+        # Разреженный режим: исключение идёт по acom.sparse.SparseMatrix
+        self.sparse = sparse
+        # Режим без дробей: исключение в целых числах (алгоритм Барейса)
+        self.bareiss = bareiss
+        # Исключение по нескольким простым модулям с восстановлением дробей (acom.modular)
+        self.modular = modular
+        # Исключение в C++ (GaussJordan/GaussJordan.cpp, 64-битные дроби); при переполнении – Fraction
+        self.native = native
+        # Перебор базисов поворотами от соседнего базиса (enumerate_bases)
+        self.incremental = incremental
+        self.order = order
+        # verbose=False отключает вывод промежуточных матриц при исключении и переборе
+        self.verbose = verbose
+        # Предварительная обработка (acom.presolve) перед исключением
+        self.presolve = presolve
+        # on_pivot(строка, столбец, ведущий элемент) вызывается перед каждым поворотом исключения
+        # (reduce, reduce_sparse, reduce_bareiss; в исключении C++ и по модулям поворотов не видно)
+        self.on_pivot = on_pivot
+        self.pivots_observed = False    # исключение шло способом, который вызывает on_pivot
+        self.reduced = False
+        self.fill_in = 0
+
+    def solve(self, nonnegative=False, max_results=None, workers=None):
+        # Вывод копится кусками (acom.output.ChunkedWriter) и пишется по мере накопления
+        # и в конце (и при ошибке); промежуточные матрицы форматируются внутри reduce и enumerate
+        buffer = ChunkedWriter()
+        stats = self.stats
+        try:
+            with contextlib.redirect_stdout(buffer), track_fractions(stats):
+                self.display_matrix()
+                with timed(stats, "reduce"):
+                    self.reduce_matrix()
+                with timed(stats, "enumerate"):
+                    self.enumerate_solutions(nonnegative=nonnegative, max_results=max_results,
+                                             workers=workers)
+        finally:
+            with timed(stats, "output"):
+                buffer.flush()
+
+    def analyze(self, basic_solutions=True, nonnegative=False, max_results=None, workers=None):
+        """
+        То же, что solve, но без вывода: возвращает SystemResult (ранг, ведущие столбцы,
+        приведённая матрица, базисные решения и повороты исключения). Текст – SystemResult.render().
+        basic_solutions=False пропускает перебор сочетаний. Журнал поворотов (строка, столбец,
+        ведущий элемент) записывается через on_pivot; он равен None, если повороты не наблюдались:
+        матрица уже приведена или взята из кэша, исключение шло в C++ или по модулям.
+        """
+        log = None
+        verbose, self.verbose = self.verbose, False
+        on_pivot = self.on_pivot
+        try:
+            if not self.reduced:
+                steps = []
+
+                def record(row, col, pivot):
+                    steps.append((row, col, pivot))
+                    if on_pivot is not None:
+                        on_pivot(row, col, pivot)
+
+                self.on_pivot = record
+                self.pivots_observed = False
+                with timed(self.stats, "reduce"):
+                    self.reduce_matrix()
+                if self.pivots_observed:
+                    log = steps
+            consistent = self.has_solutions()
+        finally:
+            self.verbose = verbose
+            self.on_pivot = on_pivot
+
+        pivot_columns = find_pivot_columns(self.matrix)
+        rows = [row for row in self.matrix if any(row)]
+        variables = len(self.matrix[0]) - 1
+        if not consistent:
+            return SystemResult("inconsistent", len(pivot_columns), tuple(pivot_columns), rows, log=log,
+                                free_columns=free_columns(pivot_columns, variables))
+
+        solutions = None
+        if basic_solutions:
+            with timed(self.stats, "enumerate"):
+                solutions = list(self.iter_basic_solutions(nonnegative=nonnegative,
+                                                           max_results=max_results,
+                                                           include_dependent=not nonnegative,
+                                                           workers=workers))
+        return SystemResult("consistent", len(pivot_columns), tuple(pivot_columns), rows,
+                            solutions, log, free_columns(pivot_columns, variables),
+                            particular_solution(rows, pivot_columns, variables),
+                            nullspace_basis(rows, pivot_columns, variables))
+
+    def reduce_matrix(self):
+        """Приводит матрицу выбранным способом (обычный, разреженный или без дробей)."""
+        key = None
+        if self.cache is not None:
+            # Приведённый вид единственен, поэтому ключ не зависит от способа исключения
+            key = matrix_key(self.matrix, "rref-presolve" if self.presolve else "rref")
+            entry = self.cache.get(key)
+            if entry is not None:
+                self.matrix = [[parse_fraction(x) for x in row] for row in entry["rref"]]
+                if self.verbose:
+                    print("\nReduced matrix (from cache):")
+                    self.display_matrix()
+                self.reduced = True
+                return
+        if self.presolve:
+            # Исключение идёт по сокращённой матрице, затем восстанавливается полная
+            presolved = presolve_system(self.matrix)
+            if self.verbose:
+                print(f"\nPresolve: removed {presolved.removed_rows} row(s), "
+                      f"fixed {len(presolved.fixed)} variable(s), "
+                      f"{len(presolved.columns)} column(s) left.")
+            self.matrix = presolved.matrix
+            if self.matrix and not presolved.infeasible:
+                on_pivot = self.on_pivot
+                if on_pivot is not None:
+                    # Столбцы сокращённой матрицы – в номера исходной (последний – свободные члены);
+                    # строки остаются номерами строк сокращённой матрицы
+                    columns = list(presolved.columns) + [presolved.width - 1]
+                    self.on_pivot = lambda row, col, pivot: on_pivot(row, columns[col], pivot)
+                try:
+                    self._reduce_selected()
+                finally:
+                    self.on_pivot = on_pivot
+            self.matrix = presolved.postsolve(self.matrix)
+        else:
+            self._reduce_selected()
+        self.reduced = True
+        if key is not None:
+            pivot_columns = find_pivot_columns(self.matrix)
+            self.cache.put(key, {"rref": [[str(x) for x in row] for row in self.matrix],
+                                 "rank": len(pivot_columns), "pivot_columns": pivot_columns})
+
+    def _reduce_selected(self):
+        if self.native:
+            self.reduce_native()
+        elif self.modular:
+            self.reduce_modular()
+        elif self.bareiss:
+            self.reduce_bareiss()
+        elif self.sparse:
+            self.reduce_sparse()
+        else:
+            self.reduce()
+
+    def reduce(self):
+        """Приводит матрицу к ступенчатому (приведённому) виду методом Жордана-Гаусса."""
         pivot_row = 0
         pivot_col = 0
+        self.pivots_observed = True
 
-        while pivot_row < len(self.matrix) and pivot_col < len(self.matrix[0]):
+        matrix = self.matrix
+        while pivot_row < len(matrix) and pivot_col < len(matrix[0]):
             # Поиск ненулевого ведущего элемента в текущем столбце
-            if self.matrix[pivot_row][pivot_col] == Fraction(0, 1):
-                for row in range(pivot_row + 1, len(self.matrix)):
-                    if self.matrix[row][pivot_col] != Fraction(0, 1):
+            if not matrix[pivot_row][pivot_col]:
+                for row in range(pivot_row + 1, len(matrix)):
+                    if matrix[row][pivot_col]:
                         # Меняем строки местами
-                        self.matrix[pivot_row], self.matrix[row] = self.matrix[row], self.matrix[pivot_row]
+                        matrix[pivot_row], matrix[row] = matrix[row], matrix[pivot_row]
                         break
                 else:
                     # Если все элементы в столбце равны нулю, переходим к следующему столбцу
                     pivot_col += 1
                     continue
 
-            # Нормализация ведущей строки
-            pivot = self.matrix[pivot_row][pivot_col]
-            if pivot == Fraction(0, 1):
-                pivot_col += 1
-                continue
+            # Нормализация ведущей строки и исключение текущего столбца в других строках
+            # (на месте, только по ненулевым элементам – acom.dense.pivot_in_place)
+            if self.on_pivot is not None:
+                self.on_pivot(pivot_row, pivot_col, matrix[pivot_row][pivot_col])
+            pivot_in_place(matrix, pivot_row, pivot_col)
 
-            for col in range(len(self.matrix[pivot_row])):
-                self.matrix[pivot_row][col] /= pivot
+            if self.stats is not None:
+                self.stats.record(self.matrix)
+            if self.verbose:
+                print()
+                self.display_matrix()
 
-            # Исключение текущего столбца в других строках
-            for row in range(len(self.matrix)):
-                if row != pivot_row:
-                    factor = self.matrix[row][pivot_col]
-                    for col in range(len(self.matrix[row])):
-                        self.matrix[row][col] -= self.matrix[pivot_row][col] * factor
+            pivot_row += 1
+            pivot_col += 1
+
+    def reduce_sparse(self):
+        """
+        То же, что reduce, но на разреженной матрице: обрабатываются только строки
+        с ненулевым элементом в ведущем столбце и только ненулевые элементы ведущей строки.
+        """
+        matrix = SparseMatrix.from_dense(self.matrix)
+        pivot_row = 0
+        pivot_col = 0
+        self.pivots_observed = True
+
+        while pivot_row < matrix.nrows and pivot_col < matrix.ncols:
+            if pivot_col not in matrix.rows[pivot_row]:
+                below = [row for row in matrix.column_rows(pivot_col) if row > pivot_row]
+                if not below:
+                    pivot_col += 1
+                    continue
+                matrix.swap_rows(pivot_row, min(below))
 
-            print()
-            self.display_matrix()
+            if self.on_pivot is not None:
+                self.on_pivot(pivot_row, pivot_col, matrix.rows[pivot_row][pivot_col])
+            matrix.pivot(pivot_row, pivot_col)
+
+            if self.stats is not None:
+                self.stats.record(matrix.rows)
+            if self.verbose:
+                print()
+                self.display_matrix(matrix.to_dense())
 
             pivot_row += 1
             pivot_col += 1
 
+        self.matrix = matrix.to_dense()
+        self.fill_in = matrix.fill_in
+
+    def reduce_bareiss(self):
+        """
+        То же, что reduce, но без дробей: исключение ведётся в целых числах
+        (acom.bareiss.fraction_free_reduce), а деление на общий множитель выполняется
+        один раз в конце. Промежуточные матрицы переводятся в дроби только для вывода.
+        """
+        def show_step(rows, divisor):
+            if self.stats is not None:
+                self.stats.record(rows, divisor)
+            if self.verbose:
+                print()
+                self.display_matrix(to_fraction_rows(rows, divisor))
+
+        integer_rows = to_integer_rows(self.matrix)
+        # Множитель каждой строки – НОК знаменателей (как в to_integer_rows); строки переставляются,
+        # но не копируются, поэтому множитель находится по самому списку
+        scales = {id(row): math.lcm(*(x.denominator for x in source))
+                  for row, source in zip(integer_rows, self.matrix)}
+
+        def record_pivot(row, col, pivot, divisor):
+            # Перед шагом целая строка равна divisor·множитель·(строка обычного метода)
+            self.on_pivot(row, col, Fraction(pivot, divisor * scales[id(integer_rows[row])]))
+
+        self.pivots_observed = True
+        track = self.verbose or self.stats is not None
+        rows, divisor = fraction_free_reduce(integer_rows,
+                                             on_step=show_step if track else None,
+                                             on_pivot=record_pivot if self.on_pivot is not None else None)
+        self.matrix = to_fraction_rows(rows, divisor)
+
+    def reduce_native(self):
+        """
+        То же, что reduce, но в C++ через ctypes (acom.native). Если числа не помещаются
+        в 64 бита, матрица приводится обычным способом (reduce, sparse или bareiss).
+        """
+        try:
+            reduced = reduce_native(self.matrix)
+        except OverflowError:
+            if self.verbose:
+                print("\nNative elimination overflowed 64 bits; using Python fractions.")
+            if self.modular:
+                self.reduce_modular()
+            elif self.bareiss:
+                self.reduce_bareiss()
+            elif self.sparse:
+                self.reduce_sparse()
+            else:
+                self.reduce()
+            return
+        self.matrix = reduced
+        if self.stats is not None:
+            self.stats.record(self.matrix)
+
+    def reduce_modular(self):
+        """
+        То же, что reduce, но исключение идёт по модулям простых чисел в NumPy int64,
+        а дроби восстанавливаются по китайской теореме об остатках (acom.modular).
+        Результат совпадает с reduce; промежуточные матрицы не выводятся.
+        """
+        self.matrix = modular_reduce(self.matrix)
+        if self.stats is not None:
+            self.stats.record(self.matrix)
+
+    def enumerate_solutions(self, nonnegative=False, max_results=None, workers=None):
+        """
+        Выводит решение, общее решение и базисные решения по всем сочетаниям переменных.
+        nonnegative, max_results и workers действуют в режиме incremental (см. iter_basic_solutions).
+        """
         if not self.has_solutions():
             print("\nNo solution exists.")
             return
 
-        if self.display_solution() > len(self.matrix[0][:-1]):
-            self.display_general_solution()
-
+        self.display_solution()
         variables = len(self.matrix[0][:-1])
-        rank = len(self.matrix)
-        combinations = math.factorial(variables) // (
-                math.factorial(rank) * math.factorial(variables - rank)
-        )
+        pivot_columns = find_pivot_columns(self.matrix)
+        if len(pivot_columns) < variables:
+            self.display_general_solution(pivot_columns)
+
+        rank = len(pivot_columns)
+        combinations = math.comb(variables, rank)
 
         print(f"\nAll possible variable combinations ({combinations}):")
-        indices = ''.join(str(x) for x in range(variables))
-        combinations_list = [
-            [int(x) for x in combo]
-            for combo in itertools.combinations(indices, rank)
-        ]
+        combinations_list = [list(combo) for combo in itertools.combinations(range(variables), rank)]
 
         for combo in combinations_list:
             print(''.join(f"x{x + 1}" for x in combo))
@@ -91,6 +448,17 @@ class EquationSolver:
 
         print()
 
+        if self.incremental:
+            results = self.iter_basic_solutions(nonnegative=nonnegative, max_results=max_results,
+                                                include_dependent=True, workers=workers)
+            for result in results:
+                print(''.join(f"x{x + 1}" for x in result.basis))
+                if result.solution is None:
+                    print("Solution: ∅ (Linearly dependent)\n")
+                else:
+                    print(f"Solution: ({';'.join(str(x) for x in result.solution)})\n")
+            return
+
         for combo in combinations_list:
             matrix_copy = copy.deepcopy(self.matrix)
             print(''.join(f"x{x + 1}" for x in combo))
@@ -111,8 +479,9 @@ class EquationSolver:
                 for row in range(len(matrix_copy)):
                     free_vars[row] |= (1 if matrix_copy[row][col] == 1 else 0)
 
-            print()
-            self.display_matrix(matrix_copy)
+            if self.verbose:
+                print()
+                self.display_matrix(matrix_copy)
 
             while recalculate:
                 pivot = 0
@@ -148,8 +517,9 @@ class EquationSolver:
 
                         free_vars[pivot] = 1
 
-                        print()
-                        self.display_matrix(matrix_copy)
+                        if self.verbose:
+                            print()
+                            self.display_matrix(matrix_copy)
 
             solution = "("
             for col in range(len(matrix_copy[0][:-1])):
@@ -163,6 +533,130 @@ class EquationSolver:
 
             print(f"Solution: {solution}\n")
 
+    def iter_basic_solutions(self, nonnegative=False, max_results=None, order=None,
+                             include_dependent=False, workers=None):
+        """
+        Лениво выдаёт базисные решения (BasicSolution) без вывода на экран.
+
+        Если матрица ещё не приведена, она приводится (reduce_matrix). Несовместная
+        система не даёт ни одного результата.
+          nonnegative       – только допустимые решения (все значения >= 0);
+          max_results       – остановиться после стольких результатов;
+          order             – порядок сочетаний ("lex" или "gray", см. enumerate_bases);
+                              по умолчанию – заданный в конструкторе;
+          include_dependent – выдавать и линейно зависимые сочетания (solution=None);
+          workers           – число процессов (см. enumerate_bases_parallel; порядок "lex").
+        Перебор останавливается, как только вызывающий перестаёт брать результаты.
+        """
+        if not self.reduced:
+            self.reduce_matrix()
+        if not self.has_solutions() or not self.matrix:
+            return
+        if max_results is not None and max_results <= 0:
+            return
+
+        if workers is not None and workers > 1:
+            bases = self.enumerate_bases_parallel(workers)
+        else:
+            bases = self.enumerate_bases(order or self.order)
+
+        count = 0
+        for combo, solution in bases:
+            if solution is None:
+                if nonnegative or not include_dependent:
+                    continue
+                result = BasicSolution(combo, None, False)
+            else:
+                feasible = all(x >= 0 for x in solution)
+                if nonnegative and not feasible:
+                    continue
+                result = BasicSolution(combo, solution, feasible)
+            yield result
+            count += 1
+            if max_results is not None and count >= max_results:
+                return
+
+    def enumerate_bases_parallel(self, workers, chunk_size=None):
+        """
+        То же, что enumerate_bases в порядке "lex", но на нескольких процессах.
+
+        Пространство сочетаний делится на куски по номеру сочетания (lex_combinations
+        начинает кусок с нужного номера без перебора предыдущих). Приведённая матрица
+        передаётся каждому процессу один раз при запуске пула, а задача – это только
+        пара (начало, длина). Результаты кусков выдаются строго по порядку, поэтому
+        вывод совпадает с однопроцессным перебором.
+        """
+        variables = len(self.matrix[0]) - 1
+        rank = len(self.matrix)
+        total = math.comb(variables, rank)
+        if chunk_size is None:
+            # Несколько кусков на процесс – для выравнивания нагрузки
+            chunk_size = max(1, -(-total // (workers * 8)))
+        chunks = [(start, min(chunk_size, total - start)) for start in range(0, total, chunk_size)]
+
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.matrix,)
+        )
+        try:
+            for results in pool.map(_enumerate_chunk, chunks):
+                yield from results
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def enumerate_bases(self, order="lex", combos=None):
+        """
+        Перебирает базисные решения по всем сочетаниям из rank переменных.
+
+        Матрица (уже приведённая, без нулевых строк) копируется один раз. Переход к
+        следующему сочетанию выполняется поворотами только по входящим столбцам:
+        для каждого нового столбца берётся строка, чья базисная переменная уходит,
+        с ненулевым элементом в этом столбце. Если такой строки нет, столбцы сочетания
+        линейно зависимы – это видно по ведущему элементу без повторного исключения.
+
+        order="lex" – лексикографический порядок (как при выводе), order="gray" – код
+        «вращающаяся дверь», где соседние сочетания отличаются одной переменной и
+        каждый переход стоит не больше одного поворота.
+
+        Выдаёт пары (combo, solution); solution – список значений переменных
+        или None для линейно зависимого сочетания. combos – готовый перебор сочетаний
+        (например, кусок из lex_combinations) вместо order.
+        """
+        tableau = [row[:] for row in self.matrix]
+        variables = len(tableau[0]) - 1
+        rank = len(tableau)
+        basis = [next(col for col in range(variables) if row[col]) for row in tableau]
+
+        if combos is None:
+            if order == "gray":
+                combos = revolving_door(variables, rank)
+            else:
+                combos = itertools.combinations(range(variables), rank)
+
+        for combo in combos:
+            target = set(combo)
+            current = set(basis)
+            dependent = False
+            for col in combo:
+                if col in current:
+                    continue
+                row = next((i for i in range(rank) if basis[i] not in target and tableau[i][col]), -1)
+                if row == -1:
+                    dependent = True
+                    break
+                pivot_in_place(tableau, row, col)
+                current.discard(basis[row])
+                current.add(col)
+                basis[row] = col
+
+            if dependent:
+                yield combo, None
+                continue
+
+            solution = [Fraction(0)] * variables
+            for row, col in enumerate(basis):
+                solution[col] = tableau[row][-1]
+            yield combo, solution
+
     def is_linearly_dependent(self, submatrix):
         """Проверяет, являются ли столбцы линейно зависимыми."""
         if len(submatrix) == 0 or len(submatrix[0]) == 0:
@@ -215,8 +709,9 @@ class EquationSolver:
                 if self.matrix[i][-1] == 0:
                     del self.matrix[i]
                     i -= 1
-                    print()
-                    self.display_matrix()
+                    if self.verbose:
+                        print()
+                        self.display_matrix()
                 else:
                     return False
             i += 1
@@ -225,78 +720,164 @@ class EquationSolver:
     def display_matrix(self, matrix=None):
         if matrix is None:
             matrix = self.matrix
-        max_len = [max(len(str(row[col])) for row in matrix) for col in range(len(matrix[0]))]
-        max_width = max(max_len)
-
-        for row in matrix:
-            for item in row:
-                print(f"{item:>{max_width + 2}}", end="")
-            print()
+        print(format_matrix(matrix))
 
     def display_solution(self):
         print("\nSolution:")
-        total_vars = 0
         for row in self.matrix:
-            vars_in_row = 0
-            for col in range(len(row) - 1):
-                if row[col].numerator:
-                    print(f"{' + ' if vars_in_row else ''}", end="")
-                    print(
-                        f"{row[col].neg_sign() if self.is_unit(row[col]) else row[col]}x{col + 1}",
-                        end=""
-                    )
-                    vars_in_row += 1
-            print(f" = {row[-1]}")
-            total_vars += vars_in_row
-        return total_vars
-
-    def display_general_solution(self):
-        matrix_copy = copy.deepcopy(self.matrix)
+            print(format_equation(row))
+
+    def display_general_solution(self, pivot_columns=None):
+        """Ведущие переменные через свободные (по ведущим столбцам приведённой матрицы)."""
+        if pivot_columns is None:
+            pivot_columns = find_pivot_columns(self.matrix)
+        rows = [row for row in self.matrix if any(row)]
         print("\nGeneral Solution:")
-        pivot_indices = {}
-        for i, row in enumerate(matrix_copy):
-            vars_in_row = 0
-            pivot_indices[i] = 0
+        for row, pivot_col in zip(rows, pivot_columns):
+            terms = []
             for j in range(len(row) - 1):
-                if row[j].numerator:
-                    if self.is_unit(row[j]):
-                        pivot_indices[i] = j
-                    vars_in_row += 1
-
-            if vars_in_row > 1:
-                vars_in_row = 0
-                print(
-                    f"{row[pivot_indices[i]].neg_sign()}x{pivot_indices[i] + 1} = ", end=""
-                )
-                for j in range(len(row) - 1):
-                    if row[j].numerator and j != pivot_indices[i]:
-                        row[j] *= Fraction(-1, 1)
-                        print(f"{' + ' if vars_in_row else ''}", end="")
-                        print(
-                            f"{row[j].neg_sign() if self.is_unit(row[j]) else row[j]}x{j + 1}",
-                            end=""
-                        )
-                        vars_in_row += 1
-                if row[-1].numerator != 0:
-                    print(f" + {row[-1]}")
-                else:
-                    print()
+                if j != pivot_col and row[j].numerator:
+                    value = -row[j]
+                    terms.append(f"{value.neg_sign() if self.is_unit(value) else value}x{j + 1}")
+            if not terms:
+                print(f"x{pivot_col + 1} = {row[-1]}")
+            elif row[-1].numerator:
+                print(f"x{pivot_col + 1} = {' + '.join(terms)} + {row[-1]}")
             else:
-                print(
-                    f"{row[j].neg_sign()}x{pivot_indices[i] + 1} = {row[-1]}"
-                )
+                print(f"x{pivot_col + 1} = {' + '.join(terms)}")
 
-        free_vars = ", ".join(
-            f"x{j + 1}" for j in range(len(matrix_copy[0]) - 1)
-            if j not in pivot_indices.values()
-        )
+        free_vars = ", ".join(f"x{j + 1}" for j in free_columns(pivot_columns, len(self.matrix[0]) - 1))
         if free_vars:
             print(f"{free_vars} - free variables")
 
+    def factorize(self):
+        """
+        Разложение системы (acom.linear.LinearSystem) по матрице, приводимой на месте:
+        ранг, ведущие и свободные столбцы, базис ядра, частное решение и решения
+        для других правых частей (LinearSystem.solve_many) без повторного исключения.
+        """
+        return LinearSystem(self.matrix)
+
+# Состояние процесса-исполнителя для enumerate_bases_parallel
+_worker_solver = None
+
+
+def _init_worker(matrix):
+    global _worker_solver
+    _worker_solver = EquationSolver(matrix=matrix, verbose=False)
+
+
+def _enumerate_chunk(chunk):
+    start, count = chunk
+    solver = _worker_solver
+    variables = len(solver.matrix[0]) - 1
+    rank = len(solver.matrix)
+    return list(solver.enumerate_bases(combos=lex_combinations(variables, rank, start, count)))
+
+
 def main():
-    filename = sys.argv[1] if len(sys.argv) > 1 else input("Enter filename: ")
-    solver = EquationSolver(filename)
-    solver.solve()
+    parser = argparse.ArgumentParser(description="Gauss-Jordan elimination and basic solutions.")
+    parser.add_argument("filename", nargs="?", help="input file with the augmented matrix")
+    parser.add_argument("--sparse", action="store_true", help="sparse row storage during elimination")
+    parser.add_argument("--bareiss", action="store_true", help="fraction-free (Bareiss) elimination")
+    parser.add_argument("--modular", action="store_true",
+                        help="multi-prime modular elimination with rational reconstruction (needs NumPy)")
+    parser.add_argument("--native", action="store_true",
+                        help="C++ elimination with 64-bit fractions (python -m acom.native builds it); "
+                             "falls back to Python fractions on overflow")
+    parser.add_argument("--incremental", action="store_true",
+                        help="enumerate bases by pivoting from the previous basis")
+    parser.add_argument("--order", choices=("lex", "gray"), default="lex",
+                        help="combination order for --incremental")
+    parser.add_argument("--nonnegative", action="store_true",
+                        help="show only non-negative basic solutions (with --incremental or --verbosity 0)")
+    parser.add_argument("--max-results", type=int, default=None,
+                        help="stop after this many basic solutions (with --incremental or --verbosity 0)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="enumerate combinations on N processes, lex order "
+                             "(with --incremental or --verbosity 0)")
+    parser.add_argument("--verbosity", type=int, choices=(0, 1, 2), default=None,
+                        help="0 - result only (no per-pivot output), 1 - no intermediate matrices, "
+                             "2 - full trace (default)")
+    parser.add_argument("--presolve", action="store_true",
+                        help="remove empty/duplicate rows and fixed variables before elimination")
+    parser.add_argument("--stats", action="store_true",
+                        help="print pivot count, phase times, fractions created and coefficient growth")
+    parser.add_argument("--rhs", metavar="FILE", default=None,
+                        help="solve the system against every right-hand side in FILE (one per line) "
+                             "with a single elimination; prints rank, nullspace and one solution per line")
+    parser.add_argument("--cache", metavar="DIR", default=None,
+                        help="cache reduced matrices in DIR; a repeated system skips elimination")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="with --cache, keep at most N results on disk (least recently used go first)")
+    args = parser.parse_args()
+    if args.rhs:
+        # Разложение LinearSystem строится обычным исключением и печатает только ответ
+        ignored = [flag for flag, value in (("--sparse", args.sparse), ("--bareiss", args.bareiss),
+                                            ("--modular", args.modular), ("--native", args.native),
+                                            ("--presolve", args.presolve), ("--cache", args.cache),
+                                            ("--incremental", args.incremental),
+                                            ("--nonnegative", args.nonnegative),
+                                            ("--max-results", args.max_results is not None),
+                                            ("--workers", args.workers is not None),
+                                            ("--verbosity", args.verbosity is not None)) if value]
+        if ignored:
+            parser.error(f"--rhs cannot be combined with {', '.join(ignored)}")
+    elif not args.incremental and args.verbosity != 0:
+        # Полный перебор с выводом таблицы сочетаний эти параметры не использует
+        ignored = [flag for flag, value in (("--nonnegative", args.nonnegative),
+                                            ("--max-results", args.max_results is not None),
+                                            ("--workers", args.workers is not None)) if value]
+        if ignored:
+            parser.error(f"{', '.join(ignored)}: only used with --incremental or --verbosity 0")
+    if args.verbosity is None:
+        args.verbosity = 2
+
+    if args.native:
+        try:
+            load_library()
+        except (ImportError, OSError) as e:
+            print(f"Error: {e}")
+            sys.exit(-1)
+
+    filename = args.filename or input("Enter filename: ")
+    solver = EquationSolver(filename, sparse=args.sparse, bareiss=args.bareiss, modular=args.modular,
+                            native=args.native, incremental=args.incremental, order=args.order,
+                            verbose=args.verbosity >= 2, presolve=args.presolve,
+                            stats=SolveStats() if args.stats else None,
+                            cache=ResultCache(directory=args.cache, max_disk_entries=args.cache_size)
+                            if args.cache else None)
+    if args.rhs:
+        try:
+            rhs_list = read_matrix(args.rhs)
+        except FileNotFoundError:
+            print(f"Error: File '{args.rhs}' not found.")
+            sys.exit(-1)
+        system = solver.factorize()
+        try:
+            solutions = system.solve_many(rhs_list)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(-1)
+        print(f"Rank: {system.rank}; pivot columns: "
+              + ", ".join(f"x{col + 1}" for col in system.pivot_columns))
+        for vector in system.nullspace():
+            print(f"Nullspace: ({';'.join(str(x) for x in vector)})")
+        for k, solution in enumerate(solutions, 1):
+            if solution is None:
+                print(f"b{k}: No solution exists.")
+            else:
+                print(f"b{k}: Solution: ({';'.join(str(x) for x in solution)})")
+    elif args.verbosity == 0:
+        with track_fractions(solver.stats):
+            result = solver.analyze(nonnegative=args.nonnegative, max_results=args.max_results,
+                                    workers=args.workers)
+        print(result.render())
+    else:
+        solver.solve(nonnegative=args.nonnegative, max_results=args.max_results, workers=args.workers)
+    if solver.stats is not None:
+        print("\nStatistics:")
+        print(solver.stats.render())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
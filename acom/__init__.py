@@ -0,0 +1,39 @@
+"""
+Общий код для решателей ACOM (DualSimplex, GaussJordanBasic).
+"""
+
+from .bareiss import fraction_free_reduce
+from .cache import ResultCache
+from .dense import pivot_in_place
+from .factor import BasisFactorization, LUFactorization, SingularMatrixError
+from .fraction import Fraction
+from .linear import LinearSystem
+from .lpfile import LPModel, read_lp, read_mps, to_standard_form
+from .matrix_io import parse_matrix, read_matrix
+from .output import ChunkedWriter
+from .presolve import presolve_system, presolve_tableau
+from .sparse import SparseMatrix
+from .stats import SolveStats, track_fractions
+
+__all__ = [
+    "BasisFactorization",
+    "ChunkedWriter",
+    "Fraction",
+    "LPModel",
+    "LUFactorization",
+    "LinearSystem",
+    "SingularMatrixError",
+    "ResultCache",
+    "SolveStats",
+    "SparseMatrix",
+    "fraction_free_reduce",
+    "parse_matrix",
+    "pivot_in_place",
+    "presolve_system",
+    "presolve_tableau",
+    "read_lp",
+    "read_matrix",
+    "read_mps",
+    "to_standard_form",
+    "track_fractions",
+]
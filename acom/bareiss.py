@@ -0,0 +1,89 @@
+"""
+Метод Жордана-Гаусса без дробей (алгоритм Барейса).
+
+Матрица хранится в целых числах Python. На шаге с ведущим элементом p и предыдущим
+ведущим элементом d каждый элемент вне ведущей строки пересчитывается как
+(p·a[i][j] - a[i][c]·a[r][j]) / d, причём деление всегда точное. После k-го шага
+матрица равна d_k·R_k, где R_k – матрица обычного метода Жордана-Гаусса на том же шаге,
+поэтому дроби нужны только один раз – в самом конце (или для вывода шага).
+"""
+
+import math
+
+from .fraction import Fraction
+
+
+def to_integer_rows(matrix):
+    """
+    Переводит строки из дробей в целые числа, умножая каждую строку на НОК знаменателей.
+    Умножение строки на ненулевое число не меняет приведённый вид матрицы.
+    """
+    rows = []
+    for row in matrix:
+        scale = 1
+        for value in row:
+            if value.denominator != 1:
+                scale = math.lcm(scale, value.denominator)
+        rows.append([value.numerator * (scale // value.denominator) for value in row])
+    return rows
+
+
+def to_fraction_rows(rows, divisor):
+    """Делит целочисленную матрицу на divisor и возвращает строки из дробей."""
+    return [[Fraction(value, divisor) for value in row] for row in rows]
+
+
+def fraction_free_reduce(rows, on_step=None, on_pivot=None):
+    """
+    Приводит целочисленную матрицу rows (изменяется на месте) к виду d·R,
+    где R – приведённая матрица метода Жордана-Гаусса.
+
+    Ведущие элементы выбираются так же, как в EquationSolver.reduce: в текущем столбце
+    берётся первая ненулевая строка, начиная с текущей; столбцы без ненулевых элементов
+    пропускаются (включая столбец свободных членов).
+
+    on_step(rows, d) вызывается после каждого шага, on_pivot(строка, столбец, ведущий
+    элемент, d) – перед ним (ведущий элемент приведённой дробями матрицы равен его
+    отношению к d). Возвращает (rows, d).
+    """
+    height = len(rows)
+    width = len(rows[0]) if rows else 0
+    previous = 1
+    pivot_row = 0
+    pivot_col = 0
+
+    while pivot_row < height and pivot_col < width:
+        if rows[pivot_row][pivot_col] == 0:
+            for row in range(pivot_row + 1, height):
+                if rows[row][pivot_col] != 0:
+                    rows[pivot_row], rows[row] = rows[row], rows[pivot_row]
+                    break
+            else:
+                pivot_col += 1
+                continue
+
+        lead = rows[pivot_row]
+        pivot = lead[pivot_col]
+        if on_pivot is not None:
+            on_pivot(pivot_row, pivot_col, pivot, previous)
+        for row in range(height):
+            if row == pivot_row:
+                continue
+            current = rows[row]
+            factor = current[pivot_col]
+            for col in range(width):
+                value = current[col]
+                if lead[col]:
+                    current[col] = (pivot * value - factor * lead[col]) // previous
+                elif value:
+                    # Деление точное: вся матрица после шага кратна ведущим элементам
+                    current[col] = pivot * value // previous
+        previous = pivot
+
+        if on_step is not None:
+            on_step(rows, previous)
+
+        pivot_row += 1
+        pivot_col += 1
+
+    return rows, previous
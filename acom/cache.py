@@ -0,0 +1,119 @@
+"""
+Кэш результатов решения по содержимому матрицы.
+
+Ключ – SHA-256 канонической записи матрицы: размеры и точные значения элементов
+в виде p/q, поэтому «0.5», «1/2» и «2/4» дают один ключ. К записи добавляется
+вид результата (kind), чтобы одна и та же матрица могла храниться и как система
+уравнений, и как симплекс-таблица.
+
+ResultCache хранит значения (словари из чисел, строк и списков – то, что пишется
+в JSON) в памяти и, если задан каталог, на диске (файл <ключ>.json на запись).
+Оба уровня ограничены по числу записей и вытесняют давно не использованные (LRU):
+в памяти – по порядку обращений, на диске – по времени изменения файла, которое
+обновляется при каждом чтении.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+
+def matrix_key(matrix, kind="matrix"):
+    """Канонический хэш матрицы (строки из Fraction или чисел) вместе с видом результата."""
+    digest = hashlib.sha256()
+    digest.update(f"{kind}:{len(matrix)}x{len(matrix[0]) if matrix else 0}\n".encode())
+    for row in matrix:
+        digest.update(" ".join(f"{x.numerator}/{x.denominator}" for x in row).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def shape_key(rows, cols, kind="matrix"):
+    """Ключ по размерам матрицы (для поиска базиса похожей задачи того же размера)."""
+    return hashlib.sha256(f"{kind}:shape:{rows}x{cols}".encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, max_entries=128, directory=None, max_disk_entries=1024):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """Значение по ключу или None. Найденное на диске переносится и в память."""
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path) as f:
+                    value = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                value = None
+            if value is not None:
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Сохраняет значение (должно записываться в JSON) в памяти и на диске."""
+        self._remember(key, value)
+        if self.directory is None:
+            return
+        # Запись через временный файл: параллельные процессы не увидят половину записи
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(value, f)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self._evict_disk()
+
+    def clear(self):
+        self._memory.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.unlink(os.path.join(self.directory, name))
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        if len(entries) <= self.max_disk_entries:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_disk_entries]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
@@ -0,0 +1,96 @@
+"""
+Порядки перебора сочетаний.
+"""
+
+import math
+
+
+def revolving_door(n, k):
+    """
+    Перебирает все k-элементные сочетания из range(n) так, что соседние сочетания
+    отличаются заменой ровно одного элемента (код Грея «вращающаяся дверь»,
+    алгоритм R из TAOCP 7.2.1.3). Сочетания выдаются кортежами по возрастанию.
+    """
+    if k < 0 or k > n:
+        return
+    if k == 0:
+        yield ()
+        return
+    # c[1..k] – текущее сочетание, c[k + 1] = n – ограничитель
+    c = [0] + list(range(k)) + [n]
+    while True:
+        yield tuple(c[1:k + 1])
+        if k % 2:
+            if c[1] + 1 < c[2]:
+                c[1] += 1
+                continue
+            j = 2
+            increase = False
+        else:
+            if c[1] > 0:
+                c[1] -= 1
+                continue
+            j = 2
+            increase = True
+        while True:
+            if not increase:
+                # Попытка уменьшить c[j] (здесь c[j] = c[j - 1] + 1)
+                if j > k:
+                    return
+                if c[j] >= j:
+                    c[j] = c[j - 1]
+                    c[j - 1] = j - 2
+                    break
+                j += 1
+            # Попытка увеличить c[j] (здесь c[j - 1] = j - 2)
+            if j > k:
+                return
+            if c[j] + 1 < c[j + 1]:
+                c[j - 1] = c[j]
+                c[j] += 1
+                break
+            j += 1
+            increase = False
+
+
+def unrank_combination(index, n, k):
+    """
+    Возвращает сочетание с номером index (с нуля) в лексикографическом порядке
+    itertools.combinations(range(n), k).
+    """
+    combo = []
+    start = 0
+    for remaining in range(k, 0, -1):
+        for value in range(start, n):
+            count = math.comb(n - value - 1, remaining - 1)
+            if index < count:
+                combo.append(value)
+                start = value + 1
+                break
+            index -= count
+    return tuple(combo)
+
+
+def lex_combinations(n, k, start=0, count=None):
+    """
+    Перебирает сочетания в лексикографическом порядке, начиная с номера start,
+    не больше count штук. Позволяет делить перебор на независимые куски.
+    """
+    total = math.comb(n, k)
+    if count is None:
+        count = total - start
+    count = min(count, total - start)
+    if count <= 0:
+        return
+    combo = list(unrank_combination(start, n, k))
+    for step in range(count):
+        yield tuple(combo)
+        if step == count - 1:
+            return
+        # Следующее сочетание: увеличиваем самый правый элемент, который можно увеличить
+        i = k - 1
+        while combo[i] == n - k + i:
+            i -= 1
+        combo[i] += 1
+        for j in range(i + 1, k):
+            combo[j] = combo[j - 1] + 1
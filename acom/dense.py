@@ -0,0 +1,33 @@
+"""
+Поворот плотной матрицы (список строк-списков) на месте.
+
+Общий для DualSimplex (pivot) и GaussJordanBasic (reduce, перебор базисов).
+Строки изменяются на месте, новые списки не создаются; строки с нулём
+в ведущем столбце пропускаются, а вычитание идёт только по ненулевым элементам
+ведущей строки (их номера находятся один раз на поворот).
+"""
+
+
+def pivot_in_place(matrix, row, col):
+    """
+    Поворот по элементу matrix[row][col] (не ноль): ведущая строка делится на него,
+    из остальных строк вычитается ведущая с таким множителем, чтобы в столбце col
+    получились нули. Матрица изменяется на месте.
+    """
+    lead = matrix[row]
+    pivot = lead[col]
+    nonzero = [j for j, value in enumerate(lead) if value]
+    if pivot != 1:
+        inverse = 1 / pivot
+        for j in nonzero:
+            lead[j] = lead[j] * inverse
+    # Пары (столбец, элемент ведущей строки) – без повторного обращения по индексу в цикле
+    entries = [(j, lead[j]) for j in nonzero]
+    for i, current in enumerate(matrix):
+        if i == row:
+            continue
+        factor = current[col]
+        if not factor:
+            continue
+        for j, value in entries:
+            current[j] = current[j] - factor * value
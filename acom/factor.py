@@ -0,0 +1,173 @@
+"""
+Факторизация базисной матрицы для модифицированного (revised) симплекс-метода.
+
+LUFactorization хранит разложение P·B = L·U квадратной матрицы в дробях и решает
+системы B·x = v (ftran) и y·B = v (btran) без явного вычисления B^(-1).
+BasisFactorization добавляет к нему файл эта-матриц (мультипликативная форма
+обратной): после каждого поворота добавляется одна эта-матрица, а через
+refactor_every обновлений базис разлагается заново.
+"""
+
+from .fraction import Fraction
+
+
+class SingularMatrixError(ArithmeticError):
+    """Матрица вырождена (нет ненулевого ведущего элемента)."""
+
+
+class LUFactorization:
+    def __init__(self, columns, size):
+        """
+        columns – список из size столбцов; каждый столбец – словарь {строка: значение}
+        с ненулевыми элементами (или плотный список длины size).
+        """
+        self.size = size
+        # Плотная копия матрицы по строкам: B[i][k] = columns[k][i]
+        rows = [[Fraction(0) for _ in range(size)] for _ in range(size)]
+        for k, column in enumerate(columns):
+            items = column.items() if isinstance(column, dict) else enumerate(column)
+            for i, value in items:
+                if value:
+                    rows[i][k] = value
+
+        perm = list(range(size))
+        lower = [dict() for _ in range(size)]  # множители L под диагональю, по столбцам
+        for k in range(size):
+            # Ведущий элемент – первый ненулевой в столбце k начиная со строки k
+            p = k
+            while p < size and not rows[p][k]:
+                p += 1
+            if p == size:
+                raise SingularMatrixError("Basis matrix is singular.")
+            if p != k:
+                rows[k], rows[p] = rows[p], rows[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                for col in range(k):
+                    lk, lp = lower[col].get(k), lower[col].get(p)
+                    lower[col].pop(k, None)
+                    lower[col].pop(p, None)
+                    if lp is not None:
+                        lower[col][k] = lp
+                    if lk is not None:
+                        lower[col][p] = lk
+
+            pivot_row = rows[k]
+            pivot = pivot_row[k]
+            nonzero = [j for j in range(k + 1, size) if pivot_row[j]]
+            for i in range(k + 1, size):
+                value = rows[i][k]
+                if not value:
+                    continue
+                factor = value / pivot
+                lower[k][i] = factor
+                row = rows[i]
+                for j in nonzero:
+                    row[j] = row[j] - factor * pivot_row[j]
+                row[k] = Fraction(0)
+
+        self.perm = perm
+        self.lower = lower
+        # U храним по строкам, только ненулевые элементы правее диагонали
+        self.diag = [rows[k][k] for k in range(size)]
+        self.upper = [{j: rows[k][j] for j in range(k + 1, size) if rows[k][j]} for k in range(size)]
+
+    def ftran(self, v):
+        """Решает B·x = v. v – плотный список длины size; возвращает новый список."""
+        x = [v[p] for p in self.perm]
+        for k in range(self.size):
+            xk = x[k]
+            if xk:
+                for i, factor in self.lower[k].items():
+                    x[i] = x[i] - factor * xk
+        for k in range(self.size - 1, -1, -1):
+            acc = x[k]
+            for j, value in self.upper[k].items():
+                if x[j]:
+                    acc = acc - value * x[j]
+            x[k] = acc / self.diag[k] if acc else acc
+        return x
+
+    def btran(self, v):
+        """Решает y·B = v (то есть B^T·y = v). Возвращает новый список."""
+        size = self.size
+        y = list(v)
+        # U^T·w = v
+        for k in range(size):
+            if y[k]:
+                y[k] = y[k] / self.diag[k]
+                wk = y[k]
+                for j, value in self.upper[k].items():
+                    y[j] = y[j] - value * wk
+        # L^T·z = w
+        for k in range(size - 1, -1, -1):
+            acc = y[k]
+            for i, factor in self.lower[k].items():
+                if y[i]:
+                    acc = acc - factor * y[i]
+            y[k] = acc
+        # Обратная перестановка: P^T·z
+        result = [Fraction(0) for _ in range(size)]
+        for k, p in enumerate(self.perm):
+            result[p] = y[k]
+        return result
+
+
+class BasisFactorization:
+    """
+    Обратная базисная матрица в виде LU-разложения и файла эта-матриц.
+
+    B_k^(-1) = E_k · ... · E_1 · (LU)^(-1). Если начальный базис единичный,
+    LU-часть отсутствует. Каждая эта-матрица хранится как (r, {i: eta_i}) –
+    номер опорной строки и ненулевые элементы её эта-столбца.
+    """
+
+    def __init__(self, size, columns=None, refactor_every=50):
+        self.size = size
+        self.refactor_every = refactor_every
+        self.lu = LUFactorization(columns, size) if columns is not None else None
+        self.etas = []
+
+    def needs_refactor(self):
+        return self.refactor_every and len(self.etas) >= self.refactor_every
+
+    def refactor(self, columns):
+        """Разлагает базис заново и очищает файл эта-матриц."""
+        self.lu = LUFactorization(columns, self.size)
+        self.etas = []
+
+    def ftran(self, v):
+        """Возвращает B^(-1)·v."""
+        x = self.lu.ftran(v) if self.lu is not None else list(v)
+        for r, eta in self.etas:
+            xr = x[r]
+            if not xr:
+                continue
+            for i, value in eta.items():
+                if i == r:
+                    x[i] = value * xr
+                else:
+                    x[i] = x[i] + value * xr
+        return x
+
+    def btran(self, v):
+        """Возвращает v·B^(-1)."""
+        y = list(v)
+        for r, eta in reversed(self.etas):
+            acc = Fraction(0)
+            for i, value in eta.items():
+                if y[i]:
+                    acc = acc + value * y[i]
+            y[r] = acc
+        return self.lu.btran(y) if self.lu is not None else y
+
+    def update(self, r, column):
+        """
+        Добавляет эта-матрицу после поворота в строке r.
+        column – столбец входящей переменной в текущем базисе (результат ftran).
+        """
+        pivot = column[r]
+        eta = {r: Fraction(1) / pivot}
+        for i, value in enumerate(column):
+            if i != r and value:
+                eta[i] = -value / pivot
+        self.etas.append((r, eta))
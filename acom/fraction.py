@@ -0,0 +1,273 @@
+"""
+Общий класс Fraction для работы с простыми дробями.
+
+Используется и двойственным симплекс-методом (DualSimplex), и методом
+Жордана-Гаусса (GaussJordanBasic). Экземпляры компактные (__slots__),
+для целых операндов и совпадающих знаменателей есть быстрые пути без
+лишних вызовов math.gcd, а внутренние результаты создаются без повторной
+нормализации.
+"""
+
+import math
+
+_gcd = math.gcd
+
+
+class Fraction:
+    __slots__ = ("numerator", "denominator")
+
+    def __init__(self, numerator=0, denominator=1):
+        if denominator == 0:
+            raise ValueError("Denominator cannot be zero.")
+        self.numerator = int(numerator)
+        self.denominator = int(denominator)
+        self.normalize()
+
+    @classmethod
+    def _new(cls, numerator, denominator):
+        """Создаёт дробь из уже сокращённых числителя и знаменателя (знаменатель > 0)."""
+        obj = object.__new__(cls)
+        obj.numerator = numerator
+        obj.denominator = denominator
+        return obj
+
+    def normalize(self):
+        """Приводит дробь к нормализованному виду."""
+        if self.numerator == 0:
+            self.denominator = 1
+            return
+        if self.denominator == 1:
+            return
+
+        # Находим наибольший общий делитель (НОД)
+        common_divisor = _gcd(self.numerator, self.denominator)
+        if common_divisor != 1:
+            self.numerator //= common_divisor
+            self.denominator //= common_divisor
+
+        # Убедимся, что знаменатель всегда положительный
+        if self.denominator < 0:
+            self.numerator = -self.numerator
+            self.denominator = -self.denominator
+
+    def sign(self):
+        """Возвращает знак дроби: '+' или '-'."""
+        return "-" if self.numerator < 0 else "+"
+
+    def neg_sign(self):
+        """Возвращает знак дроби для отрицательных чисел: '-' или пустую строку."""
+        return "-" if self.numerator < 0 else ""
+
+    # -------------------------
+    # Арифметика
+    # -------------------------
+
+    def __add__(self, other):
+        """Сложение дробей."""
+        if isinstance(other, Fraction):
+            na, da = self.numerator, self.denominator
+            nb, db = other.numerator, other.denominator
+            if da == db:
+                if da == 1:
+                    return Fraction._new(na + nb, 1)
+                n = na + nb
+                g = _gcd(n, da)
+                if g == 1:
+                    return Fraction._new(n, da)
+                if n == 0:
+                    return Fraction._new(0, 1)
+                return Fraction._new(n // g, da // g)
+            # Алгоритм Кнута: сокращаем на НОД знаменателей до умножения
+            g = _gcd(da, db)
+            if g == 1:
+                return Fraction._new(na * db + nb * da, da * db)
+            s = da // g
+            t = na * (db // g) + nb * s
+            g2 = _gcd(t, g)
+            if g2 == 1:
+                return Fraction._new(t, s * db)
+            if t == 0:
+                return Fraction._new(0, 1)
+            return Fraction._new(t // g2, s * (db // g2))
+        elif isinstance(other, int):
+            return Fraction._new(self.numerator + other * self.denominator, self.denominator)
+        else:
+            raise TypeError("Unsupported operand type for +")
+
+    def __radd__(self, other):
+        if isinstance(other, int):
+            return Fraction._new(self.numerator + other * self.denominator, self.denominator)
+        raise TypeError("Unsupported operand type for +")
+
+    def __sub__(self, other):
+        """Вычитание дробей."""
+        if isinstance(other, Fraction):
+            return self + Fraction._new(-other.numerator, other.denominator)
+        elif isinstance(other, int):
+            return Fraction._new(self.numerator - other * self.denominator, self.denominator)
+        else:
+            raise TypeError("Unsupported operand type for -")
+
+    def __rsub__(self, other):
+        if isinstance(other, int):
+            return Fraction._new(other * self.denominator - self.numerator, self.denominator)
+        raise TypeError("Unsupported operand type for -")
+
+    def __mul__(self, other):
+        """Умножение дробей."""
+        if isinstance(other, Fraction):
+            na, da = self.numerator, self.denominator
+            nb, db = other.numerator, other.denominator
+            if na == 0 or nb == 0:
+                return Fraction._new(0, 1)
+            if da == 1 and db == 1:
+                return Fraction._new(na * nb, 1)
+            # Перекрёстное сокращение: результат сразу несократим
+            g1 = _gcd(na, db)
+            if g1 != 1:
+                na //= g1
+                db //= g1
+            g2 = _gcd(nb, da)
+            if g2 != 1:
+                nb //= g2
+                da //= g2
+            return Fraction._new(na * nb, da * db)
+        elif isinstance(other, int):
+            return self._mul_int(other)
+        else:
+            raise TypeError("Unsupported operand type for *")
+
+    def __rmul__(self, other):
+        if isinstance(other, int):
+            return self._mul_int(other)
+        raise TypeError("Unsupported operand type for *")
+
+    def _mul_int(self, k):
+        if k == 0 or self.numerator == 0:
+            return Fraction._new(0, 1)
+        d = self.denominator
+        if d == 1:
+            return Fraction._new(self.numerator * k, 1)
+        g = _gcd(k, d)
+        if g == 1:
+            return Fraction._new(self.numerator * k, d)
+        return Fraction._new(self.numerator * (k // g), d // g)
+
+    def __truediv__(self, other):
+        """Деление дробей."""
+        if isinstance(other, Fraction):
+            if other.numerator == 0:
+                raise ZeroDivisionError("Cannot divide by zero.")
+            nb, db = other.numerator, other.denominator
+            if nb < 0:
+                nb, db = -nb, -db
+            return self * Fraction._new(db, nb)
+        elif isinstance(other, int):
+            if other == 0:
+                raise ZeroDivisionError("Cannot divide by zero.")
+            n = self.numerator
+            if n == 0:
+                return Fraction._new(0, 1)
+            if other < 0:
+                n, other = -n, -other
+            g = _gcd(n, other)
+            if g == 1:
+                return Fraction._new(n, self.denominator * other)
+            return Fraction._new(n // g, self.denominator * (other // g))
+        else:
+            raise TypeError("Unsupported operand type for /")
+
+    def __rtruediv__(self, other):
+        if isinstance(other, int):
+            return Fraction._new(other, 1) / self
+        raise TypeError("Unsupported operand type for /")
+
+    def __neg__(self):
+        return Fraction._new(-self.numerator, self.denominator)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        if self.numerator >= 0:
+            return self
+        return Fraction._new(-self.numerator, self.denominator)
+
+    # -------------------------
+    # Сравнения
+    # -------------------------
+
+    def __eq__(self, other):
+        """Проверка равенства дробей."""
+        if isinstance(other, Fraction):
+            return self.numerator == other.numerator and self.denominator == other.denominator
+        elif isinstance(other, int):
+            return self.numerator == other and self.denominator == 1
+        else:
+            return False
+
+    def __ne__(self, other):
+        """Проверка неравенства дробей."""
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        # Согласовано с __eq__: целая дробь хешируется как соответствующее int
+        if self.denominator == 1:
+            return hash(self.numerator)
+        return hash((self.numerator, self.denominator))
+
+    def __lt__(self, other):
+        if isinstance(other, Fraction):
+            return self.numerator * other.denominator < other.numerator * self.denominator
+        elif isinstance(other, int):
+            return self.numerator < other * self.denominator
+        else:
+            raise TypeError("Unsupported operand type for <")
+
+    def __gt__(self, other):
+        if isinstance(other, Fraction):
+            return self.numerator * other.denominator > other.numerator * self.denominator
+        elif isinstance(other, int):
+            return self.numerator > other * self.denominator
+        else:
+            raise TypeError("Unsupported operand type for >")
+
+    def __le__(self, other):
+        if isinstance(other, Fraction):
+            return self.numerator * other.denominator <= other.numerator * self.denominator
+        elif isinstance(other, int):
+            return self.numerator <= other * self.denominator
+        else:
+            raise TypeError("Unsupported operand type for <=")
+
+    def __ge__(self, other):
+        if isinstance(other, Fraction):
+            return self.numerator * other.denominator >= other.numerator * self.denominator
+        elif isinstance(other, int):
+            return self.numerator >= other * self.denominator
+        else:
+            raise TypeError("Unsupported operand type for >=")
+
+    def __bool__(self):
+        return self.numerator != 0
+
+    # -------------------------
+    # Преобразования
+    # -------------------------
+
+    def __float__(self):
+        return self.numerator / self.denominator
+
+    def __str__(self):
+        """Строковое представление дроби."""
+        if self.denominator == 1:
+            return f"{self.numerator}"
+        return f"{self.numerator}/{self.denominator}"
+
+    def __repr__(self):
+        """Представление дроби для отладки."""
+        return self.__str__()
+
+    def __format__(self, format_spec):
+        """Форматирование дроби."""
+        return format(str(self), format_spec)
@@ -0,0 +1,91 @@
+"""
+Генераторы тестовых задач с фиксированным зерном (для замеров производительности).
+
+lp_tableau(m, n, seed, kind) – каноническая симплекс-таблица: n переменных, m ограничений
+с дополнительными переменными (последние m столбцов – начальный базис), строка
+целевой функции неотрицательна (двойственная допустимость). Правые части строятся как
+A·x0 + s0 для x0, s0 >= 0, поэтому задача всегда допустима и имеет оптимум;
+отрицательные b получаются за счёт отрицательных коэффициентов A.
+
+linear_system(m, n, seed, kind) – расширенная матрица [A | b] совместной системы,
+b = A·x0 для целого x0.
+
+Виды задач (KINDS):
+  dense           – все коэффициенты случайные целые;
+  sparse          – около 10% ненулевых коэффициентов;
+  degenerate      – много нулевых правых частей и нулевых оценок (вырожденные повороты);
+  ill_conditioned – коэффициенты вида ±1/(i + j + 1) (матрица Гильберта): быстрый рост дробей;
+  rank_deficient  – вторая половина строк – целые комбинации первой.
+"""
+
+import random
+
+from .fraction import Fraction
+
+KINDS = ("dense", "sparse", "degenerate", "ill_conditioned", "rank_deficient")
+
+
+def _coefficients(m, n, rnd, kind):
+    """Матрица A (m×n) из Fraction для заданного вида задачи."""
+    if kind == "ill_conditioned":
+        return [[Fraction(rnd.choice((-1, 1)), i + j + 1) for j in range(n)] for i in range(m)]
+
+    density = 0.1 if kind == "sparse" else 1.0
+    rows = []
+    for _ in range(m):
+        row = [Fraction(rnd.randint(-9, 9)) if rnd.random() < density else Fraction(0) for _ in range(n)]
+        if not any(row):
+            row[rnd.randrange(n)] = Fraction(rnd.choice((-1, 1)) * rnd.randint(1, 9))
+        rows.append(row)
+
+    if kind == "rank_deficient" and m > 1:
+        half = (m + 1) // 2
+        for i in range(half, m):
+            weights = [rnd.randint(-2, 2) for _ in range(half)]
+            if not any(weights):
+                weights[0] = 1
+            rows[i] = [sum((rows[k][j] * w for k, w in enumerate(weights) if w), Fraction(0))
+                       for j in range(n)]
+    return rows
+
+
+def _check_kind(kind):
+    if kind not in KINDS:
+        raise ValueError(f"Unknown instance kind: {kind!r} (expected one of {', '.join(KINDS)})")
+
+
+def lp_tableau(m, n, seed=0, kind="dense"):
+    """Возвращает (tableau, basic_indices) – таблицу в формате DualSimplex и начальный базис."""
+    _check_kind(kind)
+    rnd = random.Random(f"lp-{kind}-{m}-{n}-{seed}")
+    a = _coefficients(m, n, rnd, kind)
+
+    degenerate = kind == "degenerate"
+    x0 = [Fraction(0) if degenerate and rnd.random() < 0.7 else Fraction(rnd.randint(0, 3))
+          for _ in range(n)]
+    zero = Fraction(0)
+    objective = [Fraction(0) if degenerate and rnd.random() < 0.5 else Fraction(rnd.randint(0, 9))
+                 for _ in range(n)]
+    tableau = [objective + [zero] * m + [zero]]
+    for i, row in enumerate(a):
+        slack = Fraction(0) if degenerate and rnd.random() < 0.6 else Fraction(rnd.randint(0, 5))
+        b = sum((row[j] * x0[j] for j in range(n) if row[j] and x0[j]), slack)
+        identity = [Fraction(1) if k == i else zero for k in range(m)]
+        tableau.append(list(row) + identity + [b])
+    return tableau, list(range(n, n + m))
+
+
+def linear_system(m, n, seed=0, kind="dense"):
+    """Возвращает расширенную матрицу [A | b] (m строк, n переменных) совместной системы."""
+    _check_kind(kind)
+    rnd = random.Random(f"system-{kind}-{m}-{n}-{seed}")
+    a = _coefficients(m, n, rnd, kind)
+    if kind == "degenerate":
+        # Повторяющиеся и нулевые строки
+        for i in range(1, m, 3):
+            a[i] = list(a[i - 1])
+        if m > 2:
+            a[-1] = [Fraction(0)] * n
+    x0 = [Fraction(rnd.randint(-3, 3)) for _ in range(n)]
+    return [row + [sum((row[j] * x0[j] for j in range(n) if row[j] and x0[j]), Fraction(0))]
+            for row in a]
@@ -0,0 +1,148 @@
+"""
+Ранг, ведущие и свободные столбцы, базис ядра и частное решение системы A·x = b
+за один проход Жордана-Гаусса; решение той же системы с другими правыми частями.
+
+LinearSystem приводит матрицу [A | b] на месте (без копии) только по столбцам A.
+Каждый поворот запоминается как шаг (перестановка строк, ведущий элемент и
+множители столбца – как эта-матрица в acom.factor.BasisFactorization), поэтому
+новая правая часть решается повторением шагов над одним вектором: O(число
+ненулевых множителей) вместо нового исключения.
+
+Пример:
+    system = LinearSystem(matrix)           # последний столбец – правая часть
+    system.rank, system.pivot_columns, system.free_columns
+    x0 = system.particular()                # None, если система несовместна
+    basis = system.nullspace()              # x = x0 + Σ t_k·basis[k]
+    solutions = system.solve_many(rhs_list)
+"""
+
+from .dense import pivot_in_place
+from .fraction import Fraction
+
+
+def free_columns(pivot_columns, variables):
+    """Номера свободных переменных: столбцы 0..variables-1, не являющиеся ведущими."""
+    pivots = set(pivot_columns)
+    return tuple(j for j in range(variables) if j not in pivots)
+
+
+def particular_solution(rows, pivot_columns, variables, rhs=-1):
+    """
+    Частное решение по приведённым строкам rows (строка i – с ведущим столбцом pivot_columns[i]):
+    ведущие переменные равны правой части (столбец rhs), свободные – нулю.
+    """
+    zero = Fraction(0)
+    solution = [zero] * variables
+    for row, col in zip(rows, pivot_columns):
+        solution[col] = row[rhs]
+    return solution
+
+
+def nullspace_basis(rows, pivot_columns, variables):
+    """
+    Базис ядра A по приведённым строкам: для каждой свободной переменной f вектор,
+    в котором x_f = 1, остальные свободные – 0, а ведущие равны -R[i][f].
+    """
+    zero = Fraction(0)
+    one = Fraction(1)
+    basis = []
+    for f in free_columns(pivot_columns, variables):
+        vector = [zero] * variables
+        vector[f] = one
+        for row, col in zip(rows, pivot_columns):
+            value = row[f]
+            if value:
+                vector[col] = -value
+        basis.append(vector)
+    return basis
+
+
+class LinearSystem:
+    def __init__(self, matrix, rhs_columns=1):
+        """
+        matrix – строки из Fraction: коэффициенты A и rhs_columns последних столбцов правых
+        частей (0 – только A). Матрица приводится на месте к ступенчатому виду по столбцам A.
+        """
+        self.matrix = matrix
+        self.rows = len(matrix)
+        self.variables = (len(matrix[0]) if matrix else 0) - rhs_columns
+        self.rhs_columns = rhs_columns
+        self._steps = []    # (исходная строка, строка, ведущий элемент, [(строка, множитель)])
+
+        pivot_columns = []
+        row = 0
+        for col in range(self.variables):
+            if row == self.rows:
+                break
+            k = next((i for i in range(row, self.rows) if matrix[i][col]), None)
+            if k is None:
+                continue
+            if k != row:
+                matrix[row], matrix[k] = matrix[k], matrix[row]
+            factors = [(i, current[col]) for i, current in enumerate(matrix)
+                       if i != row and current[col]]
+            self._steps.append((k, row, matrix[row][col], factors))
+            pivot_in_place(matrix, row, col)
+            pivot_columns.append(col)
+            row += 1
+        self.pivot_columns = tuple(pivot_columns)
+        self.free_columns = free_columns(pivot_columns, self.variables)
+
+    @property
+    def rank(self):
+        return len(self.pivot_columns)
+
+    def _rhs_column(self, k):
+        if k not in range(self.rhs_columns):
+            raise ValueError(f"Right-hand side index {k} is out of range "
+                             f"(the matrix has {self.rhs_columns} right-hand side column(s)).")
+        return self.variables + k
+
+    def consistent(self, k=0):
+        """Совместна ли система с k-й правой частью матрицы (нулевые строки A дают нули)."""
+        column = self._rhs_column(k)
+        return not any(self.matrix[i][column] for i in range(self.rank, self.rows))
+
+    def particular(self, k=0):
+        """Частное решение для k-й правой части матрицы (свободные переменные – нули) или None."""
+        if not self.consistent(k):
+            return None
+        return particular_solution(self.matrix, self.pivot_columns, self.variables,
+                                   self._rhs_column(k))
+
+    def nullspace(self):
+        """Базис ядра A (по вектору на свободную переменную)."""
+        return nullspace_basis(self.matrix, self.pivot_columns, self.variables)
+
+    def reduce_rhs(self, rhs):
+        """Правая часть rhs (длины rows), преобразованная теми же поворотами, что и матрица."""
+        b = [x if isinstance(x, Fraction) else Fraction(x) for x in rhs]
+        if len(b) != self.rows:
+            raise ValueError(f"Right-hand side has {len(b)} entries, expected {self.rows}.")
+        for k, row, pivot, factors in self._steps:
+            if k != row:
+                b[row], b[k] = b[k], b[row]
+            value = b[row]
+            if not value:
+                continue
+            if pivot != 1:
+                value = value / pivot
+                b[row] = value
+            for i, factor in factors:
+                b[i] = b[i] - factor * value
+        return b
+
+    def solve(self, rhs):
+        """Частное решение A·x = rhs (свободные переменные – нули) или None, если система несовместна."""
+        b = self.reduce_rhs(rhs)
+        if any(b[self.rank:]):
+            return None
+        zero = Fraction(0)
+        solution = [zero] * self.variables
+        for i, col in enumerate(self.pivot_columns):
+            solution[col] = b[i]
+        return solution
+
+    def solve_many(self, rhs_list):
+        """solve для каждой правой части из rhs_list."""
+        return [self.solve(rhs) for rhs in rhs_list]
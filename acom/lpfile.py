@@ -0,0 +1,532 @@
+"""
+Чтение моделей линейного программирования в форматах free MPS и CPLEX LP
+и построение по ним симплекс-таблицы для двойственного симплекс-метода.
+
+read_mps / read_lp читают файл построчно и возвращают LPModel: целевую функцию,
+ограничения (словари {переменная: коэффициент}) и границы переменных.
+to_standard_form переводит модель в таблицу вида, который ожидает DualSimplex:
+- переменные сдвигаются к нижней границе (x = l + x'), отражаются от верхней
+  (x = u - x') или расщепляются (x = x⁺ - x⁻), конечные интервалы становятся
+  верхними границами для dual_simplex_bounded;
+- ограничения >= умножаются на -1, равенства заменяются парой неравенств,
+  в каждую строку добавляется дополнительная переменная; они занимают последние
+  столбцы и образуют начальный базис;
+- строка 0 – коэффициенты минимизируемой функции. Если у неограниченной сверху
+  переменной отрицательная оценка, добавляется искусственное ограничение
+  Σ x_j <= big_m и делается один поворот – так начальный базис становится
+  двойственно допустимым.
+Целочисленные переменные (MARKER в MPS, General/Binary в LP) запоминаются
+в LPModel.integers; to_standard_form отказывается строить по такой модели
+таблицу, если не попросить явно решать непрерывную релаксацию (relax=True).
+"""
+
+import re
+
+from .fraction import Fraction
+from .matrix_io import parse_fraction
+from .sparse import SparseMatrix
+
+_ZERO = Fraction(0)
+_ONE = Fraction(1)
+_SLACK = object()   # метка дополнительной переменной в StandardForm.columns (не совпадает ни с каким именем)
+
+
+class LPModel:
+    def __init__(self, name=""):
+        self.name = name
+        self.sense = "min"              # "min" или "max"
+        self.objective = {}             # переменная -> коэффициент
+        self.objective_constant = _ZERO
+        self.variables = []             # имена в порядке появления
+        self.bounds = {}                # переменная -> (нижняя, верхняя); None – бесконечность
+        self.constraints = []           # (имя, {переменная: коэффициент}, "<=" | ">=" | "=", правая часть)
+        self.integers = []              # целочисленные переменные в порядке появления
+
+    def add_variable(self, name):
+        if name not in self.bounds:
+            self.variables.append(name)
+            self.bounds[name] = (_ZERO, None)
+
+    def mark_integer(self, name):
+        self.add_variable(name)
+        if name not in self.integers:
+            self.integers.append(name)
+
+    def set_bounds(self, name, lower=False, upper=False):
+        """Меняет нижнюю и/или верхнюю границу; False – оставить как есть."""
+        self.add_variable(name)
+        old_lower, old_upper = self.bounds[name]
+        self.bounds[name] = (old_lower if lower is False else lower,
+                             old_upper if upper is False else upper)
+
+
+# =========================
+# Free MPS
+# =========================
+
+def read_mps(lines):
+    """
+    Читает модель в формате free MPS (поля через пробелы). lines – файл или
+    итерируемое строк. Поддерживаются секции NAME, OBJSENSE, ROWS, COLUMNS, RHS,
+    BOUNDS, ENDATA. Столбцы между метками MARKER INTORG/INTEND и границы UI, LI, BV
+    делают переменную целочисленной. Отрицательная граница UP при нулевой нижней
+    границе по соглашению MPS делает нижнюю границу равной -∞.
+    """
+    model = LPModel()
+    row_sense = {}
+    objective_row = None
+    section = None
+    integer = False     # внутри блока MARKER INTORG ... INTEND
+
+    for line in lines:
+        if not line.strip() or line.startswith("*"):
+            continue
+        fields = line.split()
+        if not line[0].isspace():
+            section = fields[0].upper()
+            if section == "NAME":
+                model.name = fields[1] if len(fields) > 1 else ""
+            elif section == "OBJSENSE" and len(fields) > 1:
+                model.sense = "max" if fields[1].upper().startswith("MAX") else "min"
+            elif section == "RANGES":
+                raise ValueError("MPS RANGES section is not supported.")
+            elif section == "ENDATA":
+                break
+            continue
+
+        if section == "OBJSENSE":
+            model.sense = "max" if fields[0].upper().startswith("MAX") else "min"
+        elif section == "ROWS":
+            kind, name = fields[0].upper(), fields[1]
+            if kind == "N":
+                if objective_row is None:
+                    objective_row = name
+                continue
+            row_sense[name] = len(model.constraints)
+            model.constraints.append((name, {}, {"L": "<=", "G": ">=", "E": "="}[kind], _ZERO))
+        elif section == "COLUMNS":
+            if "'MARKER'" in fields:
+                integer = "'INTORG'" in fields
+                continue
+            column = fields[0]
+            model.add_variable(column)
+            if integer:
+                model.mark_integer(column)
+            for k in range(1, len(fields) - 1, 2):
+                row, value = fields[k], parse_fraction(fields[k + 1])
+                if row == objective_row:
+                    model.objective[column] = value
+                elif row in row_sense:
+                    model.constraints[row_sense[row]][1][column] = value
+        elif section == "RHS":
+            start = 1 if len(fields) % 2 else 0  # имя вектора правых частей необязательно
+            for k in range(start, len(fields) - 1, 2):
+                row, value = fields[k], parse_fraction(fields[k + 1])
+                if row == objective_row:
+                    model.objective_constant = -value
+                elif row in row_sense:
+                    name, coefs, sense, _ = model.constraints[row_sense[row]]
+                    model.constraints[row_sense[row]] = (name, coefs, sense, value)
+        elif section == "BOUNDS":
+            # Имя набора границ необязательно: "UP BND x 4" и "UP x 4"
+            kind, names = fields[0].upper(), fields[1:]
+            value = None
+            if kind in ("FR", "MI", "PL"):
+                column = names[-1]
+            elif kind == "BV":
+                column = names[1] if len(names) > 1 else names[0]
+            else:
+                column, value = names[-2], parse_fraction(names[-1])
+            if kind in ("UI", "LI", "BV"):
+                model.mark_integer(column)
+            if kind in ("UP", "UI"):
+                if value < 0 and model.bounds.get(column, (_ZERO,))[0] == 0:
+                    model.set_bounds(column, lower=None)
+                model.set_bounds(column, upper=value)
+            elif kind in ("LO", "LI"):
+                model.set_bounds(column, lower=value)
+            elif kind == "FX":
+                model.set_bounds(column, lower=value, upper=value)
+            elif kind == "FR":
+                model.set_bounds(column, lower=None, upper=None)
+            elif kind == "MI":
+                model.set_bounds(column, lower=None)
+            elif kind == "PL":
+                model.set_bounds(column, upper=None)
+            elif kind == "BV":
+                model.set_bounds(column, lower=_ZERO, upper=_ONE)
+            else:
+                raise ValueError(f"Unknown MPS bound type: {kind}")
+    return model
+
+
+# =========================
+# CPLEX LP
+# =========================
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<op><=|>=|=<|=>|<|>|=)|(?P<sign>[+-])|(?P<colon>:)"
+    r"|(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_!\"#$%&()/,.;?@'`{}|~][\w!\"#$%&()/,.;?@'`{}|~\[\].]*))"
+)
+
+_SECTIONS = {
+    "minimize": "min", "minimum": "min", "min": "min",
+    "maximize": "max", "maximum": "max", "max": "max",
+    "subject to": "st", "such that": "st", "st": "st", "s.t.": "st",
+    "bounds": "bounds", "bound": "bounds",
+    "general": "int", "generals": "int", "gen": "int",
+    "integer": "int", "integers": "int",
+    "binary": "bin", "binaries": "bin", "bin": "bin",
+    "end": "end",
+}
+
+_INFINITY = ("inf", "infinity")
+
+
+def _tokens(text):
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Cannot parse LP text near: {text[position:position + 20]!r}")
+        position = match.end()
+        kind = match.lastgroup
+        yield kind, match.group(kind)
+
+
+def _linear(tokens):
+    """
+    Разбирает линейное выражение. Возвращает ({переменная: коэффициент}, константа);
+    слагаемые с одной и той же переменной складываются.
+    """
+    terms = {}
+    constant = _ZERO
+    sign = 1
+    number = None
+    for kind, value in tokens:
+        if kind == "sign":
+            if number is not None:
+                constant = constant + number * sign
+                number = None
+                sign = 1
+            if value == "-":
+                sign = -sign
+        elif kind == "num":
+            if number is not None:
+                constant = constant + number * sign
+                sign = 1
+            number = parse_fraction(value)
+        elif kind == "name":
+            coef = (number if number is not None else _ONE) * sign
+            terms[value] = terms.get(value, _ZERO) + coef
+            number = None
+            sign = 1
+    if number is not None:
+        constant = constant + number * sign
+    return terms, constant
+
+
+def _split_label(tokens):
+    if len(tokens) >= 2 and tokens[0][0] == "name" and tokens[1][0] == "colon":
+        return tokens[0][1], tokens[2:]
+    return None, tokens
+
+
+def _normalize_op(op):
+    return {"<": "<=", "=<": "<=", ">": ">=", "=>": ">="}.get(op, op)
+
+
+def _section(line):
+    """Заголовок секции в начале строки: (секция, остаток строки) или (None, строка)."""
+    words = line.split()
+    for size in (2, 1):
+        header = " ".join(words[:size]).lower()
+        if len(words) >= size and header in _SECTIONS:
+            section = _SECTIONS[header]
+            rest = " ".join(words[size:])
+            # После заголовка на той же строке может идти только целевая функция
+            if not rest or section in ("min", "max"):
+                return section, rest
+    return None, line
+
+
+def read_lp(lines):
+    """
+    Читает модель в формате CPLEX LP. lines – файл или итерируемое строк.
+    Поддерживаются секции Minimize/Maximize, Subject To, Bounds, General/Binary, End
+    (переменные из General и Binary – целочисленные); комментарии начинаются с '\\'. Выражения могут занимать несколько строк.
+    """
+    model = LPModel()
+    section = None
+    pending = []   # накопленные лексемы текущего выражения
+
+    def flush_constraint():
+        label, tokens = _split_label(pending)
+        ops = [k for k, (kind, _) in enumerate(tokens) if kind == "op"]
+        if len(ops) != 1:
+            raise ValueError(f"Cannot parse LP constraint: {label or ''}")
+        k = ops[0]
+        left, left_const = _linear(tokens[:k])
+        right, right_const = _linear(tokens[k + 1:])
+        coefs = dict(left)
+        for name, value in right.items():
+            coefs[name] = coefs.get(name, _ZERO) - value
+        for name in coefs:
+            model.add_variable(name)
+        name = label or f"R{len(model.constraints) + 1}"
+        model.constraints.append((name, coefs, _normalize_op(tokens[k][1]), right_const - left_const))
+        pending.clear()
+
+    def complete():
+        # Ограничение закончено, когда после знака сравнения прочитано число
+        ops = [k for k, (kind, _) in enumerate(pending) if kind == "op"]
+        return ops and ops[-1] < len(pending) - 1 and pending[-1][0] == "num"
+
+    def finish_section():
+        if section in ("min", "max") and pending:
+            _, tokens = _split_label(pending)
+            terms, constant = _linear(tokens)
+            for name, value in terms.items():
+                model.add_variable(name)
+                model.objective[name] = value
+            model.objective_constant = constant
+            pending.clear()
+        elif section == "st" and pending:
+            flush_constraint()
+
+    for raw in lines:
+        line = raw.split("\\", 1)[0]
+        if not line.strip():
+            continue
+        header, rest = _section(line)
+        if header is not None:
+            finish_section()
+            section = header
+            if header in ("min", "max"):
+                model.sense = header
+            if header == "end":
+                break
+            line = rest
+            if not line.strip():
+                continue
+
+        if section in ("min", "max"):
+            pending.extend(_tokens(line))
+        elif section == "st":
+            pending.extend(_tokens(line))
+            if complete():
+                flush_constraint()
+        elif section == "bounds":
+            _read_bound(model, line)
+        elif section in ("int", "bin"):
+            for name in line.split():
+                model.mark_integer(name)
+                if section == "bin":
+                    model.set_bounds(name, lower=_ZERO, upper=_ONE)
+    finish_section()
+    return model
+
+
+def _bound_value(token):
+    kind, value = token
+    if kind == "name" and value.lower() in _INFINITY:
+        return None
+    return parse_fraction(value)
+
+
+def _read_bound(model, line):
+    """Строки вида 'x free', 'x >= 1', 'x <= 4', '-inf <= x <= 4', 'x = 3'."""
+    words = line.split()
+    if len(words) == 2 and words[1].lower() == "free":
+        model.set_bounds(words[0], lower=None, upper=None)
+        return
+    # Знак перед числом или бесконечностью переносим в само значение
+    tokens = []
+    for kind, value in _tokens(line):
+        infinite = kind == "name" and value.lower() in _INFINITY
+        if kind == "num" or infinite:
+            negative = bool(tokens) and tokens[-1] == ("sign", "-")
+            if tokens and tokens[-1][0] == "sign":
+                tokens.pop()
+            if infinite:
+                value = "-inf" if negative else "+inf"
+            else:
+                value = -parse_fraction(value) if negative else parse_fraction(value)
+            tokens.append(("value", value))
+        else:
+            tokens.append((kind, value))
+
+    names = [k for k, (kind, _) in enumerate(tokens) if kind == "name"]
+    if len(names) != 1:
+        raise ValueError(f"Cannot parse LP bound: {line.strip()!r}")
+    k = names[0]
+    name = tokens[k][1]
+    left, right = tokens[:k], tokens[k + 1:]
+    if len(left) == 2:      # value op x
+        op = _normalize_op(left[1][1])
+        _apply_bound(model, name, {"<=": ">=", ">=": "<=", "=": "="}[op], left[0][1])
+    if len(right) == 2:     # x op value
+        _apply_bound(model, name, _normalize_op(right[0][1]), right[1][1])
+
+
+def _apply_bound(model, name, op, value):
+    if value == "-inf":
+        if op == ">=":
+            model.set_bounds(name, lower=None)
+    elif value == "+inf":
+        if op == "<=":
+            model.set_bounds(name, upper=None)
+    elif op == ">=":
+        model.set_bounds(name, lower=value)
+    elif op == "<=":
+        model.set_bounds(name, upper=value)
+    else:
+        model.set_bounds(name, lower=value, upper=value)
+
+
+def read_model(filename):
+    """Читает .mps или .lp по расширению файла."""
+    reader = read_mps if str(filename).lower().endswith(".mps") else read_lp
+    with open(filename, "r") as f:
+        return reader(f)
+
+
+# =========================
+# Построение таблицы
+# =========================
+
+class StandardForm:
+    def __init__(self, model):
+        self.model = model
+        self.matrix = None          # SparseMatrix: строка 0 – целевая функция
+        self.basic_indices = []
+        self.upper_bounds = {}      # столбец -> верхняя граница (после сдвига)
+        self.columns = []           # описания столбцов: (переменная, знак, сдвиг) или (_SLACK, 1, строка)
+        self.artificial = None      # столбец дополнительной переменной искусственного ограничения
+        self.sense = 1 if model.sense == "min" else -1
+
+    def objective_value(self, optimum):
+        """Значение целевой функции модели по значению optimum из строки 0 таблицы."""
+        return -self.sense * optimum
+
+    def variable_values(self, solution):
+        """По значениям столбцов таблицы возвращает {переменная: значение}."""
+        values = {}
+        for j, column in enumerate(self.columns):
+            name, sign, shift = column
+            if name is _SLACK:
+                continue
+            values[name] = values.get(name, shift) + sign * solution[j]
+        return values
+
+    def unbounded(self, objective):
+        """
+        По строке 0 оптимальной таблицы (список или словарь) определяет, ограничена ли модель:
+        если оценка дополнительной переменной искусственного ограничения положительна,
+        увеличение big_m улучшает целевую функцию, то есть модель не ограничена.
+        """
+        if self.artificial is None:
+            return False
+        value = objective.get(self.artificial, 0) if isinstance(objective, dict) else objective[self.artificial]
+        return value > 0
+
+
+def to_standard_form(model, big_m=None, relax=False):
+    """
+    Строит StandardForm по модели. big_m – правая часть искусственного ограничения
+    (по умолчанию 10^6·(1 + max |b|)). Для модели с целочисленными переменными
+    бросает ValueError, если relax=False: симплекс-метод решает только непрерывную
+    релаксацию, и её оптимум не обязан быть целочисленным.
+    """
+    if model.integers and not relax:
+        shown = ", ".join(model.integers[:5]) + (", ..." if len(model.integers) > 5 else "")
+        raise ValueError(f"Model has integer variables ({shown}); "
+                         f"pass relax=True (--relax) to solve the LP relaxation.")
+    form = StandardForm(model)
+    sense = form.sense
+
+    # Столбцы переменных: x = shift + sign·x'
+    mapping = {}
+    for name in model.variables:
+        lower, upper = model.bounds[name]
+        first = len(form.columns)
+        if lower is not None:
+            form.columns.append((name, 1, lower))
+            if upper is not None:
+                if upper < lower:
+                    raise ValueError(f"Empty bounds for variable {name}.")
+                form.upper_bounds[first] = upper - lower
+            mapping[name] = [(first, 1)]
+        elif upper is not None:
+            form.columns.append((name, -1, upper))
+            mapping[name] = [(first, -1)]
+        else:
+            form.columns.append((name, 1, _ZERO))
+            form.columns.append((name, -1, _ZERO))
+            mapping[name] = [(first, 1), (first + 1, -1)]
+
+    def shift_of(name):
+        return form.columns[mapping[name][0][0]][2]
+
+    # Строки ограничений вида a·x' <= b
+    rows = []
+    for name, coefs, op, rhs in model.constraints:
+        row = {}
+        b = rhs
+        for var, a in coefs.items():
+            if not a:
+                continue
+            b = b - a * shift_of(var)
+            for col, sign in mapping[var]:
+                row[col] = a if sign > 0 else -a
+        if op in ("<=", "="):
+            rows.append((dict(row), b))
+        if op in (">=", "="):
+            rows.append(({j: -v for j, v in row.items()}, -b))
+
+    # Целевая функция (минимизируется sense·f)
+    objective = {}
+    constant = model.objective_constant
+    for var, c in model.objective.items():
+        if not c:
+            continue
+        constant = constant + c * shift_of(var)
+        for col, sign in mapping[var]:
+            objective[col] = objective.get(col, _ZERO) + (c if sign > 0 else -c) * sense
+    constant = constant * sense
+
+    structural = len(form.columns)
+    negative = [j for j, d in objective.items() if d < 0 and j not in form.upper_bounds]
+    if negative:
+        if big_m is None:
+            largest = max((abs(b) for _, b in rows), default=_ZERO)
+            big_m = (largest + 1) * 10 ** 6
+        rows.append(({j: _ONE for j in negative}, _as_fraction(big_m)))
+
+    m = len(rows)
+    ncols = structural + m + 1
+    dense_rows = [dict(objective)]
+    dense_rows[0][ncols - 1] = -constant
+    for i, (row, b) in enumerate(rows):
+        row = dict(row)
+        row[structural + i] = _ONE
+        row[ncols - 1] = b
+        dense_rows.append(row)
+        form.columns.append((_SLACK, 1, i))
+    form.matrix = SparseMatrix(dense_rows, ncols)
+    form.basic_indices = list(range(structural, structural + m))
+
+    if negative:
+        # Поворот в искусственной строке по столбцу с самой отрицательной оценкой
+        r = m
+        q = min(negative, key=lambda j: (objective[j], j))
+        form.matrix.pivot(r, q)
+        form.artificial = structural + m - 1
+        form.basic_indices[r - 1] = q
+    return form
+
+
+def _as_fraction(value):
+    return value if isinstance(value, Fraction) else parse_fraction(str(value))
@@ -0,0 +1,250 @@
+"""
+Чтение и запись матриц (симплекс-таблиц и расширенных матриц систем).
+
+Текстовый формат: числа через пробел, по строке матрицы на строку файла, пустые
+строки пропускаются. Число – целое (3, -7), десятичное (0.25, -1.5e3) или простая
+дробь (p/q). Разбор идёт по всему файлу сразу, одинаковые записи чисел разбираются
+один раз (кэш лексема -> Fraction; дроби не изменяются на месте, поэтому их можно
+разделять между ячейками).
+
+Двоичные форматы (по расширению файла):
+- .npy – плотная матрица NumPy (целые числа или float; float переводятся в дроби точно);
+- .tri – разреженные тройки: заголовок b"ACOMTRI1", затем int64 nrows, ncols, nnz
+  и четыре массива int64 длины nnz: строки, столбцы, числители, знаменатели
+  (little-endian). Файл читается через mmap и не требует NumPy.
+"""
+
+import fractions
+import mmap
+import sys
+from array import array
+
+from .fraction import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для .npy и read_numpy
+    np = None
+
+TRIPLET_MAGIC = b"ACOMTRI1"
+_HEADER = len(TRIPLET_MAGIC) + 3 * 8
+
+
+def parse_fraction(token):
+    """Переводит лексему (целое, десятичное или p/q) в Fraction."""
+    try:
+        return Fraction._new(int(token), 1)
+    except ValueError:
+        pass
+    try:
+        value = fractions.Fraction(token)
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"Invalid number: {token!r}") from None
+    return Fraction._new(value.numerator, value.denominator)
+
+
+def parse_matrix(lines):
+    """Разбирает строки текста в список строк из Fraction. lines – итерируемое строк или текст."""
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    cache = {}
+    matrix = []
+    for line in lines:
+        tokens = line.split()
+        if not tokens:
+            continue
+        row = []
+        for token in tokens:
+            value = cache.get(token)
+            if value is None:
+                value = cache[token] = parse_fraction(token)
+            row.append(value)
+        matrix.append(row)
+    return matrix
+
+
+def _format(filename):
+    name = str(filename).lower()
+    if name.endswith(".npy"):
+        return "npy"
+    if name.endswith(".tri"):
+        return "tri"
+    return "text"
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("NumPy is required for .npy files.")
+
+
+# -------------------------
+# .npy
+# -------------------------
+
+def _from_numpy(value):
+    if isinstance(value, float):
+        return Fraction._new(*value.as_integer_ratio())
+    return Fraction._new(int(value), 1)
+
+
+def _npy_rows(filename):
+    _require_numpy()
+    array2d = np.load(filename, mmap_mode="r")
+    if array2d.ndim != 2:
+        raise ValueError(f"{filename}: expected a 2-D array.")
+    return [[_from_numpy(v) for v in row.tolist()] for row in array2d]
+
+
+def write_npy(filename, matrix):
+    """Сохраняет матрицу из целых чисел в .npy (int64). Для дробей используйте write_triplets."""
+    _require_numpy()
+    values = []
+    for row in matrix:
+        for v in row:
+            if isinstance(v, Fraction) and v.denominator != 1:
+                raise ValueError(".npy stores integers only; use write_triplets for fractions.")
+        values.append([int(v.numerator) if isinstance(v, Fraction) else int(v) for v in row])
+    np.save(filename, np.array(values, dtype=np.int64))
+
+
+# -------------------------
+# .tri (разреженные тройки)
+# -------------------------
+
+def _int64_view(buffer, count):
+    """Массив int64 little-endian из буфера (без копирования на little-endian машинах)."""
+    if sys.byteorder == "little":
+        return memoryview(buffer).cast("q")[:count]
+    values = array("q")
+    values.frombytes(bytes(buffer[:count * 8]))
+    values.byteswap()
+    return values
+
+
+def read_triplets(filename):
+    """Читает .tri. Возвращает (rows, ncols): rows – список словарей {столбец: Fraction}."""
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(TRIPLET_MAGIC)] != TRIPLET_MAGIC:
+                raise ValueError(f"{filename}: not a triplet file.")
+            header = _int64_view(data[len(TRIPLET_MAGIC):_HEADER], 3)
+            nrows, ncols, nnz = header[0], header[1], header[2]
+            body = memoryview(data)[_HEADER:]
+            try:
+                values = _int64_view(body, 4 * nnz)
+                rows = [dict() for _ in range(nrows)]
+                cache = {}
+                for i, j, num, den in zip(values[:nnz], values[nnz:2 * nnz],
+                                          values[2 * nnz:3 * nnz], values[3 * nnz:]):
+                    if num:
+                        value = cache.get((num, den))
+                        if value is None:
+                            value = cache[num, den] = Fraction(num, den)
+                        rows[i][j] = value
+                if isinstance(values, memoryview):
+                    values.release()
+            finally:
+                body.release()
+    return rows, ncols
+
+
+def write_triplets(filename, matrix, ncols=None):
+    """
+    Сохраняет матрицу в .tri. matrix – плотный список строк или список словарей
+    {столбец: значение} (тогда нужен ncols). Числители и знаменатели должны помещаться в int64.
+    """
+    rows, cols, nums, dens = array("q"), array("q"), array("q"), array("q")
+    for i, row in enumerate(matrix):
+        items = row.items() if isinstance(row, dict) else enumerate(row)
+        if ncols is None and not isinstance(row, dict):
+            ncols = len(row)
+        for j, v in items:
+            if not v:
+                continue
+            v = v if isinstance(v, Fraction) else parse_fraction(str(v))
+            rows.append(i)
+            cols.append(j)
+            nums.append(v.numerator)
+            dens.append(v.denominator)
+    header = array("q", [len(matrix), ncols or 0, len(rows)])
+    parts = [header, rows, cols, nums, dens]
+    if sys.byteorder != "little":
+        for part in parts:
+            part.byteswap()
+    with open(filename, "wb") as f:
+        f.write(TRIPLET_MAGIC)
+        for part in parts:
+            part.tofile(f)
+
+
+# -------------------------
+# Общий вход
+# -------------------------
+
+def read_matrix(filename):
+    """Читает плотную матрицу из Fraction из текстового файла, .npy или .tri."""
+    kind = _format(filename)
+    if kind == "npy":
+        return _npy_rows(filename)
+    if kind == "tri":
+        rows, ncols = read_triplets(filename)
+        zero = Fraction(0)
+        dense = []
+        for row in rows:
+            values = [zero] * ncols
+            for j, v in row.items():
+                values[j] = v
+            dense.append(values)
+        return dense
+    with open(filename, "r") as f:
+        return parse_matrix(f.read().splitlines())
+
+
+def read_sparse_rows(filename):
+    """Читает матрицу в виде (rows, ncols), rows – словари {столбец: Fraction} без нулей."""
+    if _format(filename) == "tri":
+        return read_triplets(filename)
+    dense = read_matrix(filename)
+    ncols = max((len(row) for row in dense), default=0)
+    return [{j: v for j, v in enumerate(row) if v} for row in dense], ncols
+
+
+def read_numpy(filename, dtype=float):
+    """
+    Читает матрицу сразу в массив NumPy (без создания Fraction для .npy и .tri).
+    Для .npy массив отображается в память (mmap) и приводится к dtype только при необходимости.
+    """
+    _require_numpy()
+    kind = _format(filename)
+    if kind == "npy":
+        result = np.load(filename, mmap_mode="r")
+        return result if result.dtype == dtype else result.astype(dtype)
+    if kind == "tri":
+        with open(filename, "rb") as f:
+            if f.read(len(TRIPLET_MAGIC)) != TRIPLET_MAGIC:
+                raise ValueError(f"{filename}: not a triplet file.")
+            nrows, ncols, nnz = np.fromfile(f, dtype="<i8", count=3).tolist()
+        data = np.memmap(filename, dtype="<i8", mode="r", offset=_HEADER, shape=(4, nnz))
+        result = np.zeros((nrows, ncols), dtype=dtype)
+        result[data[0], data[1]] = data[2] / data[3]
+        return result
+    with open(filename, "r") as f:
+        text = f.read()
+    cache = {}
+    rows = []
+    for line in text.splitlines():
+        tokens = line.split()
+        if not tokens:
+            continue
+        row = []
+        for token in tokens:
+            value = cache.get(token)
+            if value is None:
+                try:
+                    value = float(token)
+                except ValueError:
+                    value = float(parse_fraction(token))
+                cache[token] = value
+            row.append(value)
+        rows.append(row)
+    return np.array(rows, dtype=dtype)
@@ -0,0 +1,329 @@
+"""
+Точное приведение матрицы методом Жордана-Гаусса по нескольким простым модулям.
+
+Вместо дробей, числители и знаменатели которых растут на каждом шаге, матрица
+приводится по модулю простых p < 2^28 в NumPy int64. Приведённая матрица R
+единственна, поэтому для «удачного» модуля результат равен R mod p.
+
+1. По первому модулю – полное исключение с поиском ведущих элементов: ведущие
+   столбцы P и строки S, по которым они найдены. Ненулевые строки R равны
+   A_{S,P}^(-1)·A_S, то есть R = N/d, где d = det A_{S,P}, а N – целая матрица.
+2. По следующим модулям решается только система A_{S,P}·X = A_{S,F} (F – неведущие
+   столбцы) блочным методом Жордана-Гаусса: обновление блока – одно матричное
+   умножение int64 (64 произведения вычетов < 2^28 помещаются в 63 бита).
+   Заодно вычисляется d mod p как произведение ведущих элементов.
+3. Вычеты d и d·X объединяются китайской теоремой об остатках (CRT). Так как общий
+   знаменатель d известен, рациональная реконструкция сводится к симметричному
+   подъёму N и d (модулей нужно примерно вдвое меньше, чем при восстановлении
+   каждой дроби по отдельности).
+   Если же знаменатели X малы (например, целое решение), d·X велики без нужды: поэтому
+   время от времени (через всё реже) X = (d·X)·d^(-1) восстанавливается и напрямую –
+   рациональной реконструкцией с накоплением общего знаменателя.
+4. Ранняя остановка: как только все поднятые числа короче модуля CRT на 40 бит
+   (или прямое восстановление X удалось), кандидат проверяется по новому модулю
+   полным исключением (с поиском ведущих элементов). Если ведущие столбцы и все
+   элементы совпали – ответ найден; иначе модуль добавляется к CRT. Модуль, давший больший ранг или лексикографически
+   меньшие ведущие столбцы, означает, что прежний был «неудачным»: всё начинается заново.
+
+Ведущие столбцы R – единичные, поэтому восстанавливаются только неведущие.
+"""
+
+import math
+
+from .bareiss import to_integer_rows
+from .fraction import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для modular_reduce
+    np = None
+
+PRIME_LIMIT = 2 ** 28
+BLOCK = 64              # BLOCK·(p-1)^2 < 2^62: сумма произведений блока не переполняет int64
+_SLACK_BITS = 40
+_INT64_LIMIT = 2 ** 62
+_primes = []
+
+
+def _is_prime(n):
+    """Детерминированный тест Миллера-Рабина для n < 3 215 031 751."""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def primes():
+    """Простые числа меньше PRIME_LIMIT по убыванию (список дополняется по мере надобности)."""
+    k = 0
+    while True:
+        if k == len(_primes):
+            candidate = _primes[-1] - 2 if _primes else PRIME_LIMIT - 1
+            while not _is_prime(candidate):
+                candidate -= 2
+            _primes.append(candidate)
+        yield _primes[k]
+        k += 1
+
+
+def _reduce_mod(a, p):
+    """
+    Приводит матрицу вычетов a (int64, изменяется на месте) по модулю p.
+    Возвращает (ведущие столбцы, исходные номера ведущих строк, произведение ведущих элементов).
+    """
+    m, n = a.shape
+    pivots = []
+    order = list(range(m))
+    det = 1
+    row = 0
+    for col in range(n):
+        if row == m:
+            break
+        nonzero = np.flatnonzero(a[row:, col])
+        if nonzero.size == 0:
+            continue
+        k = row + int(nonzero[0])
+        if k != row:
+            a[[row, k]] = a[[k, row]]
+            order[row], order[k] = order[k], order[row]
+        # Левее col в ведущей строке нули, поэтому пересчитываются только столбцы col..n-1
+        pivot = int(a[row, col])
+        det = det * pivot % p
+        a[row, col:] = a[row, col:] * pow(pivot, -1, p) % p
+        factor = a[:, col].copy()
+        factor[row] = 0
+        a[:, col:] -= np.outer(factor, a[row, col:])
+        a[:, col:] %= p
+        pivots.append(col)
+        row += 1
+    return tuple(pivots), tuple(order[:row]), det
+
+
+def _inverse_block(block, p):
+    """Обратная к квадратному блоку по модулю p без перестановок и её определитель; None, если нужен ноль."""
+    size = block.shape[0]
+    augmented = np.concatenate([block, np.eye(size, dtype=np.int64)], axis=1)
+    det = 1
+    for i in range(size):
+        pivot = int(augmented[i, i])
+        if not pivot:
+            return None
+        det = det * pivot % p
+        augmented[i] = augmented[i] * pow(pivot, -1, p) % p
+        factor = augmented[:, i].copy()
+        factor[i] = 0
+        augmented -= np.outer(factor, augmented[i])
+        augmented %= p
+    return augmented[:, size:], det
+
+
+def _solve_block(w, p):
+    """
+    Приводит w = [A_{S,P} | A_{S,F}] (int64, изменяется на месте) блоками по BLOCK столбцов
+    без перестановок строк. Возвращает (X, det A_{S,P}) по модулю p или None, если
+    ведущий элемент обратился в ноль (неудачный модуль).
+    """
+    r = w.shape[0]
+    det = 1
+    for k in range(0, r, BLOCK):
+        e = min(k + BLOCK, r)
+        inverse = _inverse_block(w[k:e, k:e].copy(), p)
+        if inverse is None:
+            return None
+        inverse, block_det = inverse
+        det = det * block_det % p
+        w[k:e, k:] = inverse @ w[k:e, k:] % p
+        for rows in (slice(0, k), slice(e, r)):
+            factor = w[rows, k:e].copy()
+            w[rows, k:] -= factor @ w[k:e, k:]
+            w[rows, k:] %= p
+    return w[:, r:], det
+
+
+def _better(pivots, best):
+    """Ведущие столбцы pivots ближе к истинным, чем best (больше ранг или лексикографически меньше)."""
+    if len(pivots) != len(best):
+        return len(pivots) > len(best)
+    return pivots < best
+
+
+def rational_reconstruction(value, modulus):
+    """
+    Дробь a/b с a ≡ value·b (mod modulus), |a|, b <= sqrt(modulus/2) (алгоритм Ванга).
+    Возвращает (a, b) или None, если такой дроби нет.
+    """
+    bound = math.isqrt(modulus // 2)
+    r0, r1 = modulus, value % modulus
+    s0, s1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if s1 == 0 or abs(s1) > bound:
+        return None
+    if s1 < 0:
+        r1, s1 = -r1, -s1
+    if math.gcd(r1, s1) != 1:
+        return None
+    return r1, s1
+
+
+def _reconstruct(residues, modulus):
+    """
+    Восстанавливает дроби по вычетам. Знаменатель уже восстановленных элементов
+    накапливается: для следующих элементов обычно хватает целочисленного подъёма.
+    None, если модуля пока недостаточно.
+    """
+    half = modulus // 2
+    limit = modulus >> _SLACK_BITS
+    common = 1
+    values = []
+    for residue in residues:
+        x = residue * common % modulus
+        if x > half:
+            x -= modulus
+        if abs(x) <= limit:
+            values.append(Fraction(x, common))
+            continue
+        fraction = rational_reconstruction(x, modulus)
+        if fraction is None:
+            return None
+        a, b = fraction
+        values.append(Fraction(a, b * common))
+        common *= b
+    return values
+
+
+def _lift(residues, modulus):
+    """Симметричный подъём вычетов; None, если какое-то число не короче модуля на _SLACK_BITS бит."""
+    half = modulus // 2
+    limit = modulus >> _SLACK_BITS
+    values = []
+    for x in residues:
+        if x > half:
+            x -= modulus
+        if abs(x) > limit:
+            return None
+        values.append(x)
+    return values
+
+
+def _matches(values, residues, p):
+    for value, residue in zip(values, residues):
+        denominator = value.denominator % p
+        if not denominator or value.numerator * pow(denominator, -1, p) % p != residue:
+            return False
+    return True
+
+
+def modular_reduce(matrix, on_prime=None):
+    """
+    Возвращает приведённый (методом Жордана-Гаусса) вид матрицы matrix из Fraction
+    (матрица не изменяется): ненулевые строки, затем нулевые – как у EquationSolver.reduce.
+    on_prime(p) вызывается для каждого использованного модуля.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for modular elimination.")
+    m = len(matrix)
+    if m == 0:
+        return []
+    n = len(matrix[0])
+
+    rows = to_integer_rows(matrix)
+    if all(-_INT64_LIMIT < x < _INT64_LIMIT for row in rows for x in row):
+        base = np.array(rows, dtype=np.int64).reshape(m, n)
+    else:
+        base = np.array(rows, dtype=object).reshape(m, n)
+
+    def residues_mod(part, p):
+        reduced = part % p
+        return reduced if reduced.dtype == np.int64 else reduced.astype(np.int64)
+
+    pivots = None       # ведущие столбцы P (по лучшему из модулей)
+    order = None        # ведущие строки S
+    block = None        # A_{S, P+F}
+    free = None
+    crt = []            # вычеты d и d·X (построчно) по модулю modulus
+    modulus = 1
+    count = 0           # число модулей в CRT
+    checkpoint = 1      # когда пробовать прямое восстановление X
+    candidate = None    # восстановленные элементы X
+    for p in primes():
+        if on_prime is not None:
+            on_prime(p)
+        if pivots is None or candidate is not None:
+            # Полное исключение: первый модуль или проверка кандидата
+            reduced = residues_mod(base, p)
+            found, found_order, det = _reduce_mod(reduced, p)
+            if pivots is None or _better(found, pivots):
+                pivots, order = found, found_order
+                free = [j for j in range(n) if j not in set(pivots)]
+                block = base[list(order)][:, list(pivots) + free]
+                crt, modulus, count, checkpoint, candidate = [], 1, 0, 1, None
+            elif found != pivots:
+                continue    # неудачный модуль
+            x = reduced[:len(pivots)][:, free]
+            if candidate is not None:
+                if _matches(candidate, x.ravel().tolist(), p):
+                    return _assemble(candidate, pivots, free, m, n)
+                candidate = None
+            if found_order != order:
+                continue    # другие ведущие строки – другой знаменатель d
+        else:
+            solved = _solve_block(residues_mod(block, p), p)
+            if solved is None:
+                continue
+            x, det = solved
+
+        values = [det] + (x * det % p).ravel().tolist()
+        if not crt:
+            crt = values
+        else:
+            inverse = pow(modulus % p, -1, p)
+            crt = [c + modulus * ((v - c % p) * inverse % p) for c, v in zip(crt, values)]
+        modulus *= p
+        count += 1
+
+        lifted = _lift(crt[:1], modulus)
+        if lifted is not None and lifted[0]:
+            lifted = _lift(crt, modulus)
+            if lifted is not None:
+                d = lifted[0]
+                candidate = [Fraction(value, d) for value in lifted[1:]]
+        if candidate is None and count >= checkpoint:
+            checkpoint = count + max(1, count // 4)
+            # d не делится ни на один модуль (иначе ведущий элемент был бы нулём)
+            inverse = pow(crt[0], -1, modulus)
+            candidate = _reconstruct([value * inverse % modulus for value in crt[1:]], modulus)
+
+
+def _assemble(values, pivots, free, m, n):
+    zero = Fraction(0)
+    one = Fraction(1)
+    width = len(free)
+    result = []
+    for i, col in enumerate(pivots):
+        row = [zero] * n
+        row[col] = one
+        for k, j in enumerate(free):
+            row[j] = values[i * width + k]
+        result.append(row)
+    for _ in range(m - len(pivots)):
+        result.append([zero] * n)
+    return result
@@ -0,0 +1,111 @@
+"""
+Исключение Жордана-Гаусса в C++ (GaussJordan/GaussJordan.cpp) через ctypes.
+
+C++-движок считает в дробях с 64-битными числителем и знаменателем и проверяет
+каждое действие на переполнение: если результат не помещается в 64 бита,
+reduce_native бросает OverflowError, и вызывающий код переходит на Fraction.
+
+Библиотека собирается один раз:
+    python -m acom.native
+(g++ или c++ из PATH; путь к готовой библиотеке можно задать переменной
+окружения ACOM_GAUSS_JORDAN_LIB).
+"""
+
+import ctypes
+import os
+import shutil
+import subprocess
+import sys
+
+from .fraction import Fraction
+
+SOURCE = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GaussJordan",
+                                      "GaussJordan.cpp"))
+LIBRARY = os.path.join(os.path.dirname(SOURCE),
+                       "gaussjordan.dll" if sys.platform == "win32" else "libgaussjordan.so")
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+_OVERFLOW = 1
+_library = None
+
+
+def library_path():
+    return os.environ.get("ACOM_GAUSS_JORDAN_LIB") or LIBRARY
+
+
+def build_library(compiler=None):
+    """Собирает разделяемую библиотеку из GaussJordan.cpp. Возвращает путь к ней."""
+    compiler = compiler or shutil.which("g++") or shutil.which("c++")
+    if compiler is None:
+        raise RuntimeError("No C++ compiler found (g++ or c++).")
+    subprocess.run([compiler, "-O2", "-shared", "-fPIC", "-DGAUSS_JORDAN_LIBRARY", SOURCE,
+                    "-o", LIBRARY], check=True)
+    return LIBRARY
+
+
+def load_library():
+    """Загружает библиотеку (один раз). ImportError, если она не собрана."""
+    global _library
+    if _library is None:
+        path = library_path()
+        if not os.path.exists(path):
+            raise ImportError(f"Native Gauss-Jordan library not found: {path} "
+                              f"(build it with 'python -m acom.native').")
+        library = ctypes.CDLL(path)
+        int64_array = ctypes.POINTER(ctypes.c_int64)
+        library.gj_reduce.argtypes = [int64_array, int64_array, ctypes.c_int, ctypes.c_int]
+        library.gj_reduce.restype = ctypes.c_int
+        _library = library
+    return _library
+
+
+def available():
+    try:
+        load_library()
+    except (ImportError, OSError):
+        return False
+    return True
+
+
+def reduce_native(matrix):
+    """
+    Приводит матрицу из Fraction (не изменяя её) в C++. Возвращает приведённую матрицу
+    (ненулевые строки, затем нулевые – как EquationSolver.reduce). OverflowError, если
+    исходные или промежуточные числа не помещаются в 64 бита.
+    """
+    library = load_library()
+    rows = len(matrix)
+    cols = len(matrix[0]) if rows else 0
+    if not rows or not cols:
+        return [list(row) for row in matrix]
+    size = rows * cols
+    flat_numerators = []
+    flat_denominators = []
+    for row in matrix:
+        for value in row:
+            if not (_INT64_MIN < value.numerator <= _INT64_MAX and value.denominator <= _INT64_MAX):
+                raise OverflowError("Matrix entry does not fit in 64 bits.")
+            flat_numerators.append(value.numerator)
+            flat_denominators.append(value.denominator)
+    numerators = (ctypes.c_int64 * size)(*flat_numerators)
+    denominators = (ctypes.c_int64 * size)(*flat_denominators)
+
+    status = library.gj_reduce(numerators, denominators, rows, cols)
+    if status == _OVERFLOW:
+        raise OverflowError("64-bit overflow in native Gauss-Jordan elimination.")
+    if status:
+        raise ValueError("Invalid matrix for native Gauss-Jordan elimination.")
+
+    cache = {}
+    values = []
+    for key in zip(numerators[:], denominators[:]):
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = Fraction._new(*key)
+        values.append(value)
+    return [values[i * cols:(i + 1) * cols] for i in range(rows)]
+
+
+if __name__ == "__main__":
+    print(build_library())
@@ -0,0 +1,34 @@
+"""
+Вывод крупными кусками.
+
+ChunkedWriter копит текст и передаёт его потоку, когда накопилось chunk_size
+символов: мелкие print (строка матрицы, строка трассировки) не превращаются
+в отдельные записи, а память под вывод ограничена одним куском, а не всей
+трассировкой решения.
+"""
+
+import sys
+
+
+class ChunkedWriter:
+    def __init__(self, stream=None, chunk_size=1 << 16):
+        """stream – куда писать (по умолчанию текущий sys.stdout, запоминается при создании)."""
+        self.stream = stream if stream is not None else sys.stdout
+        self.chunk_size = chunk_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.chunk_size:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        """Передаёт накопленный текст потоку."""
+        if self.parts:
+            self.stream.write("".join(self.parts))
+            self.parts.clear()
+            self.size = 0
+        self.stream.flush()
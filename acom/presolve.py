@@ -0,0 +1,302 @@
+"""
+Предварительная обработка (presolve) задач перед исключением и обратное
+восстановление (postsolve).
+
+presolve_system – для расширенной матрицы системы уравнений (GaussJordanBasic):
+  удаляет нулевые и повторяющиеся строки, фиксирует переменные из строк с одним
+  ненулевым коэффициентом (подставляя их значения в остальные строки), удаляет
+  нулевые столбцы и приводит строки к несократимому целочисленному виду.
+  postsolve восстанавливает приведённую матрицу исходной системы.
+
+presolve_tableau – для канонической симплекс-таблицы (DualSimplex):
+  удаляет пустые, повторяющиеся и избыточные строки, превращает строки
+  с одной переменной в верхние границы, удаляет нулевые столбцы и масштабирует
+  строки и столбцы. postsolve восстанавливает решение исходной задачи.
+"""
+
+import math
+
+from .fraction import Fraction
+
+
+def _primitive(values):
+    """
+    Множитель k > 0, при котором все values·k – целые числа без общего делителя.
+    Для нулевого набора возвращает 1.
+    """
+    scale = 1
+    for value in values:
+        if value.denominator != 1:
+            scale = math.lcm(scale, value.denominator)
+    common = 0
+    for value in values:
+        if value.numerator:
+            common = math.gcd(common, value.numerator * (scale // value.denominator))
+    return Fraction(scale, common) if common else Fraction(1)
+
+
+# =========================
+# Системы линейных уравнений
+# =========================
+
+class SystemPresolve:
+    def __init__(self, width):
+        self.width = width          # число столбцов исходной матрицы (со свободными членами)
+        self.columns = []           # исходные номера оставленных столбцов переменных
+        self.fixed = {}             # переменная -> значение
+        self.removed_rows = 0
+        self.infeasible = False
+        self.matrix = []            # сокращённая матрица: столбцы self.columns и свободные члены
+
+    def postsolve(self, reduced):
+        """
+        По приведённой (методом Жордана-Гаусса) сокращённой матрице строит приведённую
+        матрицу исходной системы: возвращает удалённые столбцы и строки фиксированных
+        переменных и упорядочивает строки по ведущему столбцу.
+        """
+        zero = Fraction(0)
+        if self.infeasible:
+            return [[zero] * (self.width - 1) + [Fraction(1)]]
+
+        rows = []
+        for row in reduced:
+            full = [zero] * self.width
+            for k, j in enumerate(self.columns):
+                full[j] = row[k]
+            full[-1] = row[-1]
+            rows.append(full)
+        for j, value in self.fixed.items():
+            full = [zero] * self.width
+            full[j] = Fraction(1)
+            full[-1] = value
+            rows.append(full)
+
+        def leading(row):
+            return next((j for j, x in enumerate(row) if x), self.width)
+
+        rows.sort(key=leading)
+        return rows
+
+
+def presolve_system(matrix):
+    """Сокращает расширенную матрицу matrix (не изменяя её). Возвращает SystemPresolve."""
+    width = len(matrix[0])
+    variables = width - 1
+    result = SystemPresolve(width)
+    rows = [list(row) for row in matrix]
+
+    while True:
+        # Несократимый вид, знак – по первому ненулевому коэффициенту
+        unique = []
+        seen = {}
+        for row in rows:
+            nonzero = [j for j in range(variables) if row[j]]
+            if not nonzero:
+                if row[-1]:
+                    result.infeasible = True
+                    return result
+                result.removed_rows += 1
+                continue
+            scale = _primitive(row)
+            if row[nonzero[0]] < 0:
+                scale = -scale
+            if scale != 1:
+                row = [x * scale for x in row]
+            key = tuple(row[:variables])
+            if key in seen:
+                if seen[key] != row[-1]:
+                    result.infeasible = True
+                    return result
+                result.removed_rows += 1
+                continue
+            seen[key] = row[-1]
+            unique.append(row)
+        rows = unique
+
+        # Строка с одной переменной фиксирует её значение
+        singleton = next((i for i, row in enumerate(rows)
+                          if sum(1 for j in range(variables) if row[j]) == 1), -1)
+        if singleton == -1:
+            break
+        row = rows.pop(singleton)
+        result.removed_rows += 1
+        j = next(j for j in range(variables) if row[j])
+        value = row[-1] / row[j]
+        result.fixed[j] = value
+        for other in rows:
+            if other[j]:
+                other[-1] = other[-1] - other[j] * value
+                other[j] = Fraction(0)
+
+    result.columns = [j for j in range(variables) if any(row[j] for row in rows)]
+    result.matrix = [[row[j] for j in result.columns] + [row[-1]] for row in rows]
+    return result
+
+
+# =========================
+# Симплекс-таблицы
+# =========================
+
+class TableauPresolve:
+    def __init__(self, tableau, basic_indices):
+        self.original = tableau
+        self.original_basis = list(basic_indices)
+        self.rows = []              # номера оставленных ограничений (с нуля)
+        self.columns = []           # исходные номера оставленных столбцов
+        self.scale = {}             # столбец -> k, где x'_j = k·x_j
+        self.upper_bounds = {}      # номер столбца в сокращённой таблице -> верхняя граница
+        self.infeasible = False
+        self.tableau = None
+        self.basic_indices = None
+
+    def postsolve(self, solution):
+        """
+        По решению сокращённой задачи возвращает решение исходной: удалённые столбцы
+        равны нулю, масштаб снимается, дополнительные переменные удалённых строк
+        вычисляются из исходных ограничений.
+        """
+        n = len(self.original[0]) - 1
+        x = [Fraction(0)] * n
+        for k, j in enumerate(self.columns):
+            x[j] = solution[k] / self.scale.get(j, 1) if solution[k] else solution[k]
+        kept = set(self.rows)
+        for i, slack in enumerate(self.original_basis):
+            if i in kept:
+                continue
+            row = self.original[i + 1]
+            value = row[-1]
+            for j in range(n):
+                if j != slack and row[j] and x[j]:
+                    value = value - row[j] * x[j]
+            x[slack] = value
+        return x
+
+
+def _is_canonical(tableau, basic_indices):
+    for i, col in enumerate(basic_indices):
+        if tableau[0][col]:
+            return False
+        for k in range(1, len(tableau)):
+            if tableau[k][col] != (1 if k == i + 1 else 0):
+                return False
+    return True
+
+
+def presolve_tableau(tableau, basic_indices):
+    """
+    Сокращает каноническую таблицу (базисные столбцы – единичная матрица, в строке
+    целевой функции в них нули). Ограничение i: a_i·x + s_i = b_i, s_i >= 0, т.е. a_i·x <= b_i.
+    Для неканонической таблицы сокращений нет, только копирование.
+    Исходная таблица не изменяется. Возвращает TableauPresolve.
+    """
+    m = len(tableau) - 1
+    n = len(tableau[0]) - 1
+    result = TableauPresolve(tableau, basic_indices)
+    rows = {i: list(tableau[i + 1]) for i in range(m)}
+    slack_of = dict(enumerate(basic_indices))
+    slacks = set(basic_indices)
+    removed_columns = set()
+    upper = {}
+
+    if _is_canonical(tableau, basic_indices):
+        changed = True
+        while changed:
+            changed = False
+            seen = {}
+            for i in list(rows):
+                row = rows[i]
+                own = slack_of[i]
+                structural = [j for j in range(n) if row[j] and j != own and j not in removed_columns]
+                b = row[-1]
+                if not structural:
+                    # 0 <= b: строка лишняя или задача недопустима
+                    if b < 0:
+                        result.infeasible = True
+                        return result
+                    del rows[i]
+                    removed_columns.add(own)
+                    changed = True
+                    continue
+                if len(structural) == 1 and structural[0] not in slacks:
+                    j = structural[0]
+                    a = row[j]
+                    if a < 0 and b >= 0:
+                        # x_j >= b / a <= 0 – следует из x_j >= 0
+                        del rows[i]
+                        removed_columns.add(own)
+                        changed = True
+                        continue
+                    if a > 0:
+                        if b < 0:
+                            result.infeasible = True
+                            return result
+                        bound = b / a
+                        if j not in upper or bound < upper[j]:
+                            upper[j] = bound
+                        del rows[i]
+                        removed_columns.add(own)
+                        changed = True
+                        continue
+                # Повторяющиеся строки: одинаковые с точностью до положительного множителя
+                scale = _primitive([row[j] for j in structural])
+                key = tuple((j, row[j] * scale) for j in structural)
+                rhs = b * scale
+                if key in seen:
+                    other, other_rhs = seen[key]
+                    drop = i if rhs >= other_rhs else other
+                    if drop == other:
+                        seen[key] = (i, rhs)
+                    del rows[drop]
+                    removed_columns.add(slack_of[drop])
+                    changed = True
+                    continue
+                seen[key] = (i, rhs)
+
+            # Нулевые столбцы при неотрицательной оценке: x_j = 0 в оптимуме
+            for j in range(n):
+                if j in removed_columns or j in slacks:
+                    continue
+                if tableau[0][j] >= 0 and not any(row[j] for row in rows.values()):
+                    removed_columns.add(j)
+                    upper.pop(j, None)
+                    changed = True
+
+    result.rows = sorted(rows)
+    result.columns = [j for j in range(n) if j not in removed_columns]
+
+    # Масштабирование строк: целые несократимые коэффициенты; дополнительная переменная
+    # строки масштабируется вместе с ней, чтобы её столбец остался единичным
+    for i in result.rows:
+        row = rows[i]
+        own = slack_of[i]
+        scale = _primitive([row[j] for j in result.columns if j != own] + [row[-1]])
+        if scale != 1:
+            rows[i] = [x * scale if j != own else x for j, x in enumerate(row)]
+            result.scale[own] = scale
+
+    # Масштабирование столбцов: деление на НОД целых элементов (вместе со строкой оценок)
+    objective = list(tableau[0])
+    for j in result.columns:
+        if j in slacks:
+            continue
+        entries = [objective[j]] + [rows[i][j] for i in result.rows]
+        if any(x.denominator != 1 for x in entries):
+            continue
+        common = 0
+        for x in entries:
+            common = math.gcd(common, x.numerator)
+        if common > 1:
+            for i in result.rows:
+                rows[i][j] = rows[i][j] / common
+            objective[j] = objective[j] / common
+            result.scale[j] = Fraction(common)
+            if j in upper:
+                upper[j] = upper[j] * common
+
+    position = {j: k for k, j in enumerate(result.columns)}
+    result.tableau = [[objective[j] for j in result.columns] + [objective[-1]]]
+    for i in result.rows:
+        result.tableau.append([rows[i][j] for j in result.columns] + [rows[i][-1]])
+    result.basic_indices = [position[slack_of[i]] for i in result.rows]
+    result.upper_bounds = {position[j]: value for j, value in upper.items() if j in position}
+    return result
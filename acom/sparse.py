@@ -0,0 +1,108 @@
+"""
+Разреженное хранение матриц (симплекс-таблиц и расширенных матриц систем).
+
+Каждая строка – словарь {столбец: значение} только с ненулевыми элементами.
+Дополнительно для каждого столбца хранится множество строк, где он ненулевой,
+поэтому при повороте обрабатываются только строки с ненулевым элементом
+в опорном столбце, а вычитание идёт только по ненулевым элементам опорной строки.
+Счётчик fill_in показывает, сколько нулей стало ненулями за всё время.
+"""
+
+from .fraction import Fraction
+
+
+class SparseMatrix:
+    def __init__(self, rows, ncols):
+        """rows – список словарей {столбец: значение}; нули в них не хранятся."""
+        self.rows = [{j: v for j, v in row.items() if v} for row in rows]
+        self.ncols = ncols
+        self.cols = [set() for _ in range(ncols)]
+        for i, row in enumerate(self.rows):
+            for j in row:
+                self.cols[j].add(i)
+        self.fill_in = 0
+
+    @classmethod
+    def from_dense(cls, dense):
+        ncols = len(dense[0]) if dense else 0
+        return cls([{j: v for j, v in enumerate(row) if v} for row in dense], ncols)
+
+    def to_dense(self):
+        return list(self.iter_dense_rows())
+
+    def iter_dense_rows(self):
+        """Строки в плотном виде по одной (например, для вывода без плотной копии всей матрицы)."""
+        zero = Fraction(0)
+        for row in self.rows:
+            values = [zero] * self.ncols
+            for j, v in row.items():
+                values[j] = v
+            yield values
+
+    @property
+    def nrows(self):
+        return len(self.rows)
+
+    def nnz(self):
+        """Число ненулевых элементов."""
+        return sum(len(row) for row in self.rows)
+
+    def get(self, i, j):
+        return self.rows[i].get(j, Fraction(0))
+
+    def column_rows(self, j):
+        """Номера строк с ненулевым элементом в столбце j."""
+        return self.cols[j]
+
+    def swap_rows(self, i, k):
+        if i == k:
+            return
+        ri, rk = self.rows[i], self.rows[k]
+        for j in ri:
+            if j not in rk:
+                self.cols[j].discard(i)
+                self.cols[j].add(k)
+        for j in rk:
+            if j not in ri:
+                self.cols[j].discard(k)
+                self.cols[j].add(i)
+        self.rows[i], self.rows[k] = rk, ri
+
+    def delete_row(self, i):
+        """Удаляет строку i; номера следующих строк уменьшаются на 1."""
+        del self.rows[i]
+        for j in range(self.ncols):
+            column = self.cols[j]
+            if any(k >= i for k in column):
+                self.cols[j] = {k - 1 if k > i else k for k in column if k != i}
+
+    def divide_row(self, i, value):
+        row = self.rows[i]
+        for j in row:
+            row[j] = row[j] / value
+
+    def subtract_row(self, target, source, factor):
+        """target -= factor * source (только по ненулевым элементам source)."""
+        row = self.rows[target]
+        for j, v in self.rows[source].items():
+            old = row.get(j)
+            if old is None:
+                row[j] = -(v * factor)
+                self.cols[j].add(target)
+                self.fill_in += 1
+            else:
+                new = old - v * factor
+                if new:
+                    row[j] = new
+                else:
+                    del row[j]
+                    self.cols[j].discard(target)
+
+    def pivot(self, r, c):
+        """Делит строку r на элемент (r, c) и обнуляет столбец c во всех остальных строках."""
+        value = self.rows[r][c]
+        if value != 1:
+            self.divide_row(r, value)
+        for i in list(self.cols[c]):
+            if i != r:
+                self.subtract_row(i, r, self.rows[i][c])
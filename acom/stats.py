@@ -0,0 +1,168 @@
+"""
+Статистика решения (профилирование): число итераций, время по этапам, число
+созданных дробей и рост числителей и знаменателей по итерациям.
+
+Сбор включается явно: решатели принимают stats=None и без объекта SolveStats
+выполняют лишь одну проверку на поворот. Подсчёт дробей подменяет конструкторы
+Fraction (Fraction() и Fraction._new), пока открыт хотя бы один блок
+track_fractions(), поэтому вне блоков арифметика дробей не замедляется. Какие
+SolveStats считать, хранится в contextvars.ContextVar: дроби учитываются только
+в том потоке (и контексте asyncio), где открыт блок, так что одновременные и
+вложенные блоки в разных потоках не смешивают счётчики. Дроби, созданные
+в других потоках и в дочерних процессах (параллельный перебор), не учитываются.
+
+Пример:
+    stats = SolveStats()
+    with track_fractions(stats):
+        dual_simplex(tableau, basic_indices, stats=stats)
+    print(stats.render())
+"""
+
+import contextlib
+import contextvars
+import threading
+import time
+
+from .fraction import Fraction
+
+
+class SolveStats:
+    def __init__(self, on_iteration=None):
+        self.iterations = 0
+        self.phases = {}            # этап -> суммарное время в секундах
+        self.fractions = 0          # число созданных объектов Fraction
+        self.growth = []            # по итерациям: (битов числителя, битов знаменателя) – максимумы
+        # on_iteration(iteration, numerator_bits, denominator_bits) – после каждой итерации
+        self.on_iteration = on_iteration
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Добавляет время выполнения блока к этапу name."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def record(self, rows, divisor=1):
+        """
+        Отмечает итерацию и максимальную длину (в битах) числителей и знаменателей матрицы.
+        rows – плотные строки или словари {столбец: значение}; элементы – Fraction или int.
+        divisor – общий знаменатель целочисленной матрицы (исключение Барейса).
+        """
+        numerator_bits = 0
+        denominator_bits = divisor.bit_length()
+        for row in rows:
+            for value in (row.values() if isinstance(row, dict) else row):
+                bits = value.numerator.bit_length()
+                if bits > numerator_bits:
+                    numerator_bits = bits
+                bits = value.denominator.bit_length()
+                if bits > denominator_bits:
+                    denominator_bits = bits
+        self.iterations += 1
+        self.growth.append((numerator_bits, denominator_bits))
+        if self.on_iteration is not None:
+            self.on_iteration(self.iterations, numerator_bits, denominator_bits)
+
+    @property
+    def max_numerator_bits(self):
+        return max((bits for bits, _ in self.growth), default=0)
+
+    @property
+    def max_denominator_bits(self):
+        return max((bits for _, bits in self.growth), default=0)
+
+    def to_dict(self):
+        """Словарь для JSON."""
+        return {
+            "iterations": self.iterations,
+            "phases": dict(self.phases),
+            "fractions": self.fractions,
+            "max_numerator_bits": self.max_numerator_bits,
+            "max_denominator_bits": self.max_denominator_bits,
+            "growth": [list(bits) for bits in self.growth],
+        }
+
+    def render(self):
+        """Краткий отчёт: итерации, время этапов, дроби и рост коэффициентов."""
+        lines = [f"Iterations: {self.iterations}"]
+        for name, seconds in self.phases.items():
+            lines.append(f"Phase {name}: {seconds * 1000:.3f} ms")
+        lines.append(f"Fractions created: {self.fractions}")
+        lines.append(f"Max bits: numerator {self.max_numerator_bits}, "
+                     f"denominator {self.max_denominator_bits}")
+        if self.growth:
+            lines.append("Bits per iteration (numerator/denominator): "
+                         + " ".join(f"{n}/{d}" for n, d in self.growth))
+        return "\n".join(lines)
+
+
+def timed(stats, name):
+    """stats.phase(name) или пустой контекст, если статистика не собирается."""
+    return contextlib.nullcontext() if stats is None else stats.phase(name)
+
+
+# -------------------------
+# Подсчёт созданных дробей
+# -------------------------
+
+_active = contextvars.ContextVar("acom_tracked_stats", default=())  # SolveStats текущего контекста
+_lock = threading.Lock()    # защищает _users и подмену конструкторов
+_users = 0                  # число открытых блоков track_fractions() во всех потоках
+_saved = None               # исходные Fraction._new и Fraction.__init__
+
+
+def _install():
+    global _saved
+    new = Fraction.__dict__["_new"]
+    init = Fraction.__init__
+    _saved = (new, init)
+    create = new.__func__
+    active = _active.get
+
+    def counted_new(cls, numerator, denominator):
+        for stats in active():
+            stats.fractions += 1
+        return create(cls, numerator, denominator)
+
+    def counted_init(self, numerator=0, denominator=1):
+        for stats in active():
+            stats.fractions += 1
+        init(self, numerator, denominator)
+
+    Fraction._new = classmethod(counted_new)
+    Fraction.__init__ = counted_init
+
+
+def _uninstall():
+    global _saved
+    Fraction._new, Fraction.__init__ = _saved
+    _saved = None
+
+
+@contextlib.contextmanager
+def track_fractions(stats):
+    """
+    Считает дроби, созданные внутри блока в текущем потоке, в stats.fractions.
+    Вложенные блоки с тем же stats не считают дважды; stats=None – пустой контекст.
+    """
+    global _users
+    if stats is None or any(active is stats for active in _active.get()):
+        yield
+        return
+    with _lock:
+        if not _users:
+            _install()
+        _users += 1
+    _active.set(_active.get() + (stats,))
+    try:
+        yield
+    finally:
+        # Убираем именно stats (а не восстанавливаем по токену): блоки в одном
+        # контексте могут закрываться не в порядке открытия (генераторы).
+        _active.set(tuple(active for active in _active.get() if active is not stats))
+        with _lock:
+            _users -= 1
+            if not _users:
+                _uninstall()
@@ -0,0 +1,255 @@
+"""
+Замеры производительности решателей ACOM на сгенерированных задачах (acom.generators).
+
+Замеряются:
+  dual_simplex – полное решение таблицы (DualSimplex/test.py);
+  pivot        – один поворот таблицы (pivot);
+  reduce       – приведение матрицы системы (EquationSolver.reduce_matrix);
+  solve        – EquationSolver.solve целиком, с форматированием вывода (вывод отбрасывается);
+  enumerate    – перебор базисных решений (iter_basic_solutions) после приведения.
+
+Результаты пишутся в JSON (--output) и могут сравниваться с прошлым запуском (--compare).
+Пример:
+    python benchmarks/bench.py --sizes 5 10 20 --repeat 3 --output bench.json
+    python benchmarks/bench.py --compare bench.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import importlib.util
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from acom.generators import KINDS, linear_system, lp_tableau
+
+BENCHMARKS = ("dual_simplex", "pivot", "reduce", "solve", "enumerate")
+
+
+def _load(name, relative):
+    """Загружает скрипт решателя как модуль (у них нет пакета)."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relative))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+dual = _load("dual_simplex_script", os.path.join("DualSimplex", "test.py"))
+gauss = _load("gauss_jordan_script", os.path.join("GaussJordanBasic", "main.py"))
+
+
+def _copy(matrix):
+    # Дроби не изменяются на месте, поэтому достаточно копировать строки
+    return [list(row) for row in matrix]
+
+
+def _measure(prepare, run, repeat):
+    """Вызывает run(prepare()) repeat раз; подготовка не входит в замер. Возвращает (времена, результат)."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        state = prepare()
+        started = time.perf_counter()
+        result = run(state)
+        times.append(time.perf_counter() - started)
+    return times, result
+
+
+def bench_dual_simplex(size, kind, seed, repeat, options):
+    tableau, basis = lp_tableau(size, size, seed, kind)
+
+    def run(state):
+        pivots = [0]
+
+        def count(iteration, *_):
+            pivots[0] = iteration
+
+        try:
+            dual.dual_simplex(state[0], state[1], on_pivot=count)
+            status = "optimal"
+        except dual.InfeasibleError:
+            status = "infeasible"
+        return {"status": status, "pivots": pivots[0]}
+
+    times, info = _measure(lambda: (_copy(tableau), list(basis)), run, repeat)
+    return {"m": size, "n": size, "times": times, **info}
+
+
+def bench_pivot(size, kind, seed, repeat, options):
+    tableau, basis = lp_tableau(size, size, seed, kind)
+    r = next((i for i in range(1, size + 1) if tableau[i][-1] < 0), 1)
+    col = next(j for j in range(size) if tableau[r][j])
+    times, _ = _measure(lambda: (_copy(tableau), list(basis)),
+                        lambda state: dual.pivot(state[0], state[1], r, col), repeat)
+    return {"m": size, "n": size, "times": times}
+
+
+def _system(size, kind, seed):
+    # Переменных на 4 больше, чем уравнений: число сочетаний растёт умеренно
+    return linear_system(size, size + 4, seed, kind)
+
+
+def _combinations(matrix):
+    solver = gauss.EquationSolver(matrix=matrix, verbose=False)
+    solver.reduce_matrix()
+    rank = sum(1 for row in solver.matrix if any(row))
+    return math.comb(len(matrix[0]) - 1, rank)
+
+
+def bench_reduce(size, kind, seed, repeat, options):
+    matrix = _system(size, kind, seed)
+    times, _ = _measure(lambda: gauss.EquationSolver(matrix=matrix, verbose=False,
+                                                     **options["solver"]),
+                        lambda solver: solver.reduce_matrix(), repeat)
+    return {"m": size, "n": size + 4, "times": times}
+
+
+def bench_solve(size, kind, seed, repeat, options):
+    matrix = _system(size, kind, seed)
+    combinations = _combinations(matrix)
+    if combinations > options["max_combinations"]:
+        return {"m": size, "n": size + 4, "skipped": f"{combinations} combinations"}
+
+    def run(solver):
+        with contextlib.redirect_stdout(io.StringIO()):
+            solver.solve()
+
+    times, _ = _measure(lambda: gauss.EquationSolver(matrix=matrix, **options["solver"]), run, repeat)
+    return {"m": size, "n": size + 4, "times": times, "combinations": combinations}
+
+
+def bench_enumerate(size, kind, seed, repeat, options):
+    matrix = _system(size, kind, seed)
+    combinations = _combinations(matrix)
+    if combinations > options["max_combinations"]:
+        return {"m": size, "n": size + 4, "skipped": f"{combinations} combinations"}
+
+    def prepare():
+        solver = gauss.EquationSolver(matrix=matrix, verbose=False, **options["solver"])
+        solver.reduce_matrix()
+        return solver
+
+    times, count = _measure(
+        prepare, lambda solver: sum(1 for _ in solver.iter_basic_solutions(include_dependent=True)),
+        repeat)
+    return {"m": size, "n": size + 4, "times": times, "combinations": count}
+
+
+RUNNERS = {
+    "dual_simplex": bench_dual_simplex,
+    "pivot": bench_pivot,
+    "reduce": bench_reduce,
+    "solve": bench_solve,
+    "enumerate": bench_enumerate,
+}
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(benchmarks, kinds, sizes, seed=0, repeat=3, max_combinations=5000, solver=None):
+    """Запускает замеры и возвращает словарь для JSON (метаданные и список записей)."""
+    options = {"max_combinations": max_combinations, "solver": solver or {}}
+    results = []
+    for name in benchmarks:
+        for kind in kinds:
+            for size in sizes:
+                record = {"benchmark": name, "kind": kind, "seed": seed}
+                record.update(RUNNERS[name](size, kind, seed, repeat, options))
+                if "times" in record:
+                    record["min"] = min(record["times"])
+                    record["median"] = statistics.median(record["times"])
+                results.append(record)
+                _print_record(record)
+    return {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "solver_options": options["solver"],
+        "results": results,
+    }
+
+
+def _key(record):
+    return record["benchmark"], record["kind"], record["m"], record["n"], record["seed"]
+
+
+def _print_record(record, baseline=None):
+    size = f"{record['m']}x{record['n']}"
+    line = f"{record['benchmark']:<13}{record['kind']:<17}{size:>8}"
+    if "skipped" in record:
+        print(f"{line}   skipped ({record['skipped']})")
+        return
+    line += f"{record['min'] * 1000:>12.3f} ms{record['median'] * 1000:>12.3f} ms"
+    if baseline is not None and baseline.get("min"):
+        line += f"   x{baseline['min'] / record['min']:.2f} vs baseline"
+    print(line)
+
+
+def compare(current, baseline):
+    """Печатает ускорение относительно прошлого запуска (по минимальному времени)."""
+    previous = {_key(record): record for record in baseline["results"]}
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} ({baseline.get('created', '?')}):")
+    for record in current["results"]:
+        _print_record(record, previous.get(_key(record)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for the ACOM solvers.")
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=list(KINDS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[5, 10, 20],
+                        help="number of constraints/equations")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-combinations", type=int, default=5000,
+                        help="skip solve/enumerate when there are more basis combinations")
+    parser.add_argument("--sparse", action="store_true", help="EquationSolver with sparse elimination")
+    parser.add_argument("--bareiss", action="store_true", help="EquationSolver with Bareiss elimination")
+    parser.add_argument("--modular", action="store_true", help="EquationSolver with multi-prime elimination")
+    parser.add_argument("--native", action="store_true",
+                        help="EquationSolver with the C++ engine (python -m acom.native)")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare with")
+    args = parser.parse_args()
+
+    solver = {}
+    if args.sparse:
+        solver["sparse"] = True
+    if args.bareiss:
+        solver["bareiss"] = True
+    if args.modular:
+        solver["modular"] = True
+    if args.native:
+        solver["native"] = True
+
+    print(f"{'benchmark':<13}{'kind':<17}{'size':>8}{'min':>15}{'median':>15}")
+    report = run_benchmarks(args.benchmarks, args.kinds, args.sizes, seed=args.seed, repeat=args.repeat,
+                            max_combinations=args.max_combinations, solver=solver)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
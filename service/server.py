@@ -0,0 +1,298 @@
+"""
+Сервис решателей ACOM: долгоживущий процесс, который принимает задачи строками JSON.
+
+Решатели загружаются один раз, поэтому задача не платит за запуск интерпретатора,
+импорт и разбор аргументов. Запросы читаются асинхронно (asyncio), решаются
+в пуле процессов (ProcessPoolExecutor) параллельно, а ответы и ход решения
+отправляются по мере готовности, в порядке завершения, а не поступления.
+
+Запуск:
+    python service/server.py                        # запросы из stdin, ответы в stdout
+    python service/server.py --socket /tmp/acom.sock --workers 4
+
+Запрос – объект JSON в одной строке:
+    {"id": 1, "type": "lp", "tableau": [[1, 2, 0, 0, 0], ["-1", "-1/2", 1, 0, "-3"], ...]}
+    {"id": 2, "type": "system", "matrix": "1 2 3\\n4 5 6", "progress": true}
+    {"id": 3, "type": "system", "file": "GaussJordanBasic/input.txt", "basic_solutions": false}
+Ответы:
+    {"id": 2, "event": "progress", "phase": "reduce", "iteration": 1, ...}
+    {"id": 1, "event": "result", "result": {... LPResult.to_dict() ...}}
+    {"id": 3, "event": "error", "message": "..."}
+Протокол описан в service/guide.md.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import importlib.util
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import stat
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from acom.cache import ResultCache
+from acom.matrix_io import parse_matrix, read_matrix
+from acom.stats import SolveStats
+
+LINE_LIMIT = 1 << 28    # наибольшая длина строки запроса из сокета (байт)
+
+
+def _load(name, relative):
+    """Загружает скрипт решателя как модуль (у них нет пакета)."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relative))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+dual = _load("dual_simplex_script", os.path.join("DualSimplex", "test.py"))
+gauss = _load("gauss_jordan_script", os.path.join("GaussJordanBasic", "main.py"))
+
+
+# -------------------------
+# Процесс-исполнитель
+# -------------------------
+
+_progress = None    # очередь событий хода решения: (номер задачи, словарь)
+_cache = None       # acom.cache.ResultCache процесса (общий каталог на диске)
+
+
+def _init_worker(progress, cache_dir, cache_size):
+    global _progress, _cache
+    _progress = progress
+    if cache_dir:
+        _cache = ResultCache(directory=cache_dir, max_disk_entries=cache_size)
+
+
+def _read_input(request, key):
+    """Матрица задачи: request[key] (текст или список строк) или файл request["file"]."""
+    if "file" in request:
+        matrix = read_matrix(request["file"])
+    else:
+        value = request.get(key)
+        if value is None:
+            raise ValueError(f"Request needs '{key}' or 'file'.")
+        if isinstance(value, str):
+            matrix = parse_matrix(value)
+        else:
+            matrix = parse_matrix(" ".join(str(x) for x in row) for row in value)
+    if not matrix or len({len(row) for row in matrix}) != 1:
+        raise ValueError("Matrix must be non-empty with rows of equal length.")
+    return matrix
+
+
+def _report(token, event):
+    _progress.put((token, event))
+
+
+def _solve_lp(token, request):
+    tableau = _read_input(request, "tableau")
+    pricing = request.get("pricing", "dantzig")
+    if pricing not in dual.PRICING_RULES:
+        raise ValueError(f"Unknown pricing rule: {pricing!r}.")
+
+    on_pivot = None
+    if request.get("progress"):
+        def on_pivot(iteration, r, entering, leaving, current):
+            _report(token, {"iteration": iteration, "row": r, "entering": entering,
+                            "leaving": leaving, "objective": str(current[0][-1])})
+
+    result = dual.solve_lp(tableau, name=str(request.get("name", "")),
+                           pricing=dual.PRICING_RULES[pricing](),
+                           max_iterations=request.get("max_iterations"),
+                           time_limit=request.get("time_limit"), trace=bool(request.get("trace")),
+                           on_pivot=on_pivot, cache=_cache)
+    return result.to_dict()
+
+
+def _solve_system(token, request):
+    stats = None
+    if request.get("progress"):
+        stats = SolveStats(on_iteration=lambda iteration, numerator_bits, denominator_bits: _report(
+            token, {"phase": "reduce", "iteration": iteration, "numerator_bits": numerator_bits,
+                    "denominator_bits": denominator_bits}))
+    solver = gauss.EquationSolver(matrix=_read_input(request, "matrix"), verbose=False,
+                                  sparse=bool(request.get("sparse")), bareiss=bool(request.get("bareiss")),
+                                  modular=bool(request.get("modular")), native=bool(request.get("native")),
+                                  presolve=bool(request.get("presolve")), stats=stats, cache=_cache)
+    result = solver.analyze(basic_solutions=request.get("basic_solutions", True),
+                            nonnegative=bool(request.get("nonnegative")),
+                            max_results=request.get("max_results"))
+    return result.to_dict()
+
+
+def run_job(token, request):
+    """Решает одну задачу в процессе-исполнителе и возвращает словарь результата."""
+    # stdout процесса может быть каналом ответов (режим stdin/stdout): случайный вывод – в stderr
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            kind = request.get("type")
+            if kind == "lp":
+                return _solve_lp(token, request)
+            if kind == "system":
+                return _solve_system(token, request)
+            raise ValueError(f"Unknown job type: {kind!r} (expected 'lp' or 'system').")
+    finally:
+        # Метка конца задачи: все её события уже в очереди (очередь одного процесса упорядочена)
+        _report(token, None)
+
+
+# -------------------------
+# Цикл событий
+# -------------------------
+
+class SolverService:
+    def __init__(self, workers=None, cache_dir=None, cache_size=1024):
+        # Исполнители запускаются по мере надобности; при fork они унаследовали бы сокеты
+        # открытых соединений, и клиент не видел бы их закрытия, пока жив исполнитель.
+        # Поэтому на POSIX исполнители порождаются чистым процессом forkserver.
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+        self.progress = context.Queue()
+        self.pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker,
+            initargs=(self.progress, cache_dir, cache_size))
+        self.jobs = {}      # номер задачи -> (send, id запроса, asyncio.Event конца событий)
+        self.tokens = itertools.count()
+
+    async def pump_progress(self):
+        """Пересылает события хода решения из очереди исполнителей отправителям задач."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self.progress.get)
+            if item is None:
+                return
+            token, event = item
+            job = self.jobs.get(token)
+            if job is None:
+                continue
+            send, request_id, finished = job
+            if event is None:
+                finished.set()
+            else:
+                await send({"id": request_id, "event": "progress", **event})
+
+    async def submit(self, request, send):
+        request_id = request.get("id")
+        token = next(self.tokens)
+        finished = asyncio.Event()
+        self.jobs[token] = (send, request_id, finished)
+        loop = asyncio.get_running_loop()
+        try:
+            try:
+                result = await loop.run_in_executor(self.pool, run_job, token, request)
+            except concurrent.futures.BrokenExecutor as e:
+                # Исполнитель завершился аварийно: метки конца не будет
+                message = {"id": request_id, "event": "error", "message": str(e)}
+            except Exception as e:
+                await finished.wait()
+                message = {"id": request_id, "event": "error", "message": str(e) or type(e).__name__}
+            else:
+                # Результат отправляется после всех событий хода решения этой задачи
+                await finished.wait()
+                message = {"id": request_id, "event": "result", "result": result}
+        finally:
+            del self.jobs[token]
+        await send(message)
+
+    async def handle(self, readline, send):
+        """Читает запросы до конца потока; каждая задача решается отдельно, ответы – по готовности."""
+        tasks = set()
+        while True:
+            line = await readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                await send({"id": None, "event": "error", "message": f"Invalid request: {e}"})
+                continue
+            task = asyncio.create_task(self.submit(request, send))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def close(self):
+        self.progress.put(None)
+        self.pool.shutdown()
+
+
+def _stream_sender(writer):
+    lock = asyncio.Lock()
+
+    async def send(message):
+        async with lock:
+            writer.write((json.dumps(message, ensure_ascii=False) + "\n").encode())
+            await writer.drain()
+
+    return send
+
+
+async def _stdout_send(message):
+    sys.stdout.write(json.dumps(message, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+async def serve(socket_path=None, workers=None, cache_dir=None, cache_size=1024):
+    service = SolverService(workers, cache_dir, cache_size)
+    pump = asyncio.create_task(service.pump_progress())
+    loop = asyncio.get_running_loop()
+    try:
+        if socket_path is None:
+            # stdin читается в потоке: так работают и каналы, и перенаправленные файлы
+            async def readline():
+                return await loop.run_in_executor(None, sys.stdin.buffer.readline)
+
+            await service.handle(readline, _stdout_send)
+        else:
+            async def client(reader, writer):
+                try:
+                    await service.handle(reader.readline, _stream_sender(writer))
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    pass
+                finally:
+                    writer.close()
+
+            if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                os.unlink(socket_path)
+            server = await asyncio.start_unix_server(client, socket_path, limit=LINE_LIMIT)
+            stop = asyncio.Event()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signum, stop.set)
+            async with server:
+                await stop.wait()
+            os.unlink(socket_path)
+    finally:
+        service.close()
+        await pump
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ACOM solver service: JSON-lines jobs (LP and linear "
+                                                 "systems) over stdin/stdout or a Unix socket.")
+    parser.add_argument("--socket", metavar="PATH", default=None,
+                        help="listen on a Unix socket instead of stdin/stdout")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="solver processes (default: number of CPUs)")
+    parser.add_argument("--cache", metavar="DIR", default=None,
+                        help="share a result cache (acom.cache) in DIR between workers and runs")
+    parser.add_argument("--cache-size", type=int, default=1024,
+                        help="with --cache, keep at most N results on disk")
+    args = parser.parse_args()
+    asyncio.run(serve(args.socket, args.workers, args.cache, args.cache_size))
+
+
+if __name__ == "__main__":
+    main()
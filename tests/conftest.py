@@ -0,0 +1,32 @@
+"""
+Общие фикстуры тестов: скрипты решателей загружаются как модули (у них нет пакета),
+как в benchmarks/bench.py. Генераторы задач – в tests/helpers.py.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+
+def _load(name, relative):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relative))
+    module = importlib.util.module_from_spec(spec)
+    # Под своим именем в sys.modules функции скрипта передаются пулу процессов (enumerate_bases_parallel)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def dual():
+    return _load("dual_simplex_script", os.path.join("DualSimplex", "test.py"))
+
+
+@pytest.fixture(scope="session")
+def gauss():
+    return _load("gauss_jordan_script", os.path.join("GaussJordanBasic", "main.py"))
@@ -0,0 +1,55 @@
+"""
+Общие генераторы задач (с фиксированным зерном) и эталонные решения для тестов.
+"""
+
+import random
+
+from acom.fraction import Fraction
+
+
+def copy_rows(matrix):
+    return [list(row) for row in matrix]
+
+
+def fractions(matrix):
+    return [[x if isinstance(x, Fraction) else Fraction(x) for x in row] for row in matrix]
+
+
+def random_tableaus(seed, count, max_rows=4, max_cols=4):
+    """Канонические таблицы (базис – последние m столбцов, оценки >= 0) с малыми целыми коэффициентами."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        m, k = rng.randint(1, max_rows), rng.randint(1, max_cols)
+        tableau = [[Fraction(rng.randint(0, 4)) for _ in range(k)] + [Fraction(0)] * (m + 1)]
+        for i in range(m):
+            tableau.append([Fraction(rng.randint(-4, 4)) for _ in range(k)]
+                           + [Fraction(int(i == j)) for j in range(m)]
+                           + [Fraction(rng.randint(-5, 4))])
+        yield tableau, list(range(k, k + m))
+
+
+def random_systems(seed, count, max_rows=5, max_cols=6):
+    """Расширенные матрицы систем; часть строк – копии или суммы других (неполный ранг)."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        m, n = rng.randint(1, max_rows), rng.randint(1, max_cols)
+        matrix = [[Fraction(rng.randint(-3, 3)) for _ in range(n + 1)] for _ in range(m)]
+        if m > 1 and rng.random() < 0.5:
+            matrix[-1] = [a + b for a, b in zip(matrix[0], matrix[rng.randrange(m - 1)])]
+        yield matrix
+
+
+def lp_optimum(dual, tableau, basic_indices):
+    """Эталон: значение в строке 0 после dual_simplex на копии таблицы или None, если задача недопустима."""
+    try:
+        tableau, _ = dual.dual_simplex(copy_rows(tableau), list(basic_indices))
+    except dual.InfeasibleError:
+        return None
+    return tableau[0][-1]
+
+
+def reduced_matrix(gauss, matrix, **options):
+    """Приведённая матрица EquationSolver (options – способ исключения) для копии matrix."""
+    solver = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False, **options)
+    solver.reduce_matrix()
+    return solver.matrix
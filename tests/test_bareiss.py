@@ -0,0 +1,44 @@
+import itertools
+import math
+import random
+
+from acom.bareiss import fraction_free_reduce, to_fraction_rows, to_integer_rows
+from acom.fraction import Fraction
+from tests.helpers import copy_rows, random_systems, reduced_matrix
+
+
+def _determinant(matrix):
+    n = len(matrix)
+    total = 0
+    for permutation in itertools.permutations(range(n)):
+        inversions = sum(1 for i, j in itertools.combinations(permutation, 2) if i > j)
+        total += (-1) ** inversions * math.prod(matrix[i][permutation[i]] for i in range(n))
+    return total
+
+
+def test_last_divisor_is_the_determinant():
+    rng = random.Random(5)
+    for _ in range(200):
+        n = rng.randint(1, 4)
+        matrix = [[rng.randint(-6, 6) for _ in range(n)] for _ in range(n)]
+        determinant = _determinant(matrix)
+        if determinant == 0:
+            continue
+        steps = []
+        _, divisor = fraction_free_reduce(copy_rows(matrix), on_step=lambda rows, d: steps.append(d))
+        assert len(steps) == n
+        assert abs(divisor) == abs(determinant)
+
+
+def test_matches_fraction_elimination(gauss):
+    for matrix in random_systems(5, 200):
+        matrix = [[x / (i + 2) for x in row] for i, row in enumerate(matrix)]
+        rows = to_integer_rows(matrix)
+        assert all(isinstance(x, int) for row in rows for x in row)
+        rows, divisor = fraction_free_reduce(rows)
+        assert to_fraction_rows(rows, divisor) == reduced_matrix(gauss, matrix)
+
+
+def test_integer_rows_use_the_row_lcm():
+    matrix = [[Fraction(1, 2), Fraction(1, 3), Fraction(1)], [Fraction(2), Fraction(0), Fraction(-4)]]
+    assert to_integer_rows(matrix) == [[3, 2, 6], [2, 0, -4]]
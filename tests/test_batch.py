@@ -0,0 +1,52 @@
+import random
+
+from acom.fraction import Fraction
+from tests.helpers import copy_rows, lp_optimum, random_tableaus
+
+
+def _family(seed, count):
+    """Задачи одного размера, отличающиеся только правыми частями (базис предыдущей остаётся двойственно допустимым)."""
+    rng = random.Random(seed)
+    tableau = next(t for t, _ in random_tableaus(seed, 100, max_rows=4, max_cols=4) if len(t) > 3)
+    for k in range(count):
+        current = copy_rows(tableau)
+        for row in current[1:]:
+            row[-1] += rng.randint(-2, 2)
+        yield f"p{k}", current
+
+
+def test_batch_matches_separate_solves(dual):
+    problems = list(_family(9, 30))
+    for warm_start in (True, False):
+        results = list(dual.solve_batch([(name, copy_rows(t)) for name, t in problems], warm_start=warm_start))
+        assert [result.name for result in results] == [name for name, _ in problems]
+        for (_, tableau), result in zip(problems, results):
+            expected = lp_optimum(dual, tableau, list(range(len(tableau[0]) - len(tableau), len(tableau[0]) - 1)))
+            if expected is None:
+                assert result.status == "infeasible"
+            else:
+                assert result.status == "optimal" and result.optimum == expected
+                assert all(sum(a * x for a, x in zip(row, result.solution)) == row[-1] for row in tableau[1:])
+        assert any(result.warm_start for result in results) == warm_start
+
+
+def test_batch_reports_limits_per_problem(dual):
+    problems = [(name, tableau) for name, tableau in _family(9, 10)]
+    results = list(dual.solve_batch(problems, max_iterations=0))
+    assert {result.status for result in results} <= {"optimal", "iteration_limit", "infeasible"}
+    assert any(result.status == "iteration_limit" for result in results)
+
+
+def test_read_problems_from_file_and_directory(dual, tmp_path):
+    text = "1 1 0 0\n1 1 1 2\n---\n\n---\n2 1 0 0\n-1 1 1 -1\n"
+    path = tmp_path / "batch.txt"
+    path.write_text(text)
+    problems = list(dual.read_problems(str(path)))
+    assert [name for name, _ in problems] == [f"{path}#1", f"{path}#2"]
+    assert problems[1][1][1] == [Fraction(-1), Fraction(1), Fraction(1), Fraction(-1)]
+    directory = tmp_path / "problems"
+    directory.mkdir()
+    (directory / "b.txt").write_text("1 1 0 0\n1 1 1 2\n")
+    (directory / "a.txt").write_text("2 1 0 0\n-1 1 1 -1\n")
+    (directory / "notes.md").write_text("not a problem")
+    assert [name for name, _ in dual.read_problems(str(directory))] == ["a.txt", "b.txt"]
@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from acom.cache import ResultCache
+from acom.fraction import Fraction
+from acom.sparse import SparseMatrix
+from tests.helpers import copy_rows, lp_optimum, random_tableaus
+
+
+def _with_bound_rows(tableau, basic_indices, upper_bounds):
+    """Та же задача, где каждая граница x_j <= u_j – отдельная строка со своей дополнительной переменной."""
+    bounds = sorted(upper_bounds.items())
+    zero, one = Fraction(0), Fraction(1)
+    rows = [row[:-1] + [zero] * len(bounds) + row[-1:] for row in tableau]
+    width = len(tableau[0]) - 1
+    for k, (j, bound) in enumerate(bounds):
+        row = [zero] * (width + len(bounds)) + [Fraction(bound)]
+        row[j] = one
+        row[width + k] = one
+        rows.append(row)
+    return rows, list(basic_indices) + list(range(width, width + len(bounds)))
+
+
+def _bounded_problems(seed, count):
+    rng = random.Random(seed)
+    for tableau, basic_indices in random_tableaus(seed, count):
+        structural = basic_indices[0]
+        upper_bounds = {j: rng.randint(0, 4) for j in range(structural) if rng.random() < 0.6}
+        yield tableau, basic_indices, upper_bounds
+
+
+@pytest.mark.parametrize("bound_flipping", [True, False])
+def test_bounded_matches_explicit_bound_rows(dual, bound_flipping):
+    for tableau, basic_indices, upper_bounds in _bounded_problems(11, 300):
+        explicit = lp_optimum(dual, *_with_bound_rows(tableau, basic_indices, upper_bounds))
+        current, basis = copy_rows(tableau), list(basic_indices)
+        try:
+            _, _, at_upper = dual.dual_simplex_bounded(current, basis, upper_bounds,
+                                                       bound_flipping=bound_flipping)
+        except dual.InfeasibleError:
+            assert explicit is None
+            continue
+        solution, optimum = dual.extract_bounded_solution(current, basis, at_upper, upper_bounds,
+                                                          len(tableau[0]) - 1)
+        assert optimum == explicit
+        assert all(0 <= solution[j] <= bound for j, bound in upper_bounds.items())
+        # Решение удовлетворяет исходным строкам, а в строке 0 записано -c·x
+        for row in tableau[1:]:
+            assert sum(a * x for a, x in zip(row, solution)) == row[-1]
+        assert sum(c * x for c, x in zip(tableau[0], solution)) == -optimum
+
+
+def test_bounded_without_bounds_is_dual_simplex(dual):
+    for tableau, basic_indices in random_tableaus(12, 200):
+        current = copy_rows(tableau)
+        try:
+            dual.dual_simplex_bounded(current, list(basic_indices), {})
+        except dual.InfeasibleError:
+            assert lp_optimum(dual, tableau, basic_indices) is None
+            continue
+        assert current[0][-1] == lp_optimum(dual, tableau, basic_indices)
+
+
+def test_bounded_budget_and_stall(dual):
+    # После первого вырожденного поворота – правило Бленда без переброски границ; оптимум тот же
+    for tableau, basic_indices, upper_bounds in _bounded_problems(13, 100):
+        results = []
+        for stall_limit in (50, 1):
+            current = copy_rows(tableau)
+            try:
+                dual.dual_simplex_bounded(current, list(basic_indices), upper_bounds, stall_limit=stall_limit)
+            except dual.InfeasibleError:
+                current = None
+            results.append(current and current[0][-1])
+        assert results[0] == results[1]
+    tableau, basic_indices, upper_bounds = next(
+        problem for problem in _bounded_problems(14, 100)
+        if any(row[-1] < 0 for row in problem[0][1:]))
+    with pytest.raises(dual.IterationLimitError):
+        dual.dual_simplex_bounded(copy_rows(tableau), list(basic_indices), upper_bounds, max_iterations=0)
+
+
+def _engines(dual, tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+
+    def sparse(tableau, basic_indices):
+        matrix, _ = dual.sparse_dual_simplex(SparseMatrix.from_dense(tableau), basic_indices)
+        return matrix.get(0, matrix.ncols - 1)
+
+    def cached(tableau, basic_indices):
+        # Второй вызов берёт базис из кэша
+        dual.cached_dual_simplex(copy_rows(tableau), list(basic_indices), cache)
+        current = copy_rows(tableau)
+        dual.cached_dual_simplex(current, list(basic_indices), cache)
+        return current[0][-1]
+
+    def presolved(tableau, basic_indices):
+        return dual.presolved_dual_simplex(tableau, basic_indices)[1]
+
+    return {
+        "float": lambda t, b: dual.dual_simplex_float(t, b)[0][0][-1],
+        "revised": lambda t, b: dual.revised_dual_simplex(t, b)[0][0][-1],
+        "sparse": sparse,
+        "bounded": lambda t, b: dual.dual_simplex_bounded(t, b, {})[0][0][-1],
+        "cached": cached,
+        "presolved": presolved,
+        "solve_lp": lambda t, b: dual.solve_lp(t, b).optimum,
+    }
+
+
+def test_every_engine_matches_dual_simplex(dual, tmp_path):
+    engines = _engines(dual, tmp_path)
+    for tableau, basic_indices in random_tableaus(15, 150, max_rows=5, max_cols=5):
+        expected = lp_optimum(dual, tableau, basic_indices)
+        for name, engine in engines.items():
+            try:
+                optimum = engine(copy_rows(tableau), list(basic_indices))
+            except dual.InfeasibleError:
+                optimum = None
+            assert optimum == expected, name
+
+
+@pytest.mark.parametrize("engine", ["float", "revised", "sparse", "bounded"])
+def test_every_engine_honours_the_iteration_budget(dual, engine):
+    tableau, basic_indices = next((t, b) for t, b in random_tableaus(16, 100)
+                                  if any(row[-1] < 0 for row in t[1:]))
+    solve = {
+        "float": lambda: dual.dual_simplex_float(copy_rows(tableau), list(basic_indices), max_iterations=0),
+        "revised": lambda: dual.revised_dual_simplex(copy_rows(tableau), list(basic_indices),
+                                                     max_iterations=0),
+        "sparse": lambda: dual.sparse_dual_simplex(SparseMatrix.from_dense(tableau), list(basic_indices),
+                                                   max_iterations=0),
+        "bounded": lambda: dual.dual_simplex_bounded(copy_rows(tableau), list(basic_indices), {},
+                                                     max_iterations=0),
+    }[engine]
+    with pytest.raises(dual.IterationLimitError):
+        solve()
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from acom.cache import ResultCache, matrix_key, shape_key
+from acom.matrix_io import parse_matrix
+from tests.helpers import copy_rows, lp_optimum, random_systems, random_tableaus
+
+
+def test_key_depends_on_values_shape_and_kind():
+    assert matrix_key(parse_matrix("0.5 1\n2 3")) == matrix_key(parse_matrix("1/2 1\n4/2 3"))
+    assert matrix_key(parse_matrix("1 2")) != matrix_key(parse_matrix("1\n2"))
+    assert matrix_key(parse_matrix("1 2"), "system") != matrix_key(parse_matrix("1 2"), "dual_simplex")
+    assert shape_key(2, 3) != shape_key(3, 2)
+
+
+def test_memory_evicts_the_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.put("c", {"v": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1} and cache.get("c") == {"v": 3}
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_disk_round_trip_and_eviction(tmp_path):
+    directory = str(tmp_path)
+    cache = ResultCache(directory=directory, max_disk_entries=2)
+    for age, key in enumerate(("a", "b")):
+        cache.put(key, {"key": key, "values": ["1/2", 3]})
+        # Время изменения задаётся явно: «a» старше «b»
+        os.utime(os.path.join(directory, f"{key}.json"), (1000 + age, 1000 + age))
+    # Новый объект (другой процесс) читает с диска; чтение обновляет время файла
+    assert ResultCache(directory=directory).get("a") == {"key": "a", "values": ["1/2", 3]}
+    cache.put("c", {"key": "c"})
+    assert sorted(os.listdir(directory)) == ["a.json", "c.json"]
+    (tmp_path / "a.json").write_text("{broken")
+    assert ResultCache(directory=directory).get("a") is None
+    cache.clear()
+    assert cache.get("c") is None and os.listdir(directory) == []
+
+
+def test_solver_reuses_the_reduced_matrix(gauss, tmp_path):
+    for matrix in random_systems(23, 50):
+        cache = ResultCache(directory=str(tmp_path))
+        first = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False, cache=cache).analyze()
+        second = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False,
+                                      cache=ResultCache(directory=str(tmp_path))).analyze()
+        assert cache.misses == 1 and second.log is None
+        assert (second.status, second.rank, second.matrix, second.basic_solutions) == (
+            first.status, first.rank, first.matrix, first.basic_solutions)
+
+
+def test_cached_dual_simplex_sources(dual):
+    cache = ResultCache()
+    for tableau, basic_indices in random_tableaus(23, 100):
+        expected = lp_optimum(dual, tableau, basic_indices)
+        if expected is None:
+            for message in ("двойственная", "из кэша"):
+                with pytest.raises(dual.InfeasibleError, match=message):
+                    dual.cached_dual_simplex(copy_rows(tableau), list(basic_indices), cache)
+            continue
+        sources = []
+        for _ in range(2):
+            current = copy_rows(tableau)
+            sources.append(dual.cached_dual_simplex(current, list(basic_indices), cache)[2])
+            assert current[0][-1] == expected
+        assert sources[1] == "hit"
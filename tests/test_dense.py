@@ -0,0 +1,43 @@
+import random
+
+from acom.dense import pivot_in_place
+from acom.fraction import Fraction
+from tests.helpers import copy_rows, random_systems
+
+
+def _naive_pivot(matrix, row, col):
+    lead = [x / matrix[row][col] for x in matrix[row]]
+    return [lead if i == row else [x - current[col] * y for x, y in zip(current, lead)]
+            for i, current in enumerate(matrix)]
+
+
+def test_pivot_matches_naive_and_keeps_row_objects():
+    rng = random.Random(22)
+    for matrix in random_systems(22, 300):
+        candidates = [(i, j) for i, row in enumerate(matrix) for j, x in enumerate(row) if x]
+        if not candidates:
+            continue
+        row, col = rng.choice(candidates)
+        expected = _naive_pivot(matrix, row, col)
+        rows = list(matrix)
+        pivot_in_place(matrix, row, col)
+        assert matrix == expected
+        assert all(a is b for a, b in zip(matrix, rows))
+        assert matrix[row][col] == 1 and all(not r[col] for i, r in enumerate(matrix) if i != row)
+
+
+def test_rows_with_zero_in_the_pivot_column_are_untouched():
+    untouched = [Fraction(0), Fraction(5, 3), Fraction(7)]
+    values = list(untouched)
+    matrix = [[Fraction(2), Fraction(4), Fraction(6)], untouched, [Fraction(1), Fraction(1), Fraction(1)]]
+    pivot_in_place(matrix, 0, 0)
+    assert all(a is b for a, b in zip(matrix[1], values))
+    assert matrix == [[1, 2, 3], untouched, [0, -1, -2]]
+
+
+def test_dual_simplex_pivot_updates_the_basis(dual):
+    tableau = [[Fraction(x) for x in row] for row in ([1, 2, 0, 0, 0], [-1, 1, 1, 0, -2], [2, -1, 0, 1, 3])]
+    basis = [2, 3]
+    expected = _naive_pivot(copy_rows(tableau), 1, 0)
+    dual.pivot(tableau, basis, 1, 0)
+    assert tableau == expected and basis == [0, 3]
@@ -0,0 +1,97 @@
+import itertools
+
+import pytest
+
+from acom.combinatorics import lex_combinations, revolving_door
+from tests.helpers import copy_rows, fractions, random_systems, reduced_matrix
+
+
+def _reference(gauss, matrix, combo):
+    """Решение по столбцам combo заново исключением или None, если столбцы зависимы."""
+    sub = reduced_matrix(gauss, [[row[col] for col in combo] + [row[-1]] for row in matrix])
+    if sum(1 for row in sub if any(row[:-1])) < len(combo):
+        return None
+    solution = [0] * (len(matrix[0]) - 1)
+    for row in sub:
+        if any(row[:-1]):
+            solution[combo[next(j for j, x in enumerate(row[:-1]) if x)]] = row[-1]
+    return solution
+
+
+def test_revolving_door_visits_each_combination_once():
+    for n in range(7):
+        for k in range(n + 1):
+            combos = list(revolving_door(n, k))
+            assert sorted(combos) == list(itertools.combinations(range(n), k))
+            assert all(len(set(a) - set(b)) == 1 for a, b in zip(combos, combos[1:]))
+
+
+@pytest.mark.parametrize("order", ["lex", "gray"])
+def test_incremental_bases_match_fresh_elimination(gauss, order):
+    for matrix in random_systems(6, 150):
+        solver = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False)
+        solver.reduce_matrix()
+        if not solver.has_solutions() or not solver.matrix:
+            continue
+        results = dict(solver.enumerate_bases(order))
+        rank, variables = len(solver.matrix), len(matrix[0]) - 1
+        assert sorted(results) == list(itertools.combinations(range(variables), rank))
+        for combo, solution in results.items():
+            assert solution == _reference(gauss, matrix, combo)
+
+
+def test_streaming_limits_and_filters(gauss):
+    for matrix in random_systems(7, 100):
+        full = list(gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False)
+                    .iter_basic_solutions(include_dependent=True))
+        for limit in (0, 1, 3):
+            solver = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False)
+            assert list(solver.iter_basic_solutions(max_results=limit, include_dependent=True)) == full[:limit]
+        solver = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False)
+        assert list(solver.iter_basic_solutions(nonnegative=True)) == [
+            result for result in full if result.feasible]
+        assert all(result.feasible == all(x >= 0 for x in result.solution)
+                   for result in full if result.solution is not None)
+
+
+def test_streaming_stops_when_the_caller_stops(gauss):
+    solver = gauss.EquationSolver(matrix=fractions([[1, 1, 1, 1, 1, 4], [1, -1, 2, 0, 3, 1]]), verbose=False)
+    produced = []
+    enumerate_bases = solver.enumerate_bases
+
+    def counted(*args, **kwargs):
+        for item in enumerate_bases(*args, **kwargs):
+            produced.append(item)
+            yield item
+
+    solver.enumerate_bases = counted
+    results = solver.iter_basic_solutions()
+    first = next(results)
+    results.close()
+    assert len(produced) == 1 and first.basis == produced[0][0]
+
+
+def test_inconsistent_system_yields_nothing(gauss):
+    solver = gauss.EquationSolver(matrix=fractions([[1, 1, 1], [1, 1, 2]]), verbose=False)
+    assert list(solver.iter_basic_solutions(include_dependent=True)) == []
+
+
+def test_lex_combinations_chunks_cover_the_sequence():
+    for n, k in ((5, 2), (6, 3), (4, 4), (3, 0)):
+        expected = list(itertools.combinations(range(n), k))
+        for size in (1, 2, 7):
+            chunks = [list(lex_combinations(n, k, start, size)) for start in range(0, len(expected), size)]
+            assert [combo for chunk in chunks for combo in chunk] == expected
+
+
+def test_parallel_enumeration_matches_serial(gauss):
+    matrix = fractions([[1, 2, -1, 0, 3, 1, 4], [0, 1, 1, 2, -1, 1, 2], [2, 0, 1, 1, 1, -1, 3]])
+    serial = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False)
+    expected = list(serial.iter_basic_solutions(include_dependent=True))
+    for chunk_size in (None, 1, 4):
+        solver = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False)
+        solver.reduce_matrix()
+        assert solver.has_solutions()
+        assert list(solver.enumerate_bases_parallel(2, chunk_size)) == list(solver.enumerate_bases("lex"))
+    solver = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False)
+    assert list(solver.iter_basic_solutions(include_dependent=True, workers=2)) == expected
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from acom.factor import BasisFactorization, LUFactorization, SingularMatrixError
+from acom.fraction import Fraction
+
+
+def _random_matrix(rng, size):
+    """Невырожденная матрица по столбцам: случайные элементы, часть нулей, перестановка строк."""
+    while True:
+        columns = [[Fraction(rng.choice((0, 0, rng.randint(-5, 5)))) for _ in range(size)]
+                   for _ in range(size)]
+        try:
+            LUFactorization(columns, size)
+        except SingularMatrixError:
+            continue
+        return columns
+
+
+def _times(columns, x):
+    """B·x для матрицы, заданной столбцами."""
+    return [sum((column[i] * x[k] for k, column in enumerate(columns)), Fraction(0))
+            for i in range(len(columns))]
+
+
+def _transposed_times(columns, y):
+    """y·B."""
+    return [sum((column[i] * y[i] for i in range(len(column))), Fraction(0)) for column in columns]
+
+
+def test_lu_ftran_and_btran_solve_the_system():
+    rng = random.Random(10)
+    for _ in range(200):
+        size = rng.randint(1, 6)
+        columns = _random_matrix(rng, size)
+        lu = LUFactorization(columns, size)
+        v = [Fraction(rng.randint(-9, 9), rng.randint(1, 4)) for _ in range(size)]
+        assert _times(columns, lu.ftran(v)) == v
+        assert _transposed_times(columns, lu.btran(v)) == v
+
+
+def test_lu_accepts_sparse_columns():
+    columns = [{1: Fraction(2)}, {0: Fraction(3), 1: Fraction(1)}]
+    lu = LUFactorization(columns, 2)
+    assert lu.ftran([Fraction(3), Fraction(3)]) == [Fraction(1), Fraction(1)]
+
+
+def test_singular_matrix_is_rejected():
+    with pytest.raises(SingularMatrixError):
+        LUFactorization([[Fraction(1), Fraction(2)], [Fraction(2), Fraction(4)]], 2)
+
+
+def test_eta_updates_match_a_fresh_factorization():
+    rng = random.Random(11)
+    for _ in range(100):
+        size = rng.randint(1, 5)
+        columns = _random_matrix(rng, size)
+        basis = BasisFactorization(size, columns, refactor_every=0)
+        for _ in range(6):
+            # Замена столбца r новым столбцом a: B' = B с a на месте r
+            a = [Fraction(rng.randint(-4, 4)) for _ in range(size)]
+            column = basis.ftran(a)
+            candidates = [i for i, value in enumerate(column) if value]
+            if not candidates:
+                continue
+            r = rng.choice(candidates)
+            basis.update(r, column)
+            columns = columns[:r] + [a] + columns[r + 1:]
+            v = [Fraction(rng.randint(-6, 6)) for _ in range(size)]
+            fresh = LUFactorization(columns, size)
+            assert basis.ftran(v) == fresh.ftran(v)
+            assert basis.btran(v) == fresh.btran(v)
+        assert not basis.needs_refactor()
+
+
+def test_identity_basis_and_refactor():
+    basis = BasisFactorization(2, refactor_every=1)
+    v = [Fraction(1), Fraction(2)]
+    assert basis.ftran(v) == v and basis.btran(v) == v
+    basis.update(0, [Fraction(2), Fraction(1)])
+    assert basis.needs_refactor()
+    columns = [[Fraction(2), Fraction(1)], [Fraction(0), Fraction(1)]]
+    assert basis.ftran(v) == LUFactorization(columns, 2).ftran(v)
+    basis.refactor(columns)
+    assert basis.etas == [] and basis.ftran(v) == LUFactorization(columns, 2).ftran(v)
@@ -0,0 +1,46 @@
+import pytest
+
+from acom.fraction import Fraction
+from tests.helpers import copy_rows, lp_optimum, random_tableaus
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("float_iterations", [None, 0, 1])
+def test_float_backend_certifies_the_exact_optimum(dual, float_iterations):
+    # float_iterations=0 – точный метод с начала, 1 – с промежуточного базиса
+    for tableau, basic_indices in random_tableaus(21, 200, max_rows=5, max_cols=5):
+        original = copy_rows(tableau)
+        expected = lp_optimum(dual, tableau, basic_indices)
+        try:
+            result, basis = dual.dual_simplex_float(tableau, list(basic_indices),
+                                                    float_iterations=float_iterations)
+        except dual.InfeasibleError:
+            assert expected is None
+            continue
+        assert tableau == original
+        assert result[0][-1] == expected
+        assert all(isinstance(x, Fraction) for row in result for x in row)
+        assert all(result[i + 1][j] == 1 for i, j in enumerate(basis))
+        assert all(x >= 0 for x in result[0][:-1]) and all(row[-1] >= 0 for row in result[1:])
+
+
+def test_float_backend_is_exact_where_float64_rounds(dual):
+    # Коэффициенты, не представимые в float64: ответ всё равно точный
+    third, big = Fraction(1, 3), Fraction(10 ** 17 + 1)
+    tableau = [[Fraction(1), Fraction(1), Fraction(0), Fraction(0), Fraction(0)],
+               [-third, -big, Fraction(1), Fraction(0), Fraction(-1)],
+               [-big, -third, Fraction(0), Fraction(1), -big]]
+    result, _ = dual.dual_simplex_float(copy_rows(tableau), [2, 3])
+    assert result[0][-1] == lp_optimum(dual, tableau, [2, 3])
+
+
+def test_rebuild_basis_reproduces_the_exact_tableau(dual):
+    for tableau, basic_indices in random_tableaus(22, 100):
+        try:
+            solved, basis = dual.dual_simplex(copy_rows(tableau), list(basic_indices))
+        except dual.InfeasibleError:
+            continue
+        rebuilt, rebuilt_basis = dual.rebuild_basis(tableau, basic_indices, basis)
+        assert rebuilt_basis == basis
+        assert rebuilt == solved
@@ -0,0 +1,67 @@
+import fractions
+import operator
+import random
+
+import pytest
+
+from acom.fraction import Fraction
+
+
+def _same(value, expected):
+    return (value.numerator, value.denominator) == (expected.numerator, expected.denominator)
+
+
+def test_arithmetic_matches_standard_fractions():
+    # Быстрые пути (целые операнды, общий знаменатель, сокращение) дают тот же нормализованный результат
+    rng = random.Random(1)
+    operations = (operator.add, operator.sub, operator.mul, operator.truediv)
+    for _ in range(3000):
+        a, b = rng.randint(-30, 30), rng.choice([1, 1, 2, 3, 4, 6, -6, 12])
+        c, d = rng.randint(-30, 30), rng.choice([1, 1, 2, 3, 4, 6, -6, 12])
+        x, y = Fraction(a, b), Fraction(c, d)
+        expected_x, expected_y = fractions.Fraction(a, b), fractions.Fraction(c, d)
+        for op in operations:
+            if op is not operator.truediv or c:
+                assert _same(op(x, y), op(expected_x, expected_y))
+                assert _same(op(x, c), op(expected_x, c))
+            if op is not operator.truediv or a:
+                assert _same(op(c, x), op(c, expected_x))
+        assert (x < y, x <= y, x > y, x >= y, x == y) == (
+            expected_x < expected_y, expected_x <= expected_y, expected_x > expected_y,
+            expected_x >= expected_y, expected_x == expected_y)
+        assert _same(-x, -expected_x) and _same(abs(x), abs(expected_x))
+
+
+def test_normalization_and_zero():
+    assert _same(Fraction(4, -6), fractions.Fraction(-2, 3))
+    assert _same(Fraction(0, -5), fractions.Fraction(0))
+    assert not Fraction(0, 7) and Fraction(1, 7)
+    with pytest.raises(ValueError):
+        Fraction(1, 0)
+    with pytest.raises(ZeroDivisionError):
+        Fraction(1, 2) / Fraction(0)
+    with pytest.raises(ZeroDivisionError):
+        Fraction(1, 2) / 0
+
+
+def test_hash_agrees_with_equality():
+    assert Fraction(6, 3) == 2 and hash(Fraction(6, 3)) == hash(2)
+    assert Fraction(2, 4) == Fraction(1, 2) and hash(Fraction(2, 4)) == hash(Fraction(1, 2))
+    assert len({Fraction(1, 2), Fraction(-3, -6), Fraction(3), 3}) == 2
+    assert {Fraction(1, 3): "a"}[Fraction(2, 6)] == "a"
+
+
+def test_instances_are_slotted():
+    value = Fraction(1, 2)
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        value.extra = 1
+
+
+def test_unsupported_operands():
+    with pytest.raises(TypeError):
+        Fraction(1, 2) + 0.5
+    with pytest.raises(TypeError):
+        Fraction(1, 2) < 0.5
+    assert Fraction(1, 2) != 0.5
+    assert f"{Fraction(-3, 6):>5}" == " -1/2" and str(Fraction(4, 2)) == "2"
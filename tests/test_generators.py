@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from acom.generators import KINDS, linear_system, lp_tableau
+from tests.helpers import copy_rows, reduced_matrix
+
+BENCH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks", "bench.py")
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_lp_instances_are_feasible_and_dual_feasible(dual, kind):
+    for seed in range(5):
+        tableau, basic_indices = lp_tableau(4, 5, seed, kind)
+        assert (tableau, basic_indices) == lp_tableau(4, 5, seed, kind)
+        assert basic_indices == list(range(5, 9))
+        assert all(x >= 0 for x in tableau[0])
+        dual.dual_simplex(copy_rows(tableau), list(basic_indices))    # без InfeasibleError
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_linear_systems_are_consistent(gauss, kind):
+    for seed in range(5):
+        matrix = linear_system(6, 5, seed, kind)
+        assert matrix == linear_system(6, 5, seed, kind)
+        reduced = reduced_matrix(gauss, matrix)
+        # Нет строки 0 = b с b != 0
+        assert not any(not any(row[:-1]) and row[-1] for row in reduced)
+        rank = sum(1 for row in reduced if any(row[:-1]))
+        if kind == "rank_deficient":
+            assert rank <= 3
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError, match="Unknown instance kind"):
+        lp_tableau(2, 2, kind="huge")
+
+
+def test_benchmark_report(tmp_path):
+    output = tmp_path / "bench.json"
+    subprocess.run([sys.executable, BENCH, "--sizes", "3", "--repeat", "1", "--kinds", "dense",
+                    "--output", str(output)], capture_output=True, text=True, check=True)
+    report = json.loads(output.read_text())
+    assert {record["benchmark"] for record in report["results"]} == {
+        "dual_simplex", "pivot", "reduce", "solve", "enumerate"}
+    assert all(record["min"] > 0 for record in report["results"] if "skipped" not in record)
+    compared = subprocess.run([sys.executable, BENCH, "--sizes", "3", "--repeat", "1", "--kinds", "dense",
+                               "--benchmarks", "reduce", "--compare", str(output)],
+                              capture_output=True, text=True, check=True).stdout
+    assert "vs baseline" in compared
@@ -0,0 +1,52 @@
+import itertools
+
+import pytest
+
+from tests.helpers import copy_rows, lp_optimum, random_tableaus
+
+
+def _needs_pivots(seed):
+    return next((t, b) for t, b in random_tableaus(seed, 100) if any(row[-1] < 0 for row in t[1:]))
+
+
+def test_iteration_budget_keeps_the_last_basis(dual):
+    for tableau, basic_indices in random_tableaus(41, 200, max_rows=5, max_cols=5):
+        expected = lp_optimum(dual, tableau, basic_indices)
+        current = copy_rows(tableau)
+        result = dual.solve_lp(current, list(basic_indices), max_iterations=1)
+        if result.status == "iteration_limit":
+            # Таблица и базис остаются после первого поворота: продолжение даёт тот же ответ
+            assert result.iterations == 1
+            assert lp_optimum(dual, current, result.basic_indices) == expected
+        else:
+            assert result.status == ("infeasible" if expected is None else "optimal")
+
+
+def test_time_limit(dual, monkeypatch):
+    tableau, basic_indices = _needs_pivots(42)
+    clock = itertools.count()
+    monkeypatch.setattr(dual.time, "monotonic", lambda: next(clock))
+    with pytest.raises(dual.TimeLimitError):
+        dual.dual_simplex(copy_rows(tableau), list(basic_indices), time_limit=0.5)
+    assert dual.solve_lp(copy_rows(tableau), list(basic_indices), time_limit=0.5).status == "time_limit"
+
+
+def test_stalled_solve_switches_to_bland(dual, monkeypatch):
+    switched = []
+
+    class RecordingBland(dual.BlandPricing):
+        def start(self, tableau, basic_indices):
+            switched.append(True)
+            super().start(tableau, basic_indices)
+
+    monkeypatch.setattr(dual, "BlandPricing", RecordingBland)
+    for tableau, basic_indices in random_tableaus(43, 300, max_rows=5, max_cols=5):
+        expected = lp_optimum(dual, tableau, basic_indices)
+        current = copy_rows(tableau)
+        try:
+            dual.dual_simplex(current, list(basic_indices), stall_limit=1)
+        except dual.InfeasibleError:
+            assert expected is None
+            continue
+        assert current[0][-1] == expected
+    assert switched
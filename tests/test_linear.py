@@ -0,0 +1,29 @@
+import pytest
+
+from acom.linear import LinearSystem
+from tests.helpers import copy_rows, fractions, random_systems
+
+
+def test_rhs_index_is_checked():
+    system = LinearSystem(fractions([[1, 1], [2, 2]]), rhs_columns=0)
+    for method in (system.consistent, system.particular):
+        with pytest.raises(ValueError):
+            method()
+    system = LinearSystem(fractions([[1, 1, 2, 3], [2, 2, 4, 7]]), rhs_columns=2)
+    assert system.consistent(0) and not system.consistent(1)
+    with pytest.raises(ValueError):
+        system.particular(2)
+    with pytest.raises(ValueError):
+        system.consistent(-1)
+
+
+def test_solve_many_matches_fresh_elimination():
+    for matrix in random_systems(25, 200):
+        a = [row[:-1] for row in matrix]
+        system = LinearSystem(copy_rows(a), rhs_columns=0)
+        rhs = [row[-1] for row in matrix]
+        fresh = LinearSystem(copy_rows(matrix))
+        assert system.rank == fresh.rank
+        assert system.solve(rhs) == fresh.particular()
+        for vector in system.nullspace():
+            assert all(sum(x * y for x, y in zip(row, vector)) == 0 for row in a)
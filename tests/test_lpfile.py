@@ -0,0 +1,147 @@
+import pytest
+
+from acom.fraction import Fraction
+from acom.lpfile import read_lp, read_mps, to_standard_form
+
+MPS = """\
+NAME          SMALL
+ROWS
+ N  COST
+ L  LIM1
+ G  LIM2
+ E  MYEQN
+COLUMNS
+    X1        COST         1   LIM1         1
+    X1        LIM2         1
+    X2        COST         2   LIM1         1
+    X2        LIM2         1   MYEQN       -1
+    X3        COST        -1   MYEQN        1
+RHS
+    RHS       LIM1         4   LIM2         1
+    RHS       MYEQN        7
+BOUNDS
+ UP BND       X1           4
+ LO BND       X2          -1
+ UP BND       X2           1
+ENDATA
+"""
+
+LP = r"""
+\ та же модель в формате CPLEX LP
+Minimize
+ obj: x1 + 2 x2 - x3
+Subject To
+ lim1: x1 + x2 <= 4
+ lim2: x1 + x2 >= 1
+ myeqn: - x2 + x3 = 7
+Bounds
+ x1 <= 4
+ -1 <= x2 <= 1
+End
+"""
+
+
+def _solve(dual, model, **kwargs):
+    return dual.solve_model(to_standard_form(model), **kwargs)
+
+
+def _check_optimum(values, objective):
+    # min x1 + x2 - 7 при x1 + x2 >= 1: оптимум не единственный
+    x1, x2, x3 = values.values()
+    assert objective == Fraction(-6)
+    assert x1 + x2 == 1 and x3 == x2 + 7 and 0 <= x1 <= 4 and -1 <= x2 <= 1
+
+
+def test_mps_sections(dual):
+    model = read_mps(MPS.splitlines())
+    assert model.name == "SMALL"
+    assert [c[2] for c in model.constraints] == ["<=", ">=", "="]
+    assert model.bounds["X2"] == (Fraction(-1), Fraction(1))
+    _check_optimum(*_solve(dual, model))
+
+
+def test_lp_matches_mps(dual):
+    _check_optimum(*_solve(dual, read_lp(LP.splitlines())))
+
+
+def test_budget_applies_to_bounded_and_sparse_models(dual):
+    model = read_mps(MPS.splitlines())
+    with pytest.raises(dual.IterationLimitError):
+        _solve(dual, model, max_iterations=0)
+    model.bounds = {name: (None, None) for name in model.bounds}
+    with pytest.raises(dual.IterationLimitError):
+        _solve(dual, model, max_iterations=0, sparse=True)
+
+
+def test_mps_negative_upper_bound_frees_default_lower_bound():
+    model = read_mps("""\
+ROWS
+ N  COST
+ L  R1
+COLUMNS
+    X   COST  1   R1  1
+BOUNDS
+ UP BND X -2
+ENDATA
+""".splitlines())
+    assert model.bounds["X"] == (None, Fraction(-2))
+    to_standard_form(model)
+
+
+def test_mps_negative_upper_bound_keeps_explicit_lower_bound():
+    model = read_mps("""\
+ROWS
+ N  COST
+COLUMNS
+    X   COST  1
+BOUNDS
+ LO BND X -5
+ UP BND X -2
+ENDATA
+""".splitlines())
+    assert model.bounds["X"] == (Fraction(-5), Fraction(-2))
+
+
+def test_lp_negative_upper_bound_is_empty_interval():
+    model = read_lp("Minimize\n x\nSubject To\n c: x >= -3\nBounds\n x <= -1\nEnd".splitlines())
+    with pytest.raises(ValueError, match="Empty bounds"):
+        to_standard_form(model)
+
+
+def test_integer_variables_are_rejected_unless_relaxed(dual):
+    mps = MPS.replace("COLUMNS\n", "COLUMNS\n    M1 'MARKER' 'INTORG'\n").replace(
+        "    X2        COST", "    M2 'MARKER' 'INTEND'\n    X2        COST")
+    for model in (read_mps(mps.splitlines()),
+                  read_lp(LP.replace("End", "General\n x1\nEnd").splitlines())):
+        assert [name.lower() for name in model.integers] == ["x1"]
+        with pytest.raises(ValueError, match="integer"):
+            to_standard_form(model)
+        _check_optimum(*dual.solve_model(to_standard_form(model, relax=True)))
+
+
+def test_binary_and_integer_bounds_mark_integers():
+    model = read_lp("Maximize\n x + y\nSubject To\n c: x + y <= 3\nBinary\n x\nEnd".splitlines())
+    assert model.integers == ["x"] and model.bounds["x"] == (Fraction(0), Fraction(1))
+    model = read_mps("ROWS\n N C\nCOLUMNS\n    X C 1\nBOUNDS\n UI BND X 3\nENDATA".splitlines())
+    assert model.integers == ["X"]
+
+
+def test_lp_multiline_expressions_and_repeated_terms():
+    model = read_lp("Minimize\n obj: x\n + 2 y + y\nSubject To\n c1: x\n + y\n >= 2\nEnd".splitlines())
+    assert model.objective == {"x": Fraction(1), "y": Fraction(3)}
+    assert model.constraints == [("c1", {"x": Fraction(1), "y": Fraction(1)}, ">=", Fraction(2))]
+
+
+def test_ranges_section_is_rejected():
+    with pytest.raises(ValueError, match="RANGES"):
+        read_mps("ROWS\n N C\nRANGES\nENDATA".splitlines())
+
+
+def test_variable_named_slack_is_kept(dual):
+    model = read_lp("Maximize\n obj: slack + y\nSubject To\n c1: slack + y <= 4\n c2: slack <= 3\nEnd".splitlines())
+    values, objective = _solve(dual, model)
+    assert objective == Fraction(4)
+    assert set(values) == {"slack", "y"} and values["slack"] + values["y"] == 4
+    model = read_mps("ROWS\n N C\n L R\nCOLUMNS\n    slack C -1 R 1\nRHS\n    RHS R 2\nENDATA".splitlines())
+    values, objective = _solve(dual, model)
+    assert values == {"slack": Fraction(2)} and objective == Fraction(-2)
@@ -0,0 +1,65 @@
+import pytest
+
+from acom.fraction import Fraction
+from acom.matrix_io import (parse_fraction, parse_matrix, read_matrix, read_numpy, read_sparse_rows,
+                            read_triplets, write_npy, write_triplets)
+from tests.helpers import random_systems
+
+TEXT = """
+1 -2 0.25 3/4
+
+-1.5e1 0 7 -2/6
+"""
+
+
+def test_text_numbers():
+    matrix = parse_matrix(TEXT)
+    assert matrix == [[Fraction(1), Fraction(-2), Fraction(1, 4), Fraction(3, 4)],
+                      [Fraction(-15), Fraction(0), Fraction(7), Fraction(-1, 3)]]
+    assert matrix[1][3].denominator == 3
+    with pytest.raises(ValueError, match="Invalid number"):
+        parse_fraction("1/0")
+    with pytest.raises(ValueError, match="Invalid number"):
+        parse_matrix("1 x 2")
+
+
+def test_triplets_round_trip(tmp_path):
+    path = str(tmp_path / "m.tri")
+    for matrix in random_systems(14, 50):
+        matrix = [[x / (i + 2) for x in row] for i, row in enumerate(matrix)]
+        write_triplets(path, matrix)
+        assert read_matrix(path) == matrix
+        rows, ncols = read_sparse_rows(path)
+        assert ncols == len(matrix[0])
+        assert rows == [{j: v for j, v in enumerate(row) if v} for row in matrix]
+
+
+def test_triplets_from_sparse_rows_and_bad_magic(tmp_path):
+    path = tmp_path / "m.tri"
+    write_triplets(str(path), [{2: Fraction(1, 3)}, {}], ncols=4)
+    assert read_triplets(str(path)) == ([{2: Fraction(1, 3)}, {}], 4)
+    path.write_bytes(b"NOTATRI!" + bytes(24))
+    with pytest.raises(ValueError, match="not a triplet file"):
+        read_matrix(str(path))
+
+
+def test_npy_round_trip(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = str(tmp_path / "m.npy")
+    write_npy(path, [[1, -2, 3], [Fraction(4), 0, 5]])
+    assert read_matrix(path) == [[1, -2, 3], [4, 0, 5]]
+    with pytest.raises(ValueError):
+        write_npy(path, [[Fraction(1, 2)]])
+    # float переводятся в дроби точно
+    np.save(path, np.array([[0.5, -0.125]]))
+    assert read_matrix(path) == [[Fraction(1, 2), Fraction(-1, 8)]]
+
+
+def test_read_numpy_text_and_triplets(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "m.txt"
+    path.write_text(TEXT)
+    expected = [[1.0, -2.0, 0.25, 0.75], [-15.0, 0.0, 7.0, -1 / 3]]
+    assert read_numpy(str(path)).tolist() == expected
+    write_triplets(str(tmp_path / "m.tri"), parse_matrix(TEXT))
+    assert read_numpy(str(tmp_path / "m.tri")).tolist() == expected
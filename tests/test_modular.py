@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from acom import modular
+from acom.fraction import Fraction
+from acom.native import available as native_available
+from tests.helpers import random_systems, reduced_matrix
+
+pytest.importorskip("numpy")
+
+
+def _small_primes():
+    """Малые простые по возрастанию: многие из них делят ведущие элементы («неудачные» модули)."""
+    p = 2
+    while True:
+        if modular._is_prime(p):
+            yield p
+        p += 1
+
+
+def _big_system(seed, rows, cols, bits):
+    rng = random.Random(seed)
+    return [[Fraction(rng.randint(-2 ** bits, 2 ** bits)) for _ in range(cols)] for _ in range(rows)]
+
+
+def test_modular_matches_reduce(gauss):
+    for matrix in random_systems(19, 300):
+        assert modular.modular_reduce(matrix) == reduced_matrix(gauss, matrix)
+
+
+def test_multi_prime_crt_for_large_entries(gauss):
+    # Определитель ~ 6·80 бит: одного модуля 2^28 заведомо мало
+    matrix = _big_system(3, 6, 8, 80)
+    used = []
+    assert modular.modular_reduce(matrix, on_prime=used.append) == reduced_matrix(gauss, matrix)
+    assert len(used) > 10
+
+
+def test_early_stop_for_small_results():
+    matrix = [[Fraction(x) for x in row] for row in ([2, 1, 1, 5], [1, 3, 2, 7], [1, 0, 0, 2])]
+    used = []
+    reduced = modular.modular_reduce(matrix, on_prime=used.append)
+    assert [row[-1] for row in reduced] == [2, 3, -2]
+    assert len(used) == 2    # кандидат найден по первому модулю и проверен вторым
+
+
+def test_unlucky_primes_restart(gauss, monkeypatch):
+    monkeypatch.setattr(modular, "primes", _small_primes)
+    # Ведущие элементы кратны 2, 3 и 5: по этим модулям ранг или ведущие столбцы другие
+    matrix = [[Fraction(x) for x in row] for row in ([6, 10, 15, 1], [30, 50, 77, 2], [2, 7, 3, 3])]
+    assert modular.modular_reduce(matrix) == reduced_matrix(gauss, matrix)
+    for matrix in random_systems(20, 100):
+        assert modular.modular_reduce(matrix) == reduced_matrix(gauss, matrix)
+
+
+def test_rank_deficient_and_zero_matrices(gauss):
+    matrix = [[Fraction(x) for x in row] for row in ([1, 2, 3, 4], [2, 4, 6, 8], [0, 0, 0, 0], [1, 2, 4, 5])]
+    assert modular.modular_reduce(matrix) == reduced_matrix(gauss, matrix)
+    zero = [[Fraction(0)] * 3 for _ in range(2)]
+    assert modular.modular_reduce(zero) == zero
+
+
+def test_block_solve_with_small_blocks(gauss, monkeypatch):
+    # Блочное исключение по следующим модулям: блок из двух столбцов вместо 64
+    monkeypatch.setattr(modular, "BLOCK", 2)
+    matrix = _big_system(5, 7, 10, 40)
+    assert modular.modular_reduce(matrix) == reduced_matrix(gauss, matrix)
+
+
+def test_entries_beyond_int64(gauss):
+    matrix = _big_system(7, 3, 5, 90)
+    assert modular.modular_reduce(matrix) == reduced_matrix(gauss, matrix)
+
+
+def test_rational_reconstruction():
+    modulus = 1000003 * 999983
+    for a, b in ((1, 3), (-22, 7), (0, 1), (355, 113)):
+        assert modular.rational_reconstruction(a * pow(b, -1, modulus) % modulus, modulus) == (a, b)
+    # Для любого вычета ответ – дробь в пределах sqrt(modulus/2) с тем же вычетом, либо None
+    bound = (10007 // 2) ** 0.5
+    for value in range(0, 10007, 97):
+        fraction = modular.rational_reconstruction(value, 10007)
+        if fraction is not None:
+            a, b = fraction
+            assert (a - value * b) % 10007 == 0 and abs(a) <= bound and 0 < b <= bound
+
+
+@pytest.mark.parametrize("options", [{"sparse": True}, {"bareiss": True}, {"modular": True},
+                                     {"presolve": True}, {"native": True}])
+def test_every_elimination_matchesreduced_matrix(gauss, options):
+    if options.get("native") and not native_available():
+        pytest.skip("native library is not built")
+    for matrix in random_systems(21, 200):
+        matrix = [[x / (i + 1) for x in row] for i, row in enumerate(matrix)]
+        expected = reduced_matrix(gauss, matrix)
+        reduced = reduced_matrix(gauss, matrix, **options)
+        if options.get("presolve"):
+            # Предварительная обработка удаляет пустые и повторяющиеся строки; у несовместной
+            # системы совпадает только наличие строки 0 = 1 (её может найти и сама обработка)
+            expected = [row for row in expected if any(row)]
+            reduced = [row for row in reduced if any(row)]
+            if any(not any(row[:-1]) for row in expected):
+                assert any(not any(row[:-1]) for row in reduced)
+                continue
+        assert reduced == expected
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from acom.fraction import Fraction
+from acom.native import available, reduce_native
+from tests.helpers import copy_rows, fractions, random_systems, reduced_matrix
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GaussJordanBasic", "main.py")
+
+needs_library = pytest.mark.skipif(not available(), reason="native library is not built")
+
+# Исходные числа помещаются в 64 бита, а промежуточные – нет
+OVERFLOWING = [[2 ** 62, 1, 1], [3, 2 ** 62 - 1, 1]]
+
+
+@needs_library
+def test_native_matches_fraction_elimination(gauss):
+    for matrix in random_systems(20, 200):
+        matrix = [[x / (i + 2) for x in row] for i, row in enumerate(matrix)]
+        original = copy_rows(matrix)
+        assert reduce_native(matrix) == reduced_matrix(gauss, matrix)
+        assert matrix == original
+
+
+@needs_library
+def test_overflow_is_reported():
+    with pytest.raises(OverflowError, match="does not fit"):
+        reduce_native([[Fraction(2 ** 63), Fraction(1)]])
+    with pytest.raises(OverflowError, match="overflow in native"):
+        reduce_native(fractions(OVERFLOWING))
+
+
+@needs_library
+@pytest.mark.parametrize("options", [{}, {"bareiss": True}, {"sparse": True}])
+def test_solver_falls_back_to_fractions_on_overflow(gauss, capsys, options):
+    expected = reduced_matrix(gauss, fractions(OVERFLOWING))
+    solver = gauss.EquationSolver(matrix=fractions(OVERFLOWING), native=True, verbose=True, **options)
+    solver.reduce_matrix()
+    assert solver.matrix == expected
+    assert "Native elimination overflowed 64 bits; using Python fractions." in capsys.readouterr().out
+
+
+def test_cli_reports_a_missing_library(tmp_path):
+    path = tmp_path / "system.txt"
+    path.write_text("1 1 2\n1 -1 0")
+    env = dict(os.environ, ACOM_GAUSS_JORDAN_LIB=str(tmp_path / "missing.so"))
+    result = subprocess.run([sys.executable, SCRIPT, str(path), "--native"], capture_output=True, text=True,
+                            env=env)
+    assert result.returncode != 0
+    assert "Native Gauss-Jordan library not found" in result.stdout
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+
+from acom.fraction import Fraction
+from tests.helpers import copy_rows, random_tableaus
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "DualSimplex", "test.py")
+
+# Нулевая целевая функция: оптимальна каждая вершина
+TIED = [[0, 0, 0, 0, 0, 0],
+        [1, 1, 1, 1, 0, 3],
+        [1, -1, 1, 0, 1, 1]]
+
+
+def _tied(dual):
+    tableau = [[Fraction(x) for x in row] for row in TIED]
+    return dual.dual_simplex(tableau, [3, 4])
+
+
+def test_walk_yields_distinct_feasible_optima_and_restores_the_tableau(dual):
+    for tableau, basic_indices in random_tableaus(211, 200):
+        # Часть оценок обнуляется, чтобы появились равные оптимумы
+        tableau[0] = [x if j % 2 else Fraction(0) for j, x in enumerate(tableau[0])]
+        original = copy_rows(tableau)
+        try:
+            dual.dual_simplex(tableau, basic_indices)
+        except dual.InfeasibleError:
+            continue
+        solved, basis = copy_rows(tableau), list(basic_indices)
+        total_vars = len(tableau[0]) - 1
+        solutions = [solution for solution, _ in dual.iter_optimal_solutions(tableau, basic_indices, total_vars)]
+        assert len({tuple(solution) for solution in solutions}) == len(solutions)
+        for solution in solutions:
+            assert all(x >= 0 for x in solution)
+            assert all(sum(a * x for a, x in zip(row, solution)) == row[-1] for row in original[1:])
+            assert sum(c * x for c, x in zip(original[0], solution)) == -solved[0][-1]
+        assert tableau == solved and basic_indices == basis
+
+
+def test_max_solutions_stops_the_walk(dual):
+    tableau, basic_indices = _tied(dual)
+    everything = list(dual.iter_optimal_solutions(tableau, basic_indices, 5))
+    assert len(everything) > 2
+    assert len(list(dual.iter_optimal_solutions(tableau, basic_indices, 5, max_solutions=2))) == 2
+
+
+def test_cli_limits_printed_alternatives(tmp_path):
+    path = tmp_path / "tied.txt"
+    path.write_text("\n".join(" ".join(map(str, row)) for row in TIED))
+    script = [sys.executable, SCRIPT, str(path)]
+    limited = subprocess.run(script + ["--max-solutions", "1"], capture_output=True, text=True, check=True).stdout
+    assert limited.count("Найдено альтернативное") == 1 and "--max-solutions" in limited
+    full = subprocess.run(script + ["--max-solutions", "0"], capture_output=True, text=True, check=True).stdout
+    assert full.count("Найдено альтернативное") > 1 and "--max-solutions" not in full
@@ -0,0 +1,54 @@
+import pytest
+
+from acom.matrix_io import parse_matrix
+from acom.presolve import presolve_system, presolve_tableau
+from tests.helpers import copy_rows, lp_optimum, random_systems, random_tableaus
+
+# x1 <= 3 (строка с одной переменной – верхняя граница), x1 + x2 >= 2
+BOUNDED = """
+1 1 0 0 0
+1 0 1 0 3
+-1 -1 0 1 -2
+"""
+
+
+def test_singleton_row_becomes_upper_bound(dual):
+    tableau = parse_matrix(BOUNDED)
+    presolved = presolve_tableau(tableau, [2, 3])
+    assert presolved.upper_bounds == {0: 3}
+    solution, optimum, _ = dual.presolved_dual_simplex(tableau, [2, 3])
+    assert optimum == lp_optimum(dual, tableau, [2, 3])
+    assert solution[0] + solution[1] >= 2 and solution[0] <= 3
+
+
+def test_budget_applies_when_presolve_creates_bounds(dual):
+    tableau = parse_matrix(BOUNDED)
+    with pytest.raises(dual.IterationLimitError):
+        dual.presolved_dual_simplex(tableau, [2, 3], max_iterations=0)
+    with pytest.raises(dual.IterationLimitError):
+        dual.dual_simplex(copy_rows(tableau), [2, 3], max_iterations=0)
+
+
+def test_presolved_tableau_matches_dual_simplex(dual):
+    for tableau, basic_indices in random_tableaus(13, 300):
+        expected = lp_optimum(dual, tableau, basic_indices)
+        try:
+            solution, optimum, _ = dual.presolved_dual_simplex(tableau, basic_indices)
+        except dual.InfeasibleError:
+            optimum = None
+        assert optimum == expected
+
+
+def test_presolved_system_matches_reduce(gauss):
+    for matrix in random_systems(13, 300):
+        plain = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False).analyze(basic_solutions=False)
+        presolved = gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False,
+                                         presolve=True).analyze(basic_solutions=False)
+        assert presolved.status == plain.status
+        if plain.status == "consistent":
+            assert presolved.matrix == plain.matrix
+            assert presolved.pivot_columns == plain.pivot_columns
+
+
+def test_presolve_system_detects_empty_inconsistent_row():
+    assert presolve_system(parse_matrix("1 1 2\n0 0 5")).infeasible
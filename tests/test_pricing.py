@@ -0,0 +1,54 @@
+import pytest
+
+from acom.fraction import Fraction
+from tests.helpers import copy_rows, lp_optimum, random_tableaus
+
+
+@pytest.mark.parametrize("rule", ["dantzig", "bland", "steepest", "partial"])
+def test_every_rule_reaches_the_same_optimum(dual, rule):
+    for tableau, basic_indices in random_tableaus(31, 200, max_rows=5, max_cols=5):
+        expected = lp_optimum(dual, tableau, basic_indices)
+        current = copy_rows(tableau)
+        try:
+            # stall_limit=None – без перехода на правило Бленда
+            dual.dual_simplex(current, list(basic_indices), pricing=dual.PRICING_RULES[rule](),
+                              stall_limit=None)
+        except dual.InfeasibleError:
+            assert expected is None
+            continue
+        assert current[0][-1] == expected
+
+
+def test_steepest_edge_weights_follow_the_tableau(dual):
+    checked = 0
+    for tableau, basic_indices in random_tableaus(32, 100, max_rows=5, max_cols=5):
+        pricing = dual.SteepestEdgePricing()
+
+        def on_pivot(iteration, r, entering, leaving, current):
+            nonlocal checked
+            for i in range(1, len(current)):
+                exact = sum(float(current[i][c]) ** 2 for c in pricing.identity_columns)
+                assert pricing.weights[i] == pytest.approx(max(exact, 1e-12))
+            checked += 1
+
+        try:
+            dual.dual_simplex(copy_rows(tableau), list(basic_indices), pricing=pricing, on_pivot=on_pivot)
+        except dual.InfeasibleError:
+            pass
+    assert checked
+
+
+def test_partial_pricing_scans_segments_in_turn(dual):
+    pricing = dual.PartialPricing(segment_size=2)
+    pricing.start([[Fraction(0)]] * 9, list(range(8)))
+    candidates = [(3, Fraction(1)), (4, Fraction(5)), (7, Fraction(2))]
+    assert pricing.choose_row(candidates) == 4      # первый кусок с невязками – строки 3-4
+    assert pricing.choose_row(candidates) == 7      # дальше с места остановки – строки 7-8
+    assert pricing.choose_row(candidates) == 4      # по кругу
+    assert dual.DantzigPricing().choose_row(candidates) == 4
+
+
+def test_bland_takes_the_smallest_basic_variable(dual):
+    pricing = dual.BlandPricing()
+    pricing.start(None, [5, 2, 7])
+    assert pricing.choose_row([(1, Fraction(9)), (2, Fraction(1)), (3, Fraction(4))]) == 2
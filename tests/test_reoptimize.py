@@ -0,0 +1,99 @@
+import random
+
+from acom.fraction import Fraction
+from tests.helpers import copy_rows, lp_optimum, random_tableaus
+
+
+def _with_row(tableau, basic_indices, coefficients, rhs):
+    """Исходная задача с ещё одним ограничением coefficients·x <= rhs и его дополнительной переменной."""
+    n = len(tableau[0]) - 1
+    rows = [row[:-1] + [Fraction(0)] + row[-1:] for row in tableau]
+    new_row = [Fraction(c) for c in coefficients] + [Fraction(0)] * (n - len(coefficients))
+    rows.append(new_row + [Fraction(1), Fraction(rhs)])
+    return rows, list(basic_indices) + [n]
+
+
+def _solved_states(dual, seed, count):
+    """(исходная таблица, базис, LPState после решения) для допустимых задач."""
+    for tableau, basic_indices in random_tableaus(seed, count):
+        if lp_optimum(dual, tableau, basic_indices) is None:
+            continue
+        state = dual.LPState(copy_rows(tableau), basic_indices)
+        state.solve()
+        yield tableau, basic_indices, state
+
+
+def _satisfies(original, solution):
+    return all(sum(a * x for a, x in zip(row, solution)) == row[-1] for row in original[1:])
+
+
+def _check(dual, state, original, basic_indices):
+    """Повторная оптимизация с текущего базиса даёт тот же результат, что решение изменённой задачи с нуля."""
+    expected = lp_optimum(dual, original, basic_indices)
+    try:
+        solution, optimum = state.solve()
+    except dual.InfeasibleError:
+        assert expected is None
+        return
+    assert optimum == expected
+    assert _satisfies(original, solution) and all(x >= 0 for x in solution)
+
+
+def test_change_and_shift_rhs(dual):
+    rng = random.Random(101)
+    for tableau, basic_indices, state in _solved_states(dual, 101, 200):
+        k = rng.randrange(len(basic_indices))
+        value = rng.randint(-5, 6)
+        state.change_rhs(k, value)
+        edited = copy_rows(tableau)
+        edited[k + 1][-1] = Fraction(value)
+        _check(dual, state, edited, basic_indices)
+
+        delta = rng.randint(-3, 3)
+        state.shift_rhs(k, delta)
+        edited[k + 1][-1] += delta
+        _check(dual, state, edited, basic_indices)
+
+
+def test_add_constraint(dual):
+    rng = random.Random(102)
+    for tableau, basic_indices, state in _solved_states(dual, 102, 200):
+        structural = basic_indices[0]
+        coefficients = [rng.randint(-2, 3) for _ in range(structural)]
+        rhs = rng.randint(-3, 5)
+        assert state.add_constraint(coefficients, rhs) == len(basic_indices)
+        _check(dual, state, *_with_row(tableau, basic_indices, coefficients, rhs))
+
+
+def test_tighten_bound_until_infeasible(dual):
+    rng = random.Random(103)
+    infeasible = 0
+    for tableau, basic_indices, state in _solved_states(dual, 103, 200):
+        variable = rng.randrange(basic_indices[0])
+        edited, basis = tableau, basic_indices
+
+        # Верхняя граница, затем более строгая – меняется правая часть той же строки
+        state.tighten_bound(variable, upper=3)
+        coefficients = [0] * (len(edited[0]) - 1)
+        coefficients[variable] = 1
+        edited, basis = _with_row(edited, basis, coefficients, 3)
+        _check(dual, state, edited, basis)
+        rows = len(state.tableau)
+        state.tighten_bound(variable, upper=1)
+        assert len(state.tableau) == rows
+        edited[-1][-1] = Fraction(1)
+        _check(dual, state, edited, basis)
+
+        # Нижняя граница выше верхней: задача становится недопустимой
+        state.tighten_bound(variable, lower=2)
+        coefficients = [0] * (len(edited[0]) - 1)
+        coefficients[variable] = -1
+        edited, basis = _with_row(edited, basis, coefficients, -2)
+        assert lp_optimum(dual, edited, basis) is None
+        try:
+            state.solve()
+        except dual.InfeasibleError:
+            infeasible += 1
+        else:
+            raise AssertionError("reoptimization missed the empty bound interval")
+    assert infeasible
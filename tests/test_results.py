@@ -0,0 +1,64 @@
+import io
+import os
+import subprocess
+import sys
+
+from acom.fraction import Fraction
+from acom.output import ChunkedWriter
+from tests.helpers import copy_rows, random_systems
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GaussJordanBasic", "main.py")
+
+
+def test_analyze_log_records_real_pivots(gauss):
+    result = gauss.EquationSolver(matrix=[[2, 4, 6], [1, 3, 5]], verbose=False).analyze()
+    assert result.log == [(0, 0, Fraction(2)), (1, 1, Fraction(1))]
+    assert result.to_dict()["log"] == [[0, 0, "2"], [1, 1, "1"]]
+
+
+def test_pivot_log_is_the_same_for_every_observable_method(gauss):
+    for matrix in random_systems(16, 200):
+        matrix = [[x / (i + 2) for x in row] for i, row in enumerate(matrix)]
+        logs = [gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False, **options)
+                .analyze(basic_solutions=False).log
+                for options in ({}, {"sparse": True}, {"bareiss": True})]
+        assert logs[0] == logs[1] == logs[2]
+        assert [col for _, col, _ in logs[0]] == list(gauss.find_pivot_columns(
+            gauss.EquationSolver(matrix=copy_rows(matrix), verbose=False).analyze(False).matrix))
+
+
+def test_pivot_log_is_none_when_pivots_are_not_observed(gauss):
+    solver = gauss.EquationSolver(matrix=[[1, 2, 3], [4, 5, 6]], verbose=False, modular=True)
+    assert solver.analyze(basic_solutions=False).log is None
+
+
+def test_on_pivot_callback_is_kept_by_analyze(gauss):
+    seen = []
+    solver = gauss.EquationSolver(matrix=[[0, 1, 1], [1, 1, 2]], verbose=False,
+                                  on_pivot=lambda *step: seen.append(step))
+    result = solver.analyze(basic_solutions=False)
+    assert seen == result.log == [(0, 0, Fraction(1)), (1, 1, Fraction(1))]
+
+
+def test_chunked_writer_flushes_in_chunks():
+    stream = io.StringIO()
+    writer = ChunkedWriter(stream, chunk_size=10)
+    writer.write("12345")
+    assert stream.getvalue() == ""
+    writer.write("67890")
+    assert stream.getvalue() == "1234567890"
+    writer.write("x")
+    writer.flush()
+    assert stream.getvalue() == "1234567890x"
+
+
+def test_enumeration_options_need_incremental_or_verbosity_0(tmp_path):
+    path = tmp_path / "system.txt"
+    path.write_text("1 1 1 0 2\n1 -1 0 1 0")
+    script = [sys.executable, SCRIPT, str(path), "--workers", "2", "--max-results", "1"]
+    rejected = subprocess.run(script, capture_output=True, text=True)
+    assert rejected.returncode == 2
+    assert "--max-results, --workers: only used with --incremental or --verbosity 0" in rejected.stderr
+    for extra in (["--verbosity", "0"], ["--incremental", "--verbosity", "1"]):
+        output = subprocess.run(script + extra, capture_output=True, text=True, check=True).stdout
+        assert output.count("Solution: (") == 1
@@ -0,0 +1,83 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "service", "server.py")
+
+LP = [[1, 2, 0, 0, 0], [-1, "-1/2", 1, 0, -3], [1, -1, 0, 1, 1]]
+
+
+def _serve(lines, *options):
+    """Запускает сервис на stdin/stdout и возвращает ответы (по одному словарю на строку)."""
+    result = subprocess.run([sys.executable, SERVER, "--workers", "1", *options],
+                            input="\n".join(lines) + "\n", capture_output=True, text=True, timeout=120,
+                            check=True)
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_protocol_errors():
+    requests = {
+        "unknown": {"id": "unknown", "type": "qp", "tableau": LP},
+        "no-matrix": {"id": "no-matrix", "type": "lp"},
+        "pricing": {"id": "pricing", "type": "lp", "tableau": LP, "pricing": "fastest"},
+        "ragged": {"id": "ragged", "type": "system", "matrix": "1 2 3\n4 5"},
+        "empty": {"id": "empty", "type": "system", "matrix": ""},
+        "number": {"id": "number", "type": "system", "matrix": "1 x 3"},
+        "file": {"id": "file", "type": "system", "file": "/nonexistent/system.txt"},
+    }
+    lines = ["{not json", "[1, 2]", ""] + [json.dumps(request) for request in requests.values()]
+    responses = _serve(lines)
+    invalid = [response["message"] for response in responses if response["id"] is None]
+    assert len(invalid) == 2
+    assert invalid[0].startswith("Invalid request: ")
+    assert invalid[1] == "Invalid request: request must be a JSON object"
+    errors = {response["id"]: response["message"] for response in responses if response["id"] is not None}
+    assert set(errors) == set(requests)
+    assert all(response["event"] == "error" for response in responses)
+    assert errors["unknown"] == "Unknown job type: 'qp' (expected 'lp' or 'system')."
+    assert errors["no-matrix"] == "Request needs 'tableau' or 'file'."
+    assert errors["pricing"] == "Unknown pricing rule: 'fastest'."
+    assert errors["ragged"] == errors["empty"] == "Matrix must be non-empty with rows of equal length."
+    assert errors["number"] == "Invalid number: 'x'"
+    assert "/nonexistent/system.txt" in errors["file"]
+
+
+def test_results_follow_their_progress(dual):
+    lines = [json.dumps({"id": 1, "type": "lp", "tableau": LP, "progress": True, "pricing": "bland"}),
+             json.dumps({"id": 2, "type": "system", "matrix": "1 2 3\n4 5 6", "progress": True})]
+    responses = _serve(lines)
+    for request_id in (1, 2):
+        events = [response for response in responses if response["id"] == request_id]
+        assert [event["event"] for event in events[:-1]] == ["progress"] * (len(events) - 1)
+        assert events[-1]["event"] == "result" and len(events) > 1
+    lp = next(response["result"] for response in responses if response["id"] == 1 and "result" in response)
+    expected = dual.solve_lp(dual.parse_matrix("\n".join(" ".join(map(str, row)) for row in LP)))
+    assert lp["status"] == "optimal" and lp["optimum"] == str(expected.optimum)
+
+
+def test_unix_socket(tmp_path):
+    path = str(tmp_path / "acom.sock")
+    server = subprocess.Popen([sys.executable, SERVER, "--workers", "1", "--socket", path],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        for _ in range(200):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(path)
+            client.sendall(b'not json\n{"id": 7, "type": "system", "matrix": "1 1 2\\n1 -1 0"}\n')
+            client.shutdown(socket.SHUT_WR)
+            data = b""
+            while chunk := client.recv(65536):
+                data += chunk
+        responses = [json.loads(line) for line in data.decode().splitlines()]
+        assert responses[0]["id"] is None and responses[0]["event"] == "error"
+        assert responses[1]["id"] == 7 and responses[1]["result"]["rank"] == 2
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    assert not os.path.exists(path)
@@ -0,0 +1,56 @@
+import random
+
+from acom.fraction import Fraction
+from acom.sparse import SparseMatrix
+from tests.helpers import copy_rows, random_systems
+
+
+def _dense_pivot(matrix, r, c):
+    pivot_row = [x / matrix[r][c] for x in matrix[r]]
+    matrix[r] = pivot_row
+    for i, row in enumerate(matrix):
+        if i != r and row[c]:
+            factor = row[c]
+            matrix[i] = [x - factor * y for x, y in zip(row, pivot_row)]
+
+
+def _check_index(sparse):
+    # Множества строк по столбцам согласованы со строками, нули не хранятся
+    for j in range(sparse.ncols):
+        assert sparse.column_rows(j) == {i for i, row in enumerate(sparse.rows) if j in row}
+    assert all(v for row in sparse.rows for v in row.values())
+
+
+def test_operations_match_dense_rows():
+    rng = random.Random(4)
+    for matrix in random_systems(4, 200):
+        dense = copy_rows(matrix)
+        sparse = SparseMatrix.from_dense(matrix)
+        for _ in range(6):
+            action = rng.choice(("pivot", "swap", "delete"))
+            i = rng.randrange(len(dense))
+            if action == "pivot":
+                c = next((c for c in range(len(dense[i])) if dense[i][c]), None)
+                if c is None:
+                    continue
+                _dense_pivot(dense, i, c)
+                sparse.pivot(i, c)
+            elif action == "swap":
+                k = rng.randrange(len(dense))
+                dense[i], dense[k] = dense[k], dense[i]
+                sparse.swap_rows(i, k)
+            elif len(dense) > 1:
+                del dense[i]
+                sparse.delete_row(i)
+            assert sparse.to_dense() == dense
+            _check_index(sparse)
+        assert sparse.nnz() == sum(1 for row in dense for x in row if x)
+
+
+def test_fill_in_counts_new_nonzeros():
+    one = Fraction(1)
+    sparse = SparseMatrix([{0: one, 1: one}, {0: one, 2: one}], 3)
+    sparse.pivot(0, 0)
+    assert sparse.fill_in == 1
+    assert sparse.rows[1] == {1: Fraction(-1), 2: one}
+    assert sparse.get(1, 0) == 0 and sparse.column_rows(0) == {0}
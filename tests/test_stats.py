@@ -0,0 +1,63 @@
+import threading
+
+from acom.fraction import Fraction
+from acom.stats import SolveStats, track_fractions
+
+
+def _make(count):
+    for i in range(count):
+        Fraction(i, 3)
+
+
+def test_nested_blocks_count_inner_fractions_for_both():
+    outer, inner = SolveStats(), SolveStats()
+    with track_fractions(outer):
+        _make(2)
+        with track_fractions(inner):
+            _make(3)
+            with track_fractions(outer):    # повторный блок с тем же stats не считает дважды
+                _make(1)
+        _make(1)
+    _make(5)
+    assert inner.fractions == 4
+    assert outer.fractions == 7
+    assert Fraction.__init__ is Fraction.__dict__["__init__"]
+
+
+def test_blocks_closed_out_of_order():
+    first, second = SolveStats(), SolveStats()
+    a, b = track_fractions(first), track_fractions(second)
+    a.__enter__()
+    b.__enter__()
+    _make(1)
+    a.__exit__(None, None, None)
+    _make(2)
+    b.__exit__(None, None, None)
+    _make(4)
+    assert (first.fractions, second.fractions) == (1, 3)
+
+
+def test_threads_do_not_mix_counters():
+    original_init, original_new = Fraction.__init__, Fraction.__dict__["_new"]
+    counts = [50, 120, 7, 300]
+    results = [None] * len(counts)
+    barrier = threading.Barrier(len(counts) + 1)
+
+    def work(index):
+        stats = SolveStats()
+        barrier.wait()
+        with track_fractions(stats):
+            for _ in range(counts[index]):
+                Fraction(1, 2) + Fraction(1, 3)     # три дроби: два операнда и сумма
+        results[index] = stats.fractions
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(len(counts))]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    _make(1000)                                     # поток без блока никому не добавляет
+    for thread in threads:
+        thread.join()
+    assert results == [3 * count for count in counts]
+    assert Fraction.__init__ is original_init
+    assert Fraction.__dict__["_new"] is original_new